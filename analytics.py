@@ -0,0 +1,487 @@
+"""
+Keystroke Analytics for ZenType
+Post-test analysis of keystroke logs: inter-key intervals, per-character and
+per-bigram latency, error positions, burst WPM, consistency and rolling WPM.
+Uses NumPy when it is installed and falls back to pure Python otherwise.
+"""
+
+import math
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+from clock import NS_PER_SECOND
+from engine import KeystrokeLog, TypingEngine, EVENT_BACKSPACE, EVENT_CORRECT, EVENT_INCORRECT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Default trailing window, in seconds, for burst WPM
+BURST_WINDOW = 3.0
+
+# Bigram keys pack two code points into one integer; code points fit in 21 bits
+_BIGRAM_SHIFT = 21
+_BIGRAM_MASK = (1 << _BIGRAM_SHIFT) - 1
+
+
+def has_numpy() -> bool:
+    """Return True if the vectorized NumPy path is in use."""
+    return np is not None
+
+
+def to_arrays(log: KeystrokeLog) -> Tuple:
+    """
+    Copy a keystroke log's columns out in one step.
+
+    Args:
+        log: Keystroke log
+
+    Returns:
+        Tuple of (timestamps, codes, chars): int64/uint8/uint32 NumPy arrays,
+        or lists without NumPy
+    """
+    if np is not None:
+        return (
+            np.array(log.timestamps, dtype=np.int64),
+            np.array(log.codes, dtype=np.uint8),
+            np.array(log.chars, dtype=np.uint32),
+        )
+    return log.timestamps.tolist(), log.codes.tolist(), log.chars.tolist()
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Linearly interpolated percentile of sorted values (NumPy's default method)."""
+    position = (len(sorted_values) - 1) * q / 100.0
+    low = math.floor(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def _interval_summary(intervals) -> Dict:
+    """Distribution summary of inter-key intervals in seconds."""
+    count = len(intervals)
+    if count == 0:
+        return {"count": 0, "mean": 0.0, "std": 0.0, "median": 0.0, "p10": 0.0, "p90": 0.0, "cv": 0.0}
+
+    if np is not None:
+        mean = float(intervals.mean())
+        std = float(intervals.std())
+        p10, median, p90 = (float(v) for v in np.percentile(intervals, (10, 50, 90)))
+    else:
+        mean = sum(intervals) / count
+        std = math.sqrt(sum((v - mean) ** 2 for v in intervals) / count)
+        ordered = sorted(intervals)
+        p10, median, p90 = (_percentile(ordered, q) for q in (10, 50, 90))
+
+    return {
+        "count": count,
+        "mean": mean,
+        "std": std,
+        "median": median,
+        "p10": p10,
+        "p90": p90,
+        "cv": std / mean if mean > 0 else 0.0,
+    }
+
+
+def _group_stats(keys, values) -> Dict[int, Dict]:
+    """
+    Count, mean and M2 (sum of squared deviations) of values grouped by integer key.
+
+    Returns:
+        Dictionary mapping key to {"count", "mean", "m2"}
+    """
+    if len(keys) == 0:
+        return {}
+
+    if np is not None:
+        unique, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse)
+        means = np.bincount(inverse, weights=values) / counts
+        m2 = np.bincount(inverse, weights=(values - means[inverse]) ** 2)
+        return {
+            int(key): {"count": int(count), "mean": float(mean), "m2": float(sq)}
+            for key, count, mean, sq in zip(unique, counts, means, m2)
+        }
+
+    # Welford's online update per key
+    stats = {}
+    for key, value in zip(keys, values):
+        entry = stats.get(key)
+        if entry is None:
+            entry = stats[key] = {"count": 0, "mean": 0.0, "m2": 0.0}
+        entry["count"] += 1
+        delta = value - entry["mean"]
+        entry["mean"] += delta / entry["count"]
+        entry["m2"] += delta * (value - entry["mean"])
+    return stats
+
+
+def _bigram(key: int) -> str:
+    """Unpack a bigram key into its two characters."""
+    return chr(key >> _BIGRAM_SHIFT) + chr(key & _BIGRAM_MASK)
+
+
+class _Columns:
+    """
+    Keystroke columns of one or more logs, concatenated, with the values every
+    metric needs derived once: interval before each key and latency samples.
+    """
+
+    def __init__(self, logs: List[KeystrokeLog]):
+        self.lengths = [len(log) for log in logs]
+        columns = [to_arrays(log) for log in logs]
+
+        if np is not None:
+            if columns:
+                self.timestamps, self.codes, self.chars = (
+                    np.concatenate([c[i] for c in columns]) for i in range(3)
+                )
+            else:
+                self.timestamps = np.zeros(0, dtype=np.int64)
+                self.codes = np.zeros(0, dtype=np.uint8)
+                self.chars = np.zeros(0, dtype=np.uint32)
+            self._derive_numpy()
+        else:
+            self.timestamps, self.codes, self.chars = [], [], []
+            for timestamps, codes, chars in columns:
+                self.timestamps += timestamps
+                self.codes += codes
+                self.chars += chars
+            self._derive_python()
+
+    def _derive_numpy(self) -> None:
+        """Vectorized derivation over all logs at once."""
+        count = len(self.codes)
+        lengths = np.asarray(self.lengths, dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        first = np.zeros(count, dtype=bool)
+        first[offsets[lengths > 0]] = True
+        has_previous = ~first
+
+        # Interval since the previous keystroke of the same test
+        delta = np.zeros(count)
+        if count:
+            delta[1:] = np.diff(self.timestamps) / NS_PER_SECOND
+        self.intervals = delta[has_previous]
+        self.offsets = offsets
+
+        correct = self.codes == EVENT_CORRECT
+        previous_correct = np.zeros(count, dtype=bool)
+        previous_correct[1:] = correct[:-1]
+        previous_chars = np.zeros(count, dtype=np.int64)
+        previous_chars[1:] = self.chars[:-1]
+
+        latency = correct & has_previous
+        self.char_keys = self.chars[latency].astype(np.int64)
+        self.char_latency = delta[latency]
+        bigram = latency & previous_correct
+        self.bigram_keys = (previous_chars[bigram] << _BIGRAM_SHIFT) | self.chars[bigram].astype(np.int64)
+        self.bigram_latency = delta[bigram]
+
+    def _derive_python(self) -> None:
+        """Single-pass derivation without NumPy."""
+        self.intervals = []
+        self.char_keys, self.char_latency = [], []
+        self.bigram_keys, self.bigram_latency = [], []
+        self.interval_slices = []
+
+        index = 0
+        for length in self.lengths:
+            start = len(self.intervals)
+            for i in range(index + 1, index + length):
+                delta = (self.timestamps[i] - self.timestamps[i - 1]) / NS_PER_SECOND
+                self.intervals.append(delta)
+                if self.codes[i] == EVENT_CORRECT:
+                    self.char_keys.append(self.chars[i])
+                    self.char_latency.append(delta)
+                    if self.codes[i - 1] == EVENT_CORRECT:
+                        self.bigram_keys.append((self.chars[i - 1] << _BIGRAM_SHIFT) | self.chars[i])
+                        self.bigram_latency.append(delta)
+            self.interval_slices.append((start, len(self.intervals)))
+            index += length
+
+    def char_stats(self) -> Dict[str, Dict]:
+        """Latency of each correctly typed character, keyed by character."""
+        return {chr(key): stats for key, stats in _group_stats(self.char_keys, self.char_latency).items()}
+
+    def bigram_stats(self) -> Dict[str, Dict]:
+        """Latency of each correct key following a correct key, keyed by bigram."""
+        return {_bigram(key): stats for key, stats in _group_stats(self.bigram_keys, self.bigram_latency).items()}
+
+
+def _correct_timestamps(timestamps, codes):
+    """Timestamps of correct keystrokes."""
+    if np is not None:
+        return timestamps[codes == EVENT_CORRECT]
+    return [t for t, code in zip(timestamps, codes) if code == EVENT_CORRECT]
+
+
+def _burst_wpm(timestamps, codes, elapsed_time: float, window: float) -> float:
+    """Highest WPM of correct keystrokes within any trailing window."""
+    correct = _correct_timestamps(timestamps, codes)
+    if len(correct) == 0:
+        return 0.0
+    window_ns = round(window * NS_PER_SECOND)
+
+    if np is not None:
+        in_window = np.arange(1, len(correct) + 1) - np.searchsorted(correct, correct - window_ns, side="right")
+        best = int(in_window.max())
+    else:
+        best = 0
+        low = 0
+        for i, t in enumerate(correct):
+            low = bisect_right(correct, t - window_ns, low, i)
+            best = max(best, i + 1 - low)
+
+    span = min(window, elapsed_time) if elapsed_time > 0 else window
+    return (best / 5.0) / (span / 60.0)
+
+
+def _error_counts(codes) -> Tuple[int, int]:
+    """Return (incorrect keystrokes, typed keystrokes excluding backspace)."""
+    if np is not None:
+        incorrect = int(np.count_nonzero(codes == EVENT_INCORRECT))
+        typed = int(np.count_nonzero(codes != EVENT_BACKSPACE))
+    else:
+        incorrect = sum(1 for code in codes if code == EVENT_INCORRECT)
+        typed = sum(1 for code in codes if code != EVENT_BACKSPACE)
+    return incorrect, typed
+
+
+def _error_positions(codes) -> List[int]:
+    """Text positions of incorrect keystrokes, found by replaying cursor movement."""
+    if np is not None:
+        steps = np.where(codes == EVENT_BACKSPACE, -1, 1)
+        positions = np.cumsum(steps) - 1
+        return positions[codes == EVENT_INCORRECT].tolist()
+
+    positions = []
+    cursor = 0
+    for code in codes:
+        if code == EVENT_BACKSPACE:
+            cursor -= 1
+        else:
+            if code == EVENT_INCORRECT:
+                positions.append(cursor)
+            cursor += 1
+    return positions
+
+
+def rolling_wpm(timestamps, codes, start_time: int, elapsed_time: float,
+                interval: float = 1.0, window: float = 5.0) -> List[float]:
+    """
+    WPM of correct keystrokes over a trailing window, sampled at each interval.
+    Matches TypingEngine.get_rolling_wpm_history.
+
+    Args:
+        timestamps: Keystroke timestamps in nanoseconds (from to_arrays)
+        codes: Keystroke event codes
+        start_time: Test start in the same clock as timestamps
+        elapsed_time: Test length in seconds
+        interval: Seconds between samples
+        window: Trailing window in seconds
+
+    Returns:
+        List of rolling WPM values, starting with 0 at t=0
+    """
+    sample_count = int(elapsed_time / interval) + 1
+
+    if np is not None:
+        times = np.arange(sample_count) * interval
+        correct_prefix = np.zeros(len(codes) + 1, dtype=np.int64)
+        correct_prefix[1:] = np.cumsum(codes == EVENT_CORRECT)
+        upper = np.searchsorted(timestamps, start_time + np.round(times * NS_PER_SECOND).astype(np.int64), side="right")
+        lower = np.where(
+            times > window,
+            np.searchsorted(timestamps, start_time + np.round((times - window) * NS_PER_SECOND).astype(np.int64),
+                            side="right"),
+            0,
+        )
+        span = np.minimum(window, times)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wpm = (correct_prefix[upper] - correct_prefix[lower]) / 5.0 / (span / 60.0)
+        wpm[0] = 0
+        return np.maximum(wpm, 0).tolist()
+
+    correct_prefix = [0]
+    for code in codes:
+        correct_prefix.append(correct_prefix[-1] + (code == EVENT_CORRECT))
+    history = []
+    for i in range(sample_count):
+        t = i * interval
+        if t == 0:
+            history.append(0)
+            continue
+        upper = bisect_right(timestamps, start_time + round(t * NS_PER_SECOND))
+        lower = bisect_right(timestamps, start_time + round((t - window) * NS_PER_SECOND), 0, upper) if t > window else 0
+        words = (correct_prefix[upper] - correct_prefix[lower]) / 5.0
+        history.append(max(0, words / (min(window, t) / 60.0)))
+    return history
+
+
+def analyze(log: KeystrokeLog, start_time: int = 0, elapsed_time: Optional[float] = None,
+            target_text: Optional[str] = None, interval: float = 1.0, window: float = 5.0,
+            burst_window: float = BURST_WINDOW) -> Dict:
+    """
+    Analyze one test's keystroke log.
+
+    Args:
+        log: Keystroke log (live, or decoded from test_events with start_time 0)
+        start_time: Test start in the log's clock
+        elapsed_time: Test length in seconds (default: time of the last keystroke)
+        target_text: Text of the test; enables per-character error counts
+        interval: Seconds between rolling WPM samples
+        window: Rolling WPM window in seconds
+        burst_window: Burst WPM window in seconds
+
+    Returns:
+        Dictionary with keystrokes, intervals, consistency, char_latency,
+        bigram_latency, error_positions, char_errors, error_rate, burst_wpm and rolling_wpm
+    """
+    columns = _Columns([log])
+    timestamps, codes = columns.timestamps, columns.codes
+    if elapsed_time is None:
+        elapsed_time = (int(timestamps[-1]) - start_time) / NS_PER_SECOND if len(timestamps) else 0.0
+
+    intervals = _interval_summary(columns.intervals)
+    incorrect, typed = _error_counts(codes)
+    error_positions = _error_positions(codes)
+
+    char_errors: Dict[str, int] = {}
+    if target_text is not None:
+        for position in error_positions:
+            if position < len(target_text):
+                char = target_text[position]
+                char_errors[char] = char_errors.get(char, 0) + 1
+
+    return {
+        "keystrokes": len(codes),
+        "intervals": intervals,
+        "consistency": intervals["cv"],
+        "char_latency": columns.char_stats(),
+        "bigram_latency": columns.bigram_stats(),
+        "error_positions": error_positions,
+        "char_errors": char_errors,
+        "error_rate": incorrect / typed if typed else 0.0,
+        "burst_wpm": _burst_wpm(timestamps, codes, elapsed_time, burst_window),
+        "rolling_wpm": rolling_wpm(timestamps, codes, start_time, elapsed_time, interval, window),
+    }
+
+
+def analyze_engine(engine: TypingEngine, **kwargs) -> Dict:
+    """
+    Analyze a finished engine's test, including per-character errors.
+
+    Args:
+        engine: Engine after finish_test()
+        **kwargs: interval, window and burst_window as for analyze()
+
+    Returns:
+        Dictionary as returned by analyze()
+    """
+    return analyze(
+        engine.keystrokes,
+        start_time=engine.start_time or 0,
+        elapsed_time=engine.get_elapsed_time(),
+        target_text=engine.target_text,
+        **kwargs,
+    )
+
+
+def _per_test_python(columns: _Columns, burst_window: float) -> List[Dict]:
+    """Per-test consistency, burst WPM and error rate, one test at a time."""
+    per_test = []
+    offset = 0
+    for length, (first, last) in zip(columns.lengths, columns.interval_slices):
+        timestamps = columns.timestamps[offset:offset + length]
+        codes = columns.codes[offset:offset + length]
+        elapsed_time = timestamps[-1] / NS_PER_SECOND if length else 0.0
+        incorrect, typed = _error_counts(codes)
+        per_test.append({
+            "keystrokes": length,
+            "consistency": _interval_summary(columns.intervals[first:last])["cv"],
+            "burst_wpm": _burst_wpm(timestamps, codes, elapsed_time, burst_window),
+            "error_rate": incorrect / typed if typed else 0.0,
+        })
+        offset += length
+    return per_test
+
+
+def _per_test_numpy(columns: _Columns, burst_window: float) -> List[Dict]:
+    """Per-test consistency, burst WPM and error rate for all tests at once."""
+    test_count = len(columns.lengths)
+    lengths = np.asarray(columns.lengths, dtype=np.int64)
+    if test_count == 0:
+        return []
+    test_ids = np.repeat(np.arange(test_count), lengths)
+    codes = columns.codes
+
+    typed = np.bincount(test_ids, weights=codes != EVENT_BACKSPACE, minlength=test_count)
+    incorrect = np.bincount(test_ids, weights=codes == EVENT_INCORRECT, minlength=test_count)
+
+    # Coefficient of variation of each test's intervals, as grouped mean and variance
+    interval_ids = np.repeat(np.arange(test_count), np.maximum(lengths - 1, 0))
+    interval_counts = np.bincount(interval_ids, minlength=test_count)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.bincount(interval_ids, weights=columns.intervals, minlength=test_count) / interval_counts
+        variances = np.bincount(
+            interval_ids, weights=(columns.intervals - means[interval_ids]) ** 2, minlength=test_count
+        ) / interval_counts
+        consistency = np.where(means > 0, np.sqrt(variances) / means, 0.0)
+
+    # Burst WPM: lay tests end to end on one time axis, far enough apart that a
+    # window never reaches into the previous test, and search all of them at once
+    window_ns = round(burst_window * NS_PER_SECOND)
+    relative = columns.timestamps - columns.timestamps[columns.offsets[test_ids]]
+    gap = int(relative.max()) + window_ns + 1 if len(relative) else 1
+    correct = codes == EVENT_CORRECT
+    correct_ids = test_ids[correct]
+    axis = relative[correct] + correct_ids * gap
+    in_window = np.arange(1, len(axis) + 1) - np.searchsorted(axis, axis - window_ns, side="right")
+    best = np.zeros(test_count, dtype=np.int64)
+    np.maximum.at(best, correct_ids, in_window)
+
+    last = np.maximum(columns.offsets + lengths - 1, 0)
+    elapsed = np.where(lengths > 0, columns.timestamps[last] / NS_PER_SECOND, 0.0) if len(codes) else np.zeros(test_count)
+    span = np.where(elapsed > 0, np.minimum(burst_window, elapsed), burst_window)
+    burst = (best / 5.0) / (span / 60.0)
+
+    return [
+        {
+            "keystrokes": int(lengths[i]),
+            "consistency": float(consistency[i]),
+            "burst_wpm": float(burst[i]),
+            "error_rate": float(incorrect[i] / typed[i]) if typed[i] else 0.0,
+        }
+        for i in range(test_count)
+    ]
+
+
+def analyze_batch(logs: Iterable[KeystrokeLog], burst_window: float = BURST_WINDOW) -> Dict:
+    """
+    Analyze many stored tests together, e.g. from DatabaseManager.iter_test_events().
+    Latency statistics are pooled across tests; consistency, burst WPM and error
+    rate are reported per test.
+
+    Args:
+        logs: Keystroke logs with timestamps relative to each test's start
+        burst_window: Burst WPM window in seconds
+
+    Returns:
+        Dictionary with tests, keystrokes, intervals, char_latency, bigram_latency
+        and per_test (list of {"keystrokes", "consistency", "burst_wpm", "error_rate"})
+    """
+    logs = list(logs)
+    columns = _Columns(logs)
+
+    per_test = _per_test_numpy(columns, burst_window) if np is not None else _per_test_python(columns, burst_window)
+
+    return {
+        "tests": len(logs),
+        "keystrokes": len(columns.codes),
+        "intervals": _interval_summary(columns.intervals),
+        "char_latency": columns.char_stats(),
+        "bigram_latency": columns.bigram_stats(),
+        "per_test": per_test,
+    }
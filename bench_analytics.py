@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark of keystroke analytics on one test and on a batch of stored tests.
+Times the NumPy path against the pure-Python fallback when NumPy is installed.
+
+Usage: python bench_analytics.py [--tests N] [--seed S]
+"""
+
+import argparse
+import sys
+import time
+import analytics
+from simulation import TypistModel, simulate_test
+from words import WordProvider
+
+
+def timed_ms(func, repeats: int = 1) -> float:
+    """Return the median milliseconds of several calls, after one warm-up call."""
+    func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Simulating {args.tests:,} 60s tests (seed {args.seed})...")
+    text = WordProvider.generate_text(400)
+    engines = [
+        simulate_test(text, 60, TypistModel(wpm=40 + (i % 80), error_rate=0.04, seed=args.seed + i))[0]
+        for i in range(args.tests)
+    ]
+    logs = [engine.keystrokes for engine in engines]
+    keystrokes = sum(len(log) for log in logs)
+
+    backends = [("pure Python", None)]
+    if analytics.has_numpy():
+        backends.insert(0, ("NumPy", analytics.np))
+
+    print("=" * 64)
+    print(f"Analytics over {args.tests:,} tests / {keystrokes:,} keystrokes")
+    print("=" * 64)
+    print(f"  {'backend':14} {'one test ms':>12} {'batch ms':>12} {'batch keys/s':>14}")
+    numpy_module = analytics.np
+    for name, module in backends:
+        analytics.np = module
+        single_ms = timed_ms(lambda: analytics.analyze_engine(engines[0]), repeats=21)
+        batch_ms = timed_ms(lambda: analytics.analyze_batch(logs))
+        print(f"  {name:14} {single_ms:12.2f} {batch_ms:12.1f} {keystrokes / (batch_ms / 1000):14,.0f}")
+    analytics.np = numpy_module
+    if not analytics.has_numpy():
+        print("  (NumPy not installed; only the fallback was timed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark of results chart redraws against the number of WPM samples.
+Compares the old delete-and-recreate drawing of ResultsScreen.draw_chart with LineChart.
+Uses a real tkinter.Canvas when a display is available, otherwise a call-counting stand-in.
+"""
+
+import math
+import sys
+import time
+import tkinter as tk
+from charts import LineChart
+
+WIDTH = 600
+HEIGHT = 200
+MARGIN = 40
+DURATION = 90.0
+
+
+class CountingCanvas:
+    """Stand-in for tkinter.Canvas that only counts calls and live items."""
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+
+    def _create(self, *args, **kwargs):
+        self.calls += 1
+        self.items += 1
+        return self.items
+
+    create_line = create_oval = create_text = _create
+
+    def delete(self, tag):
+        self.calls += 1
+        self.items = 0
+
+    def coords(self, item, *args):
+        self.calls += 1
+
+    def itemconfigure(self, item, **kwargs):
+        self.calls += 1
+
+
+def legacy_draw(canvas, wpm_history):
+    """The previous draw_chart: clear the canvas, then one line and one oval per sample."""
+    canvas.delete("all")
+    max_wpm = max(wpm_history)
+    max_time = len(wpm_history) - 1
+    canvas.create_line(MARGIN, HEIGHT - MARGIN, WIDTH - MARGIN, HEIGHT - MARGIN, fill="#646669", width=2)
+    canvas.create_line(MARGIN, MARGIN, MARGIN, HEIGHT - MARGIN, fill="#646669", width=2)
+    for i in range(0, max(max_time + 1, 2), max(1, int(max_time / 4))):
+        x = MARGIN + (i / max_time) * (WIDTH - 2 * MARGIN)
+        canvas.create_text(x, HEIGHT - MARGIN + 20, text=f"{i}s", fill="#646669")
+    for i in range(len(wpm_history) - 1):
+        x1 = MARGIN + (i / max_time) * (WIDTH - 2 * MARGIN)
+        y1 = HEIGHT - MARGIN - (wpm_history[i] / max_wpm) * (HEIGHT - 2 * MARGIN)
+        x2 = MARGIN + ((i + 1) / max_time) * (WIDTH - 2 * MARGIN)
+        y2 = HEIGHT - MARGIN - (wpm_history[i + 1] / max_wpm) * (HEIGHT - 2 * MARGIN)
+        canvas.create_line(x1, y1, x2, y2, fill="#E2B714", width=2)
+        canvas.create_oval(x1 - 3, y1 - 3, x1 + 3, y1 + 3, fill="#E2B714")
+
+
+def make_canvas(root):
+    """Create the canvas used for a run."""
+    if root is None:
+        return CountingCanvas()
+    return tk.Canvas(root, width=WIDTH, height=HEIGHT)
+
+
+def time_redraws(draw, repeats: int) -> float:
+    """Average milliseconds per redraw."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        draw()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench(root, interval: float, repeats: int):
+    """Return (samples, legacy_ms, legacy_items, chart_ms, chart_items, chart_points)."""
+    samples = int(DURATION / interval) + 1
+    wpm_history = [60 + 15 * math.sin(i * interval / 7) + 5 * math.sin(i * interval * 3) for i in range(samples)]
+
+    canvas = make_canvas(root)
+    legacy_ms = time_redraws(lambda: legacy_draw(canvas, wpm_history), repeats)
+    legacy_items = canvas.items if root is None else len(canvas.find_all())
+
+    canvas = make_canvas(root)
+    chart = LineChart(canvas, WIDTH, HEIGHT, MARGIN)
+    chart_ms = time_redraws(lambda: chart.plot(wpm_history, x_step=interval), repeats)
+    chart_items = canvas.items if root is None else len(canvas.find_all())
+
+    if root is not None:
+        # Include the time Tk takes to draw the items
+        root.update()
+    return samples, legacy_ms, legacy_items, chart_ms, chart_items, chart.points
+
+
+def main():
+    """Run the chart benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5, help="Redraws timed per row")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        backend = "tkinter.Canvas"
+    except tk.TclError:
+        root = None
+        backend = "counting stand-in, no display"
+
+    print("=" * 64)
+    print(f"Chart redraw cost for a {DURATION:.0f}s test ({backend})")
+    print("=" * 64)
+    print(f"{'interval':>8} {'samples':>8} {'old ms':>9} {'old items':>10} "
+          f"{'new ms':>8} {'new items':>10} {'points':>7}")
+    for interval in (1.0, 0.1, 0.01):
+        samples, legacy_ms, legacy_items, chart_ms, chart_items, points = bench(root, interval, args.repeats)
+        print(f"{interval:>8} {samples:>8} {legacy_ms:>9.2f} {legacy_items:>10} "
+              f"{chart_ms:>8.2f} {chart_items:>10} {points:>7}")
+    print("=" * 64)
+
+    if root is not None:
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark of memory-mapped corpora against loading a word list into Python strings.
+Times opening a large corpus and drawing test text from it, and measures the Python
+heap each approach holds afterwards.
+
+Usage: python bench_corpus.py [--words N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from bench_sampling import synthetic_vocabulary
+from corpus import Corpus, read_word_list, write_corpus
+
+TEST_WORDS = 60
+TESTS = 1000
+
+
+def measure(func):
+    """
+    Return (result, milliseconds, Python heap bytes still allocated) for one call.
+    Times include tracemalloc overhead, so compare them with each other only.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed_ms, held
+
+
+def open_corpus(path: Path) -> Corpus:
+    """Open a corpus and map it, as selecting it in the UI does."""
+    corpus = Corpus(path)
+    len(corpus)
+    return corpus
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = synthetic_vocabulary(args.words, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = Path(tmp) / "words.txt"
+        corpus_path = Path(tmp) / "words.ztc"
+        text_path.write_text("\n".join(words) + "\n", encoding="utf-8")
+        write_corpus(corpus_path, words)
+        del words
+
+        word_list, list_ms, list_bytes = measure(lambda: read_word_list(text_path)[0])
+        corpus, open_ms, corpus_bytes = measure(lambda: open_corpus(corpus_path))
+
+        start = time.perf_counter()
+        for _ in range(TESTS):
+            " ".join(rng.choices(word_list, k=TEST_WORDS))
+        list_draw_us = (time.perf_counter() - start) * 1e6 / (TESTS * TEST_WORDS)
+        start = time.perf_counter()
+        for _ in range(TESTS):
+            " ".join(rng.choices(corpus, k=TEST_WORDS))
+        corpus_draw_us = (time.perf_counter() - start) * 1e6 / (TESTS * TEST_WORDS)
+
+        print("=" * 64)
+        print(f"Corpus of {len(corpus):,} words ({corpus_path.stat().st_size / 1e6:.1f} MB on disk)")
+        print("=" * 64)
+        print(f"  {'':22} {'open':>10} {'heap':>12} {'draw':>12}")
+        print(f"  {'Text file -> list':22} {list_ms:8.1f}ms {list_bytes / 1e6:10.1f}MB "
+              f"{list_draw_us:9.3f}µs")
+        print(f"  {'Memory-mapped corpus':22} {open_ms:8.3f}ms {corpus_bytes / 1e6:10.3f}MB "
+              f"{corpus_draw_us:9.3f}µs")
+        print("=" * 64)
+        corpus.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark of DataManager.add_result latency with a large stored history.
+Compares the legacy JSON array file (rewritten on every add) with JSON Lines appends.
+
+Usage: python bench_data_manager.py [--results N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from data_manager import DataManager, STORAGE_JSON, STORAGE_JSONL
+
+LEGACY_ADDS = 3
+JSONL_ADDS = 200
+
+
+def make_result(i: int) -> dict:
+    """Build a test result dictionary."""
+    return {
+        "wpm": 40 + i % 60,
+        "accuracy": 90 + i % 10,
+        "duration": (30, 60, 90)[i % 3],
+        "elapsed_time": 30.0,
+        "correct_chars": 200,
+        "total_chars_typed": 210,
+        "total_chars_in_test": 300,
+        "char_index": 200,
+        "timestamp": f"2024-01-01T00:00:00.{i:06d}",
+    }
+
+
+def mean_add_ms(storage_format: str, stored: int, adds: int) -> float:
+    """Return mean add_result milliseconds with `stored` results already saved."""
+    with tempfile.TemporaryDirectory() as tmp:
+        dm = DataManager(data_dir=tmp, storage_format=storage_format)
+        dm.save_results([make_result(i) for i in range(stored)])
+        start = time.perf_counter()
+        for i in range(adds):
+            dm.add_result(make_result(stored + i))
+        return (time.perf_counter() - start) / adds * 1000
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"add_result latency with {args.results:,} stored results")
+    print("=" * 60)
+    legacy_ms = mean_add_ms(STORAGE_JSON, args.results, LEGACY_ADDS)
+    print(f"  Legacy JSON array:  {legacy_ms:10.2f} ms")
+    jsonl_ms = mean_add_ms(STORAGE_JSONL, args.results, JSONL_ADDS)
+    print(f"  JSON Lines append:  {jsonl_ms:10.2f} ms (includes fsync)")
+    print(f"  Speedup:            {legacy_ms / jsonl_ms:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark of database open + query latency.
+Compares the previous per-screen construction (new connection and CREATE TABLE every time)
+with DatabaseManager on the shared connection pool.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from database import DatabaseManager, close_all_pools
+
+ITERATIONS = 500
+SEED_ROWS = 2_000
+
+
+def seed(db_path: str) -> None:
+    """Fill the database with results so the statistics query does real work."""
+    db = DatabaseManager(db_path)
+    for i in range(SEED_ROWS):
+        db.add_result({
+            "timestamp": f"2024-01-01T00:00:{i % 60:02d}.{i:06d}",
+            "wpm": 40 + i % 60,
+            "accuracy": 90 + i % 10,
+            "duration": (30, 60, 90)[i % 3],
+            "total_chars_typed": 200,
+        })
+
+
+def legacy_open_and_query(db_path: str, query: bool = True) -> None:
+    """What HistoryScreen used to do: connect, create schema, query, close."""
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    cursor = connection.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS typing_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            wpm REAL NOT NULL,
+            accuracy REAL NOT NULL,
+            duration INTEGER NOT NULL,
+            elapsed_time REAL,
+            correct_chars INTEGER,
+            total_chars_typed INTEGER,
+            total_chars_in_test INTEGER,
+            char_index INTEGER
+        )
+    """)
+    connection.commit()
+    if query:
+        cursor.execute("SELECT COUNT(*), MAX(wpm), AVG(wpm) FROM typing_results").fetchone()
+        cursor.execute("SELECT * FROM typing_results ORDER BY timestamp DESC LIMIT 10").fetchall()
+    connection.close()
+
+
+def pooled_open_and_query(db_path: str, query: bool = True) -> None:
+    """DatabaseManager on the shared pool."""
+    db = DatabaseManager(db_path)
+    if query:
+        db.get_statistics()
+        db.get_recent_results(10)
+
+
+def timed(func, db_path: str, query: bool) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(db_path, query)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        seed(db_path)
+
+        rows = []
+        for label, query in (("Open only", False), ("Open + stats + recent", True)):
+            legacy_us = timed(legacy_open_and_query, db_path, query)
+            pooled_us = timed(pooled_open_and_query, db_path, query)
+            rows.append((label, legacy_us, pooled_us))
+        close_all_pools()
+
+    print("=" * 66)
+    print(f"DatabaseManager construction latency ({SEED_ROWS:,} rows)")
+    print("=" * 66)
+    print(f"  {'':24} {'per-screen us':>14} {'shared pool us':>15} {'speedup':>8}")
+    for label, legacy_us, pooled_us in rows:
+        print(f"  {label:24} {legacy_us:14.1f} {pooled_us:15.1f} {legacy_us / pooled_us:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Headless throughput benchmark of TypingEngine driven by the simulated typist.
+Reports keystrokes/sec, memory growth per keystroke, and the cost of
+get_test_results and get_wpm_history as the text grows.
+
+Usage: python bench_engine.py [--wpm W] [--error-rate E] [--seed S]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from clock import FakeClock
+from engine import TypingEngine
+from simulation import TypistModel, run_script
+from words import WordProvider
+
+TEXT_SIZES = (1_000, 10_000, 100_000)
+REPEATS = 20
+
+# Long enough that no run hits the time limit
+UNLIMITED_SECONDS = 10 ** 9
+
+
+def timed_ms(func) -> float:
+    """Return the median milliseconds of several calls."""
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def build_text(size: int) -> str:
+    """Generate at least `size` characters of words, trimmed to size."""
+    text = WordProvider.generate_text(size // 4)
+    while len(text) < size:
+        text += " " + WordProvider.generate_text(size // 4)
+    return text[:size]
+
+
+def run(size: int, args) -> dict:
+    """Type a text of the given size to the end and measure the engine."""
+    text = build_text(size)
+    model = TypistModel(wpm=args.wpm, error_rate=args.error_rate, seed=args.seed)
+    # Materialize the script so its generation isn't timed
+    script = list(model.keystrokes(text))
+
+    # Throughput, without tracemalloc overhead
+    clock = FakeClock()
+    engine = TypingEngine(text, UNLIMITED_SECONDS, clock=clock)
+    start = time.perf_counter()
+    fed = run_script(engine, clock, script, stop_at_time_limit=False)
+    run_s = time.perf_counter() - start
+
+    # Memory growth on a fresh engine
+    clock = FakeClock()
+    traced = TypingEngine(text, UNLIMITED_SECONDS, clock=clock)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    run_script(traced, clock, script, stop_at_time_limit=False)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    engine.finish_test()
+    return {
+        "size": size,
+        "keys": fed,
+        "keys_per_s": fed / run_s,
+        "bytes_per_key": (after - before) / max(fed, 1),
+        "results_ms": timed_ms(engine.get_test_results),
+        "history_ms": timed_ms(engine.get_wpm_history),
+        "seconds": engine.get_elapsed_time(),
+    }
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--wpm", type=float, default=80.0)
+    parser.add_argument("--error-rate", type=float, default=0.04)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"TypingEngine under a simulated {args.wpm:.0f} WPM typist "
+          f"(error rate {args.error_rate:.0%}, seed {args.seed})")
+    print("=" * 78)
+    print(f"{'chars':>8} {'keys':>8} {'sim s':>8} {'keys/s':>11} {'B/key':>7} "
+          f"{'results ms':>11} {'history ms':>11}")
+    for size in TEXT_SIZES:
+        row = run(size, args)
+        print(f"{row['size']:>8} {row['keys']:>8} {row['seconds']:>8.0f} {row['keys_per_s']:>11,.0f} "
+              f"{row['bytes_per_key']:>7.1f} {row['results_ms']:>11.4f} {row['history_ms']:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
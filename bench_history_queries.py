@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Seeded benchmark of recent-history queries on a large typing_results table.
+Builds a legacy (unindexed) database, times the old queries, migrates it with
+DatabaseManager and times the indexed queries, then compares deep OFFSET paging
+with the keyset pages and scrolling of the virtualized history list.
+
+Usage: python bench_history_queries.py [--rows N] [--seed S]
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from database import DatabaseManager, HISTORY_PAGE_SIZE, close_all_pools
+from history import ResultWindow
+
+REPEATS = 20
+
+
+def seed_legacy_database(db_path: str, rows: int, seed: int) -> None:
+    """Create the original unindexed schema and fill it with random results."""
+    rng = random.Random(seed)
+    connection = sqlite3.connect(db_path)
+    connection.execute("""
+        CREATE TABLE typing_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            wpm REAL NOT NULL,
+            accuracy REAL NOT NULL,
+            duration INTEGER NOT NULL,
+            elapsed_time REAL,
+            correct_chars INTEGER,
+            total_chars_typed INTEGER,
+            total_chars_in_test INTEGER,
+            char_index INTEGER
+        )
+    """)
+    start = datetime(2020, 1, 1)
+
+    def generate():
+        for _ in range(rows):
+            duration = rng.choice((30, 60, 90))
+            wpm = rng.uniform(20, 140)
+            timestamp = start + timedelta(seconds=rng.uniform(0, 5 * 365 * 86400))
+            yield (
+                timestamp.isoformat(), wpm, rng.uniform(80, 100), duration, float(duration),
+                int(wpm * duration / 12), int(wpm * duration / 11), 400, int(wpm * duration / 12),
+            )
+
+    connection.executemany("""
+        INSERT INTO typing_results
+        (timestamp, wpm, accuracy, duration, elapsed_time, correct_chars,
+         total_chars_typed, total_chars_in_test, char_index)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, generate())
+    connection.commit()
+    connection.close()
+
+
+def timed_ms(func) -> float:
+    """Return the median milliseconds of several calls."""
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        print(f"Seeding {args.rows:,} rows (seed {args.seed})...")
+        seed_legacy_database(db_path, args.rows, args.seed)
+
+        legacy = sqlite3.connect(db_path)
+        legacy_recent = timed_ms(lambda: legacy.execute(
+            "SELECT * FROM typing_results ORDER BY timestamp DESC LIMIT 10"
+        ).fetchall())
+        legacy_duration = timed_ms(lambda: legacy.execute(
+            "SELECT * FROM typing_results WHERE duration = ? ORDER BY timestamp DESC LIMIT 10", (60,)
+        ).fetchall())
+        legacy_stats = timed_ms(lambda: legacy.execute(
+            "SELECT COUNT(*), MAX(wpm), AVG(wpm), AVG(accuracy), SUM(total_chars_typed) "
+            "FROM typing_results"
+        ).fetchone())
+        legacy.close()
+
+        start = time.perf_counter()
+        db = DatabaseManager(db_path)
+        migrate_s = time.perf_counter() - start
+
+        indexed_recent = timed_ms(lambda: db.get_recent_results(10))
+        summary_stats = timed_ms(db.get_statistics)
+        with db.pool.connection() as connection:
+            indexed_duration = timed_ms(lambda: connection.execute(
+                "SELECT * FROM typing_results WHERE duration = ? "
+                "ORDER BY timestamp_ms DESC, id DESC LIMIT 10", (60,)
+            ).fetchall())
+            depth = args.rows // 2
+            offset_page = timed_ms(lambda: connection.execute(
+                "SELECT * FROM typing_results ORDER BY timestamp_ms DESC, id DESC LIMIT ? OFFSET ?",
+                (HISTORY_PAGE_SIZE, depth),
+            ).fetchall())
+            key = connection.execute(
+                "SELECT timestamp_ms, id FROM typing_results ORDER BY timestamp_ms DESC, id DESC "
+                "LIMIT 1 OFFSET ?", (depth,)
+            ).fetchone()
+        keyset_page = timed_ms(lambda: db.get_results_page(before=tuple(key)))
+
+        window = ResultWindow(db, visible_rows=10)
+        open_ms = timed_ms(window.set_filters)
+        jump_ms = timed_ms(lambda: window.jump_to(0.5))
+        start = time.perf_counter()
+        steps = 2000
+        for _ in range(steps):
+            window.scroll(3)
+        scroll_us = (time.perf_counter() - start) * 1e6 / steps
+        close_all_pools()
+
+    print("=" * 64)
+    print(f"Recent-history queries at {args.rows:,} rows (median of {REPEATS})")
+    print("=" * 64)
+    print(f"  Migrations (backfill, indexes, summary): {migrate_s:6.2f} s (one-off)")
+    print(f"  {'':28} {'legacy ms':>12} {'indexed ms':>12}")
+    print(f"  {'Recent 10':28} {legacy_recent:12.3f} {indexed_recent:12.3f}")
+    print(f"  {'Recent 10 for 60s tests':28} {legacy_duration:12.3f} {indexed_duration:12.3f}")
+    print(f"  {'Statistics (stats_summary)':28} {legacy_stats:12.3f} {summary_stats:12.3f}")
+    print(f"  {'Page at row ' + format(depth, ','):28} {offset_page:12.3f} {keyset_page:12.3f}  (OFFSET vs keyset)")
+    print(f"  History list: open {open_ms:.2f} ms, jump {jump_ms:.2f} ms, "
+          f"scroll {scroll_us:.0f} µs per 3-row step")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
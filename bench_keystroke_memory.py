@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark of keystroke log memory per 10k keystrokes.
+Compares the previous list of (char, is_correct, timestamp) tuples with KeystrokeLog.
+"""
+
+import sys
+import time
+import tracemalloc
+from engine import KeystrokeLog, EVENT_CORRECT, EVENT_INCORRECT, EVENT_BACKSPACE
+from words import WordProvider
+
+KEYSTROKES = 10_000
+
+
+def keystroke_stream(count: int):
+    """Yield (char, is_correct) pairs with occasional errors and backspaces."""
+    text = WordProvider.generate_text(count // 3)
+    for i in range(count):
+        if i % 37 == 0:
+            yield "BACKSPACE", False
+        else:
+            yield text[i % len(text)], i % 11 != 0
+
+
+def measure(build) -> int:
+    """Return bytes still allocated by the structure build() returns."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    log = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del log
+    return after - before
+
+
+def build_tuple_log():
+    """The previous representation: one tuple per keystroke."""
+    keystrokes = []
+    for char, is_correct in keystroke_stream(KEYSTROKES):
+        keystrokes.append((char, is_correct, time.time()))
+    return keystrokes
+
+
+def build_columnar_log():
+    """The columnar KeystrokeLog."""
+    log = KeystrokeLog()
+    for char, is_correct in keystroke_stream(KEYSTROKES):
+        if char == "BACKSPACE":
+            log.append(EVENT_BACKSPACE, "", time.perf_counter_ns())
+        else:
+            log.append(EVENT_CORRECT if is_correct else EVENT_INCORRECT, char, time.perf_counter_ns())
+    return log
+
+
+def main():
+    """Run the memory benchmark."""
+    tuple_bytes = measure(build_tuple_log)
+    columnar_bytes = measure(build_columnar_log)
+
+    print("=" * 60)
+    print(f"Keystroke log memory per {KEYSTROKES:,} keystrokes")
+    print("=" * 60)
+    print(f"  List of tuples: {tuple_bytes / 1024:8.1f} KiB ({tuple_bytes / KEYSTROKES:.1f} B/key)")
+    print(f"  KeystrokeLog:   {columnar_bytes / 1024:8.1f} KiB ({columnar_bytes / KEYSTROKES:.1f} B/key)")
+    print(f"  Reduction:      {tuple_bytes / max(columnar_bytes, 1):8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark of per-keystroke render cost against text length.
+Compares the old full re-tag of TypingDisplay.update_colors with the incremental TagRenderer.
+Uses a real tkinter.Text when a display is available, otherwise a call-counting stand-in.
+"""
+
+import sys
+import time
+import tkinter as tk
+from renderer import TagRenderer
+from words import WordProvider
+
+
+class CountingTextWidget:
+    """Stand-in for tkinter.Text that only counts tag calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def tag_add(self, tag, start, end):
+        self.calls += 1
+
+    def tag_remove(self, tag, start, end):
+        self.calls += 1
+
+
+class CountingProxy:
+    """Wraps a real tkinter.Text and counts tag calls."""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.calls = 0
+
+    def tag_add(self, tag, start, end):
+        self.calls += 1
+        self.widget.tag_add(tag, start, end)
+
+    def tag_remove(self, tag, start, end):
+        self.calls += 1
+        self.widget.tag_remove(tag, start, end)
+
+
+def full_render(widget, target_text: str, input_text: str, char_index: int):
+    """The previous update_colors: strip every tag, then tag each character."""
+    for tag in ["unwritten", "correct", "error", "cursor"]:
+        widget.tag_remove(tag, "1.0", "end")
+
+    for i, char in enumerate(target_text):
+        pos_start = f"1.0+{i}c"
+        pos_end = f"1.0+{i+1}c"
+        if i >= char_index:
+            widget.tag_add("unwritten", pos_start, pos_end)
+        elif i < len(input_text):
+            if target_text[i] == input_text[i]:
+                widget.tag_add("correct", pos_start, pos_end)
+            else:
+                widget.tag_add("error", pos_start, pos_end)
+        else:
+            widget.tag_add("unwritten", pos_start, pos_end)
+
+
+def make_widget(root, text: str):
+    """Create the widget used for a run."""
+    if root is None:
+        return CountingTextWidget()
+    text_widget = tk.Text(root)
+    text_widget.insert("1.0", text)
+    return CountingProxy(text_widget)
+
+
+def bench(root, text_length: int, keystrokes: int):
+    """Return (full_us, full_calls, incremental_us, incremental_calls) per keystroke."""
+    text = WordProvider.generate_text(text_length // 4)[:text_length]
+    keystrokes = min(keystrokes, len(text))
+
+    widget = make_widget(root, text)
+    start = time.perf_counter()
+    for i in range(1, keystrokes + 1):
+        full_render(widget, text, text[:i], i)
+    full_us = (time.perf_counter() - start) / keystrokes * 1e6
+    full_calls = widget.calls / keystrokes
+
+    widget = make_widget(root, text)
+    renderer = TagRenderer(widget)
+    renderer.reset(len(text))
+    widget.calls = 0
+    start = time.perf_counter()
+    for i in range(1, keystrokes + 1):
+        renderer.render(i, lambda j: "correct")
+    inc_us = (time.perf_counter() - start) / keystrokes * 1e6
+    inc_calls = widget.calls / keystrokes
+
+    return full_us, full_calls, inc_us, inc_calls
+
+
+def main():
+    """Run the render benchmark."""
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        backend = "tkinter.Text"
+    except tk.TclError:
+        root = None
+        backend = "counting stand-in, no display"
+
+    print("=" * 70)
+    print(f"Per-keystroke render cost ({backend})")
+    print("=" * 70)
+    print(f"{'chars':>8} {'full us':>12} {'full calls':>12} {'incr us':>10} {'incr calls':>12}")
+
+    for text_length in (250, 1000, 4000, 16000):
+        full_us, full_calls, inc_us, inc_calls = bench(root, text_length, keystrokes=200)
+        print(f"{text_length:>8} {full_us:>12.1f} {full_calls:>12.0f} {inc_us:>10.1f} {inc_calls:>12.0f}")
+
+    if root is not None:
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark of adaptive word sampling on a large synthetic vocabulary.
+Times index construction, a weight refresh after a test, and per-word draws
+against uniform random.choices, plus frequency (alias table) draws with filters.
+
+Usage: python bench_sampling.py [--words N] [--seed S]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from sampling import AliasWordSampler, BigramIndex, WeightedWordSampler, zipf_weights
+
+DRAWS = 100_000
+
+
+def synthetic_vocabulary(count: int, rng: random.Random) -> list:
+    """Random lowercase words of 2-12 letters, biased toward common letters."""
+    letters = string.ascii_lowercase
+    weights = [8, 2, 3, 4, 12, 2, 2, 6, 7, 1, 1, 4, 3, 7, 8, 2, 1, 6, 6, 9, 3, 1, 2, 1, 2, 1]
+    return ["".join(rng.choices(letters, weights, k=rng.randint(2, 12))) for _ in range(count)]
+
+
+def synthetic_difficulty(index: BigramIndex, rng: random.Random, share: float) -> dict:
+    """Give a random share of bigrams a random difficulty, as one test's stats would."""
+    bigrams = list(index.bigram_ids)
+    return {bigram: rng.uniform(0.1, 3.0) for bigram in rng.sample(bigrams, int(len(bigrams) * share))}
+
+
+def timed_ms(func) -> float:
+    """Return milliseconds taken by one call."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = synthetic_vocabulary(args.words, rng)
+
+    start = time.perf_counter()
+    index = BigramIndex(words)
+    build_ms = (time.perf_counter() - start) * 1000
+    sampler = WeightedWordSampler(index)
+
+    first_refresh = timed_ms(lambda: sampler.set_bigram_weights(synthetic_difficulty(index, rng, 0.3)))
+    next_refresh = timed_ms(lambda: sampler.set_bigram_weights(
+        {**dict(zip(index.bigram_ids, sampler.bigram_weights)), **synthetic_difficulty(index, rng, 0.05)}
+    ))
+    uniform_us = timed_ms(lambda: rng.choices(words, k=DRAWS)) * 1000 / DRAWS
+    weighted_us = timed_ms(lambda: sampler.sample(DRAWS, rng)) * 1000 / DRAWS
+
+    frequency = AliasWordSampler(words, zipf_weights(len(words)))
+    alias_build = timed_ms(lambda: frequency.sample(1, rng))
+    filtered_build = timed_ms(lambda: frequency.sample(1, rng, max_length=4, required_chars="qxz"))
+    alias_us = timed_ms(lambda: frequency.sample(DRAWS, rng)) * 1000 / DRAWS
+    no_repeat_us = timed_ms(lambda: frequency.sample(DRAWS, rng, no_repeats=True)) * 1000 / DRAWS
+    filtered_us = timed_ms(lambda: frequency.sample(
+        DRAWS, rng, max_length=4, required_chars="qxz", no_repeats=True
+    )) * 1000 / DRAWS
+
+    print("=" * 64)
+    print(f"Adaptive sampling over {args.words:,} words / {index.bigram_count:,} bigrams")
+    print("=" * 64)
+    print(f"  Build bigram index:               {build_ms:10.1f} ms (once)")
+    print(f"  Refresh, 30% of bigrams changed:  {first_refresh:10.1f} ms")
+    print(f"  Refresh, 5% of bigrams changed:   {next_refresh:10.1f} ms")
+    print(f"  Uniform draw:                     {uniform_us:10.3f} µs/word")
+    print(f"  Weighted draw (bisect):           {weighted_us:10.3f} µs/word")
+    print(f"  Build Zipf alias table:           {alias_build:10.1f} ms (once)")
+    print(f"  Build filtered table:             {filtered_build:10.1f} ms (once per filter)")
+    print(f"  Frequency draw (alias):           {alias_us:10.3f} µs/word")
+    print(f"  Frequency draw, no repeats:       {no_repeat_us:10.3f} µs/word")
+    print(f"  Filtered draw (len<=4, q/x/z):    {filtered_us:10.3f} µs/word")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
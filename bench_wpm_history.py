@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark of TypingEngine.get_wpm_history across interval sizes and keystroke counts.
+Compares the previous per-bucket rescan with the prefix-sum implementation.
+"""
+
+import sys
+import time
+from clock import NS_PER_SECOND
+from engine import TypingEngine, EVENT_CORRECT, EVENT_INCORRECT
+
+DURATION = 90.0
+
+# Skip the rescan when it would take too long to be worth waiting for
+LEGACY_WORK_LIMIT = 20_000_000
+
+
+def build_engine(keystroke_count: int) -> TypingEngine:
+    """Create a finished engine with keystrokes spread evenly over the test."""
+    engine = TypingEngine("x" * keystroke_count, int(DURATION))
+    engine.start_time = 0
+    engine.end_time = round(DURATION * NS_PER_SECOND)
+    step = engine.end_time // keystroke_count
+    for i in range(keystroke_count):
+        code = EVENT_INCORRECT if i % 13 == 0 else EVENT_CORRECT
+        engine.keystrokes.append(code, "x", (i + 1) * step)
+    return engine
+
+
+def legacy_wpm_history(engine: TypingEngine, interval: float):
+    """The previous implementation: rescan every keystroke for every bucket."""
+    wpm_history = []
+    elapsed = engine.get_elapsed_time()
+    timestamps = list(engine.keystrokes.timestamps)
+    codes = list(engine.keystrokes.codes)
+    for t in [i * interval for i in range(int(elapsed / interval) + 1)]:
+        if t == 0:
+            wpm_history.append(0)
+        else:
+            correct_at_time = sum(
+                1 for code, ts in zip(codes, timestamps)
+                if (ts - engine.start_time) / NS_PER_SECOND <= t and code == EVENT_CORRECT
+            )
+            wpm_history.append(max(0, (correct_at_time / 5.0) / (t / 60.0)))
+    return wpm_history
+
+
+def timed(func, *args) -> float:
+    """Return milliseconds taken by one call."""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the sweep."""
+    print("=" * 72)
+    print(f"get_wpm_history over a {DURATION:.0f}s test")
+    print("=" * 72)
+    print(f"{'keys':>8} {'interval':>9} {'points':>7} {'rescan ms':>11} {'prefix ms':>11} "
+          f"{'raw/net/roll ms':>16}")
+
+    for keystroke_count in (500, 5_000, 50_000):
+        engine = build_engine(keystroke_count)
+        for interval in (1.0, 0.1, 0.01):
+            points = int(DURATION / interval) + 1
+            if points * keystroke_count <= LEGACY_WORK_LIMIT:
+                legacy_ms = f"{timed(legacy_wpm_history, engine, interval):11.2f}"
+            else:
+                legacy_ms = f"{'skipped':>11}"
+            prefix_ms = timed(engine.get_wpm_history, interval)
+            extra_ms = (
+                timed(engine.get_raw_wpm_history, interval)
+                + timed(engine.get_net_wpm_history, interval)
+                + timed(engine.get_rolling_wpm_history, interval)
+            )
+            print(f"{keystroke_count:>8} {interval:>9} {points:>7} {legacy_ms} {prefix_ms:>11.2f} "
+                  f"{extra_ms:>16.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Line Charts for ZenType
+Draws a series on a canvas as one polyline whose items are created once and moved
+with coords() on redraw. Long series are thinned to the plot's pixel width with
+Largest-Triangle-Three-Buckets (LTTB) downsampling first.
+"""
+
+from typing import List, Sequence
+
+
+def lttb(values: Sequence[float], threshold: int) -> List[int]:
+    """
+    Choose the points of an evenly spaced series that best keep its shape.
+    The first and last points are always kept. The points between are split into
+    threshold - 2 buckets, and each bucket keeps the point that forms the largest
+    triangle with the point kept before it and the average of the next bucket.
+
+    Args:
+        values: Y values at x = 0, 1, 2, ...
+        threshold: Number of points to keep
+
+    Returns:
+        Increasing indices into values
+    """
+    count = len(values)
+    if threshold >= count:
+        return list(range(count))
+    if threshold <= 2:
+        return [0, count - 1][:max(threshold, 0)]
+
+    bucket_size = (count - 2) / (threshold - 2)
+    indices = [0]
+    kept = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_x = (end + next_end - 1) / 2
+        next_y = sum(values[end:next_end]) / (next_end - end)
+
+        kept_y = values[kept]
+        best_area = -1.0
+        for i in range(start, end):
+            # Twice the triangle area; only comparisons matter
+            area = abs((kept - next_x) * (values[i] - kept_y) - (kept - i) * (next_y - kept_y))
+            if area > best_area:
+                best_area = area
+                kept = i
+        indices.append(kept)
+    indices.append(count - 1)
+    return indices
+
+
+class LineChart:
+    """
+    Line chart on a tkinter.Canvas-like widget.
+    Axes, the line and the x-axis labels are canvas items created once; plot() only
+    moves them, so a redraw costs the same few canvas calls whatever the series length.
+    """
+
+    def __init__(self, canvas, width: int, height: int, margin: int = 40,
+                 color: str = "#E2B714", axis_color: str = "#646669", x_labels: int = 5,
+                 font=("JetBrains Mono", 10), axes: bool = True):
+        """
+        Initialize chart and create its canvas items.
+
+        Args:
+            canvas: Widget exposing create_line, create_text, coords and itemconfigure
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            margin: Space around the plot area for axes and labels
+            color: Line color
+            axis_color: Axis and label color
+            x_labels: Number of x-axis labels
+            font: Label font
+            axes: Draw the axes; a sparkline is just the line (with x_labels=0)
+        """
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.points = 0
+
+        bottom = height - margin
+        if axes:
+            canvas.create_line(margin, bottom, width - margin, bottom, fill=axis_color, width=2)
+            canvas.create_line(margin, margin, margin, bottom, fill=axis_color, width=2)
+        self.line = canvas.create_line(0, 0, 0, 0, fill=color, width=2, state="hidden")
+        self.labels = [
+            canvas.create_text(0, 0, text="", fill=axis_color, font=font) for _ in range(x_labels)
+        ]
+
+    @property
+    def plot_width(self) -> int:
+        """Width of the plot area in pixels, which is also the most points drawn."""
+        return self.width - 2 * self.margin
+
+    def clear(self) -> None:
+        """Hide the line and labels."""
+        self.canvas.itemconfigure(self.line, state="hidden")
+        for label in self.labels:
+            self.canvas.itemconfigure(label, text="")
+        self.points = 0
+
+    def plot(self, values: Sequence[float], x_step: float = 1.0, unit: str = "s") -> int:
+        """
+        Draw a series, replacing the previous one.
+
+        Args:
+            values: Y values at x = 0, x_step, 2 * x_step, ...
+            x_step: X distance between values, used for the labels
+            unit: Suffix of the x-axis labels
+
+        Returns:
+            Number of points in the drawn line
+        """
+        if len(values) < 2:
+            self.clear()
+            return 0
+
+        margin = self.margin
+        plot_height = self.height - 2 * margin
+        last = len(values) - 1
+        max_y = max(values)
+        x_scale = self.plot_width / last
+        y_scale = plot_height / max_y if max_y > 0 else 0.0
+        bottom = self.height - margin
+
+        coords = []
+        for i in lttb(values, self.plot_width):
+            coords.append(margin + i * x_scale)
+            coords.append(bottom - values[i] * y_scale)
+        self.canvas.coords(self.line, coords)
+        self.canvas.itemconfigure(self.line, state="normal")
+
+        span = last * x_step
+        steps = max(len(self.labels) - 1, 1)
+        for n, label in enumerate(self.labels):
+            self.canvas.coords(label, margin + n / steps * self.plot_width, bottom + 20)
+            self.canvas.itemconfigure(label, text=f"{round(span * n / steps, 1):g}{unit}")
+
+        self.points = len(coords) // 2
+        return self.points
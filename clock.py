@@ -0,0 +1,47 @@
+"""
+Clock Sources for ZenType
+Nanosecond clocks that can be injected into TypingEngine.
+"""
+
+import time
+from typing import Callable
+
+# A clock is any zero-argument callable returning integer nanoseconds
+Clock = Callable[[], int]
+
+NS_PER_SECOND = 1_000_000_000
+
+# Monotonic, high-resolution default clock
+default_clock: Clock = time.perf_counter_ns
+
+
+class FakeClock:
+    """
+    Manually advanced clock for deterministic tests and simulated-time benchmarks.
+    Calling the instance returns the current simulated time in nanoseconds.
+    """
+
+    def __init__(self, start_ns: int = 0):
+        """
+        Initialize clock at a given time.
+
+        Args:
+            start_ns: Initial time in nanoseconds
+        """
+        self.now_ns = start_ns
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds: Time to advance in seconds
+
+        Returns:
+            New time in nanoseconds
+        """
+        self.now_ns += round(seconds * NS_PER_SECOND)
+        return self.now_ns
@@ -0,0 +1,338 @@
+"""
+Word Corpora for ZenType
+Large word lists stored as a compact binary file (an offsets array plus a UTF-8 blob)
+and memory-mapped on demand, so sampling decodes only the words drawn.
+
+File layout (little-endian):
+    magic "ZTC1" | flags uint32 | word count N uint32
+    offsets: N + 1 uint32 byte offsets into the blob
+    frequencies: N uint32 counts (only if FLAG_FREQUENCIES is set)
+    blob: UTF-8 words, back to back
+
+Usage:
+    python corpus.py build words.txt words.ztc   # one word per line, optionally "word count"
+    python corpus.py info words.ztc
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+MAGIC = b"ZTC1"
+HEADER = struct.Struct("<4sII")
+FLAG_FREQUENCIES = 1
+
+# Extension of corpus files found by CorpusRegistry.discover
+CORPUS_SUFFIX = ".ztc"
+
+# Name of the corpus built from WordProvider.WORDS
+BUILTIN_CORPUS = "english"
+
+
+def default_corpus_dir() -> Path:
+    """Directory scanned for user corpora (~/.zentype/corpora)."""
+    return Path.home() / ".zentype" / "corpora"
+
+
+def _uint32_array(buffer) -> array:
+    """Copy little-endian uint32 values into a native array."""
+    values = array("I")
+    values.frombytes(buffer)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def write_corpus(path: Union[str, Path], words: Iterable[str],
+                 frequencies: Optional[Iterable[int]] = None) -> int:
+    """
+    Write a corpus file.
+
+    Args:
+        path: Destination file
+        words: Words in order; they must not contain whitespace
+        frequencies: Optional occurrence count per word
+
+    Returns:
+        Number of words written
+    """
+    offsets = array("I", [0])
+    blob = bytearray()
+    for word in words:
+        blob += word.encode("utf-8")
+        offsets.append(len(blob))
+    count = len(offsets) - 1
+
+    counts = None
+    if frequencies is not None:
+        counts = array("I", frequencies)
+        if len(counts) != count:
+            raise ValueError(f"Expected {count} frequencies, got {len(counts)}")
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        if counts is not None:
+            counts.byteswap()
+
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FLAG_FREQUENCIES if counts is not None else 0, count))
+        f.write(offsets.tobytes())
+        if counts is not None:
+            f.write(counts.tobytes())
+        f.write(blob)
+    tmp_path.replace(path)
+    return count
+
+
+def read_word_list(path: Union[str, Path]) -> Tuple[List[str], Optional[List[int]]]:
+    """
+    Read a text word list: one word per line, optionally followed by a count.
+
+    Args:
+        path: Text file
+
+    Returns:
+        Tuple of (words, frequencies or None if no line had a count)
+    """
+    words, counts = [], []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            words.append(fields[0])
+            counts.append(int(fields[1]) if len(fields) > 1 else 1)
+    has_counts = any(count != 1 for count in counts)
+    return words, (counts if has_counts else None)
+
+
+class Corpus(Sequence):
+    """
+    Read-only word sequence backed by a memory-mapped corpus file.
+    The file is mapped on first access; corpus[i] decodes only word i, so
+    random.choices(corpus, k=n) touches n words regardless of corpus size.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize corpus without opening the file.
+
+        Args:
+            path: Corpus file
+        """
+        self.path = Path(path)
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._offsets = None
+        self._frequencies = None
+        self._blob_start = 0
+        self._count = 0
+
+    def _open(self) -> None:
+        """Map the file and locate its sections."""
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            self._file.close()
+            raise ValueError(f"Corpus file is empty: {self.path}")
+        if len(self._mmap) < HEADER.size or self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a ZenType corpus file: {self.path}")
+        _, flags, count = HEADER.unpack_from(self._mmap, 0)
+
+        position = HEADER.size
+        offsets_size = (count + 1) * 4
+        columns_size = offsets_size + (count * 4 if flags & FLAG_FREQUENCIES else 0)
+        if len(self._mmap) < position + columns_size:
+            self.close()
+            raise ValueError(f"Corpus file is truncated: {self.path}")
+        view = memoryview(self._mmap)
+        if sys.byteorder == "little":
+            # Zero-copy views straight into the mapping
+            self._offsets = view[position:position + offsets_size].cast("I")
+        else:
+            self._offsets = _uint32_array(view[position:position + offsets_size])
+        position += offsets_size
+
+        if flags & FLAG_FREQUENCIES:
+            if sys.byteorder == "little":
+                self._frequencies = view[position:position + count * 4].cast("I")
+            else:
+                self._frequencies = _uint32_array(view[position:position + count * 4])
+            position += count * 4
+        view.release()
+
+        self._blob_start = position
+        self._count = count
+        if len(self._mmap) < position + self._offsets[count]:
+            self.close()
+            raise ValueError(f"Corpus file is truncated: {self.path}")
+
+    def _ensure_open(self) -> None:
+        if self._mmap is None:
+            self._open()
+
+    def __len__(self) -> int:
+        self._ensure_open()
+        return self._count
+
+    def __getitem__(self, index):
+        self._ensure_open()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("corpus index out of range")
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    @property
+    def frequencies(self) -> Optional[Sequence]:
+        """Occurrence count per word, or None if the file has none."""
+        self._ensure_open()
+        return self._frequencies
+
+    @property
+    def is_open(self) -> bool:
+        """True once the file has been mapped."""
+        return self._mmap is not None
+
+    def close(self) -> None:
+        """Unmap the file. The corpus reopens on next access."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        if isinstance(self._frequencies, memoryview):
+            self._frequencies.release()
+        self._offsets = self._frequencies = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CorpusRegistry:
+    """
+    Named corpora, opened on first use and cached across tests.
+    Registering a file only records its path, so unused corpora cost nothing.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._sources: Dict[str, Union[Path, Sequence]] = {}
+        self._loaded: Dict[str, Sequence] = {}
+
+    def register(self, name: str, source: Union[str, Path, Sequence]) -> None:
+        """
+        Register a corpus.
+
+        Args:
+            name: Corpus name
+            source: Path of a corpus file, or an in-memory word sequence
+        """
+        self._sources[name] = Path(source) if isinstance(source, (str, Path)) else source
+        loaded = self._loaded.pop(name, None)
+        if isinstance(loaded, Corpus):
+            loaded.close()
+
+    def discover(self, directory: Optional[Union[str, Path]] = None) -> List[str]:
+        """
+        Register every corpus file in a directory, named after the file stem.
+
+        Args:
+            directory: Directory to scan (default: ~/.zentype/corpora)
+
+        Returns:
+            Names registered
+        """
+        directory = Path(directory) if directory is not None else default_corpus_dir()
+        if not directory.is_dir():
+            return []
+        names = []
+        for path in sorted(directory.glob(f"*{CORPUS_SUFFIX}")):
+            self.register(path.stem, path)
+            names.append(path.stem)
+        return names
+
+    def names(self) -> List[str]:
+        """Registered corpus names."""
+        return list(self._sources)
+
+    def get(self, name: str) -> Sequence:
+        """
+        Get a corpus, opening it on first use.
+
+        Args:
+            name: Registered corpus name
+
+        Returns:
+            Word sequence
+        """
+        corpus = self._loaded.get(name)
+        if corpus is None:
+            source = self._sources[name]
+            corpus = Corpus(source) if isinstance(source, Path) else source
+            self._loaded[name] = corpus
+        return corpus
+
+    def close_all(self) -> None:
+        """Unmap every opened corpus file."""
+        for corpus in self._loaded.values():
+            if isinstance(corpus, Corpus):
+                corpus.close()
+        self._loaded.clear()
+
+
+def default_registry() -> CorpusRegistry:
+    """
+    Registry with the built-in word list plus the files in ~/.zentype/corpora.
+
+    Returns:
+        CorpusRegistry
+    """
+    from words import WordProvider
+
+    registry = CorpusRegistry()
+    registry.register(BUILTIN_CORPUS, WordProvider.WORDS)
+    registry.discover()
+    return registry
+
+
+def main() -> int:
+    """Command-line corpus tools."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ZenType corpus tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Build a corpus file from a text word list")
+    build.add_argument("source", help="Text file: one word per line, optionally '<word> <count>'")
+    build.add_argument("output", help="Corpus file to write (.ztc)")
+    info = subparsers.add_parser("info", help="Describe a corpus file")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        words, frequencies = read_word_list(args.source)
+        count = write_corpus(args.output, words, frequencies)
+        print(f"Wrote {count:,} words to {args.output}")
+    else:
+        corpus = Corpus(args.path)
+        print(f"{args.path}: {len(corpus):,} words, "
+              f"{'with' if corpus.frequencies is not None else 'without'} frequencies")
+        print("First words:", " ".join(corpus[:10]))
+        corpus.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,25 +2,48 @@
 Local Data Persistence Manager for ZenType
 Handles JSON file operations for storing and retrieving typing test results.
 All data stored locally - no external database required.
+Results are appended to a JSON Lines file, one result per line; the legacy
+single JSON array file is still supported and migrated automatically.
 """
 
+import heapq
 import json
 import os
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+STORAGE_JSONL = "jsonl"
+STORAGE_JSON = "json"
+
 
 class DataManager:
     """Manages local JSON-based data persistence for typing test results."""
 
-    def __init__(self):
-        """Initialize data manager with local data directory."""
+    def __init__(self, data_dir: Optional[str] = None, storage_format: str = STORAGE_JSONL):
+        """
+        Initialize data manager with local data directory.
+
+        Args:
+            data_dir: Directory for result files. If None, uses ~/.zentype/data.
+            storage_format: "jsonl" (append-only, default) or "json" (legacy single array)
+        """
+        if storage_format not in (STORAGE_JSONL, STORAGE_JSON):
+            raise ValueError(f"Unknown storage format: {storage_format}")
+
         # Create data directory in home folder
-        self.data_dir = Path.home() / ".zentype" / "data"
+        self.data_dir = Path(data_dir) if data_dir is not None else Path.home() / ".zentype" / "data"
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        self.results_file = self.data_dir / "typing_results.json"
+        self.storage_format = storage_format
+        self.legacy_file = self.data_dir / "typing_results.json"
+        self.lines_file = self.data_dir / "typing_results.jsonl"
+        self.results_file = self.lines_file if storage_format == STORAGE_JSONL else self.legacy_file
+
+        if storage_format == STORAGE_JSONL:
+            if not self.lines_file.exists() and self.legacy_file.exists():
+                self.migrate_legacy_file()
+            self._repair_tail()
 
         # Initialize results file if it doesn't exist
         if not self.results_file.exists():
@@ -30,19 +53,108 @@ class DataManager:
         """Initialize empty results file with proper structure."""
         self.save_results([])
 
+    def _write_atomic(self, data: bytes) -> None:
+        """Replace the results file with data via a synced temporary file."""
+        tmp_file = self.results_file.with_name(self.results_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.results_file)
+
+    def _repair_tail(self) -> None:
+        """Drop a partial last line left behind by a crash mid-append."""
+        if not self.lines_file.exists():
+            return
+        with open(self.lines_file, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # Walk back to the end of the last complete line
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            f.truncate(position)
+            f.flush()
+            os.fsync(f.fileno())
+        print(f"Discarded incomplete last result in {self.lines_file}")
+
+    def migrate_legacy_file(self) -> int:
+        """
+        One-shot migration of the legacy JSON array file to JSON Lines.
+        The legacy file is kept, renamed with a .migrated suffix. A legacy file that
+        can't be parsed (e.g. truncated by a crash mid-write) is left untouched.
+
+        Returns:
+            Number of migrated results
+        """
+        try:
+            with open(self.legacy_file, "r") as f:
+                results = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Error reading legacy results file {self.legacy_file}, not migrating it: {e}")
+            return 0
+
+        data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in results)
+        tmp_file = self.lines_file.with_name(self.lines_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.lines_file)
+        os.replace(self.legacy_file, self.legacy_file.with_name(self.legacy_file.name + ".migrated"))
+        return len(results)
+
     def save_results(self, results: List[Dict]) -> None:
         """
-        Save typing results to JSON file.
+        Save typing results to JSON file, replacing its contents atomically.
 
         Args:
             results: List of test result dictionaries
         """
         try:
-            with open(self.results_file, "w") as f:
-                json.dump(results, f, indent=2)
+            if self.storage_format == STORAGE_JSONL:
+                data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in results)
+            else:
+                data = json.dumps(results, indent=2)
+            self._write_atomic(data.encode("utf-8"))
         except Exception as e:
             print(f"Error saving results: {e}")
 
+    def iter_results(self) -> Iterator[Dict]:
+        """
+        Stream typing results from the results file.
+        JSON Lines files are read one line at a time.
+
+        Yields:
+            Test result dictionaries in insertion order
+        """
+        if self.storage_format == STORAGE_JSON:
+            yield from self.load_results()
+            return
+
+        try:
+            with open(self.results_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"Skipping corrupt result on line {line_number}: {e}")
+        except FileNotFoundError:
+            return
+
     def load_results(self) -> List[Dict]:
         """
         Load all typing results from JSON file.
@@ -50,6 +162,9 @@ class DataManager:
         Returns:
             List of test result dictionaries
         """
+        if self.storage_format == STORAGE_JSONL:
+            return list(self.iter_results())
+
         try:
             if self.results_file.exists():
                 with open(self.results_file, "r") as f:
@@ -61,18 +176,29 @@ class DataManager:
     def add_result(self, test_result: Dict) -> None:
         """
         Add a new test result to the results file.
+        In JSON Lines mode this appends and fsyncs a single line, independent of history size.
 
         Args:
             test_result: Dictionary containing test metrics (wpm, accuracy, duration, etc.)
         """
-        results = self.load_results()
-
         # Add timestamp if not present
         if "timestamp" not in test_result:
             test_result["timestamp"] = datetime.now().isoformat()
 
-        results.append(test_result)
-        self.save_results(results)
+        if self.storage_format == STORAGE_JSON:
+            results = self.load_results()
+            results.append(test_result)
+            self.save_results(results)
+            return
+
+        line = (json.dumps(test_result, separators=(",", ":")) + "\n").encode("utf-8")
+        fd = os.open(self.results_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # A single write keeps the line contiguous; fsync makes it durable
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def get_statistics(self) -> Dict:
         """
@@ -81,9 +207,20 @@ class DataManager:
         Returns:
             Dictionary with personal best WPM, average WPM, average accuracy, etc.
         """
-        results = self.load_results()
-
-        if not results:
+        total_tests = 0
+        best_wpm = 0
+        wpm_sum = 0
+        accuracy_sum = 0
+        total_chars = 0
+        for r in self.iter_results():
+            wpm = r.get("wpm", 0)
+            total_tests += 1
+            best_wpm = wpm if total_tests == 1 else max(best_wpm, wpm)
+            wpm_sum += wpm
+            accuracy_sum += r.get("accuracy", 0)
+            total_chars += r.get("total_chars_typed", 0)
+
+        if total_tests == 0:
             return {
                 "total_tests": 0,
                 "best_wpm": 0,
@@ -92,15 +229,11 @@ class DataManager:
                 "total_chars_typed": 0,
             }
 
-        wpm_values = [r.get("wpm", 0) for r in results]
-        accuracy_values = [r.get("accuracy", 0) for r in results]
-        total_chars = sum(r.get("total_chars_typed", 0) for r in results)
-
         return {
-            "total_tests": len(results),
-            "best_wpm": max(wpm_values) if wpm_values else 0,
-            "average_wpm": sum(wpm_values) / len(wpm_values) if wpm_values else 0,
-            "average_accuracy": sum(accuracy_values) / len(accuracy_values) if accuracy_values else 0,
+            "total_tests": total_tests,
+            "best_wpm": best_wpm,
+            "average_wpm": wpm_sum / total_tests,
+            "average_accuracy": accuracy_sum / total_tests,
             "total_chars_typed": total_chars,
         }
 
@@ -114,8 +247,7 @@ class DataManager:
         Returns:
             List of results matching the duration
         """
-        results = self.load_results()
-        return [r for r in results if r.get("duration") == duration]
+        return [r for r in self.iter_results() if r.get("duration") == duration]
 
     def get_recent_results(self, limit: int = 10) -> List[Dict]:
         """
@@ -127,12 +259,8 @@ class DataManager:
         Returns:
             List of recent results in reverse chronological order
         """
-        results = self.load_results()
-        # Sort by timestamp in reverse (newest first)
-        sorted_results = sorted(
-            results, key=lambda x: x.get("timestamp", ""), reverse=True
-        )
-        return sorted_results[:limit]
+        # Keep only the newest `limit` results while streaming
+        return heapq.nlargest(limit, self.iter_results(), key=lambda x: x.get("timestamp", ""))
 
     def export_to_csv(self, filepath: str) -> bool:
         """
@@ -146,9 +274,10 @@ class DataManager:
         """
         try:
             import csv
-            results = self.load_results()
+            results = self.iter_results()
+            first = next(results, None)
 
-            if not results:
+            if first is None:
                 return False
 
             with open(filepath, "w", newline="") as f:
@@ -162,8 +291,10 @@ class DataManager:
                         "correct_chars",
                         "total_chars_typed",
                     ],
+                    extrasaction="ignore",
                 )
                 writer.writeheader()
+                writer.writerow(first)
                 writer.writerows(results)
 
             return True
@@ -5,9 +5,379 @@ Handles SQLite database operations for storing and retrieving typing test result
 
 import sqlite3
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
+from engine import KeystrokeLog
+from event_codec import decode_events, encode_events
+
+# Connection tuning applied to every pooled connection
+POOL_SIZE = 4
+CACHE_SIZE_KIB = 16 * 1024
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+BUSY_TIMEOUT_SECONDS = 5.0
+
+# Rows fetched per history page
+HISTORY_PAGE_SIZE = 50
+
+# Columns of a history row; timestamp_ms and id form the keyset pagination key
+RESULT_PAGE_COLUMNS = """id, timestamp, timestamp_ms, wpm, accuracy, duration, elapsed_time,
+                         correct_chars, total_chars_typed, total_chars_in_test, char_index"""
+
+
+def default_db_path() -> str:
+    """Return the default database location, creating its directory."""
+    data_dir = Path.home() / ".zentype" / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return str(data_dir / "zentype.db")
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of SQLite connections to one database file.
+    Connections are opened lazily up to a fixed size, tuned with WAL journaling and
+    memory-mapped I/O, and handed to one thread at a time.
+    """
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        """
+        Initialize pool for a database file.
+
+        Args:
+            db_path: Path to SQLite database file
+            size: Maximum number of open connections
+        """
+        self.db_path = db_path
+        # Every ":memory:" connection is a separate database, so share just one
+        self.size = 1 if db_path == ":memory:" else size
+        self.schema_ready = False
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a new connection."""
+        connection = sqlite3.connect(
+            self.db_path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        connection.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take a connection, opening one if the pool is not full, else wait for one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                connection = self._connect()
+                self._all.append(connection)
+                return connection
+        return self._idle.get()
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        if connection.in_transaction:
+            connection.rollback()
+        self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager lending a pooled connection to the calling thread."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close every connection opened by the pool."""
+        with self._lock:
+            for connection in self._all:
+                connection.close()
+            self._all.clear()
+            self._idle = queue.LifoQueue()
+            self.schema_ready = False
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """
+    Return the process-wide connection pool for a database file.
+
+    Args:
+        db_path: Path to SQLite database file
+    """
+    key = db_path if db_path == ":memory:" else os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close every shared connection pool (call on application exit)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+# SQL expression converting an ISO-8601 timestamp into integer epoch milliseconds
+EPOCH_MS_SQL = "CAST(round((julianday({}) - 2440587.5) * 86400000) AS INTEGER)"
+
+
+def to_epoch_ms(moment: datetime) -> int:
+    """
+    Convert a datetime into the epoch milliseconds stored in timestamp_ms.
+    Stored timestamps are naive local times converted as if they were UTC, so
+    naive datetimes are converted the same way.
+
+    Args:
+        moment: Naive local time, or an aware datetime
+
+    Returns:
+        Epoch milliseconds comparable with timestamp_ms
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return round((moment - datetime(1970, 1, 1)).total_seconds() * 1000)
+
+
+def _migration_1_create_results(connection: sqlite3.Connection) -> None:
+    """Create the typing_results table."""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS typing_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            wpm REAL NOT NULL,
+            accuracy REAL NOT NULL,
+            duration INTEGER NOT NULL,
+            elapsed_time REAL,
+            correct_chars INTEGER,
+            total_chars_typed INTEGER,
+            total_chars_in_test INTEGER,
+            char_index INTEGER
+        )
+    """)
+
+
+def _migration_2_timestamp_index(connection: sqlite3.Connection) -> None:
+    """
+    Add an epoch-milliseconds timestamp column, backfill it and index it.
+    The indexes give queries their order and range; they aren't covering, so each row
+    read through them costs one rowid lookup. Covering every history column would store
+    the table twice more for lookups that LIMIT already bounds.
+    """
+    connection.execute("ALTER TABLE typing_results ADD COLUMN timestamp_ms INTEGER")
+    connection.execute(
+        f"UPDATE typing_results SET timestamp_ms = {EPOCH_MS_SQL.format('timestamp')}"
+    )
+    connection.execute(
+        "CREATE INDEX idx_typing_results_timestamp ON typing_results (timestamp_ms)"
+    )
+    connection.execute(
+        "CREATE INDEX idx_typing_results_duration_timestamp "
+        "ON typing_results (duration, timestamp_ms)"
+    )
+
+
+# stats_summary scope holding totals across all durations. Per-duration rows use the
+# duration as their scope, and results saved without one have duration 0, so the
+# global row needs a value no duration can take.
+ALL_DURATIONS = -1
+
+
+def _summary_upsert_sql(scope: str) -> str:
+    """Trigger statement adding NEW to the stats_summary row of a scope."""
+    return f"""
+        INSERT INTO stats_summary (scope, total_tests, best_wpm, wpm_sum, accuracy_sum, total_chars_typed)
+        VALUES ({scope}, 1, NEW.wpm, NEW.wpm, NEW.accuracy, COALESCE(NEW.total_chars_typed, 0))
+        ON CONFLICT (scope) DO UPDATE SET
+            total_tests = total_tests + 1,
+            best_wpm = max(best_wpm, excluded.best_wpm),
+            wpm_sum = wpm_sum + excluded.wpm_sum,
+            accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+            total_chars_typed = total_chars_typed + excluded.total_chars_typed;
+    """
+
+
+def _summary_remove_sql(scope: str) -> str:
+    """Trigger statement removing OLD from the stats_summary row of a scope."""
+    # Deleting the best result leaves best_wpm NULL until the next read recomputes it
+    return f"""
+        UPDATE stats_summary SET
+            total_tests = total_tests - 1,
+            best_wpm = CASE WHEN OLD.wpm < best_wpm THEN best_wpm ELSE NULL END,
+            wpm_sum = wpm_sum - OLD.wpm,
+            accuracy_sum = accuracy_sum - OLD.accuracy,
+            total_chars_typed = total_chars_typed - COALESCE(OLD.total_chars_typed, 0)
+        WHERE scope = {scope};
+    """
+
+
+def _rebuild_stats_summary(connection: sqlite3.Connection) -> None:
+    """Recompute every stats_summary row from typing_results."""
+    connection.execute("DELETE FROM stats_summary")
+    for scope, group_by in ((str(ALL_DURATIONS), ""), ("duration", "GROUP BY duration")):
+        connection.execute(f"""
+            INSERT INTO stats_summary
+                (scope, total_tests, best_wpm, wpm_sum, accuracy_sum, total_chars_typed)
+            SELECT {scope}, COUNT(*), MAX(wpm), SUM(wpm), SUM(accuracy),
+                   COALESCE(SUM(total_chars_typed), 0)
+            FROM typing_results
+            {group_by}
+            HAVING COUNT(*) > 0
+        """)
+
+
+def _migration_3_stats_summary(connection: sqlite3.Connection) -> None:
+    """Add the stats_summary aggregate table, kept current by triggers."""
+    connection.execute("""
+        CREATE TABLE stats_summary (
+            scope INTEGER PRIMARY KEY,
+            total_tests INTEGER NOT NULL,
+            best_wpm REAL,
+            wpm_sum REAL NOT NULL,
+            accuracy_sum REAL NOT NULL,
+            total_chars_typed INTEGER NOT NULL
+        )
+    """)
+    _create_summary_triggers(connection)
+    _rebuild_stats_summary(connection)
+
+
+def _create_summary_triggers(connection: sqlite3.Connection) -> None:
+    """Create the triggers that keep stats_summary current."""
+    connection.execute(f"""
+        CREATE TRIGGER trg_typing_results_summary_insert AFTER INSERT ON typing_results
+        BEGIN
+            {_summary_upsert_sql(str(ALL_DURATIONS))}
+            {_summary_upsert_sql("NEW.duration")}
+        END
+    """)
+    connection.execute(f"""
+        CREATE TRIGGER trg_typing_results_summary_delete AFTER DELETE ON typing_results
+        BEGIN
+            {_summary_remove_sql(str(ALL_DURATIONS))}
+            {_summary_remove_sql("OLD.duration")}
+        END
+    """)
+
+
+def _migration_4_test_events(connection: sqlite3.Connection) -> None:
+    """Add test_events, one encoded keystroke blob per typing result."""
+    connection.execute("""
+        CREATE TABLE test_events (
+            result_id INTEGER PRIMARY KEY REFERENCES typing_results(id) ON DELETE CASCADE,
+            event_count INTEGER NOT NULL,
+            events BLOB NOT NULL
+        )
+    """)
+
+
+# Latency tables keyed by one character (key_stats) or two (bigram_stats)
+LATENCY_TABLES = ("key_stats", "bigram_stats")
+
+
+def _migration_5_latency_stats(connection: sqlite3.Connection) -> None:
+    """Add per-key and per-bigram latency statistics, merged in after each test."""
+    for table in LATENCY_TABLES:
+        connection.execute(f"""
+            CREATE TABLE {table} (
+                key TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                mean_latency REAL NOT NULL,
+                m2 REAL NOT NULL,
+                errors INTEGER NOT NULL
+            )
+        """)
+        connection.execute(f"CREATE INDEX idx_{table}_mean_latency ON {table}(mean_latency)")
+
+
+def _latency_upsert_sql(table: str) -> str:
+    """
+    Upsert that merges a test's (count, mean, M2) into the running totals using
+    Chan et al.'s parallel variance formula. SQLite evaluates every SET expression
+    against the old row, so count and mean_latency refer to the stored values.
+    """
+    return f"""
+        INSERT INTO {table} (key, count, mean_latency, m2, errors) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            count = count + excluded.count,
+            mean_latency = CASE WHEN count + excluded.count = 0 THEN mean_latency ELSE
+                mean_latency + (excluded.mean_latency - mean_latency) * excluded.count
+                / (count + excluded.count) END,
+            m2 = CASE WHEN count + excluded.count = 0 THEN m2 ELSE
+                m2 + excluded.m2 + (excluded.mean_latency - mean_latency)
+                * (excluded.mean_latency - mean_latency) * count * excluded.count
+                / (count + excluded.count) END,
+            errors = errors + excluded.errors
+    """
+
+
+def _migration_6_global_summary_scope(connection: sqlite3.Connection) -> None:
+    """
+    Move the all-durations stats_summary row off scope 0, which it shared with
+    results saved without a duration, and recount the summary.
+    """
+    connection.execute("DROP TRIGGER trg_typing_results_summary_insert")
+    connection.execute("DROP TRIGGER trg_typing_results_summary_delete")
+    _create_summary_triggers(connection)
+    _rebuild_stats_summary(connection)
+
+
+# Schema migrations in order; the database's user_version counts those applied
+MIGRATIONS = [
+    _migration_1_create_results,
+    _migration_2_timestamp_index,
+    _migration_3_stats_summary,
+    _migration_4_test_events,
+    _migration_5_latency_stats,
+    _migration_6_global_summary_scope,
+]
+
+
+def migrate(connection: sqlite3.Connection) -> int:
+    """
+    Apply pending schema migrations, each in its own transaction.
+
+    Args:
+        connection: Open SQLite connection
+
+    Returns:
+        Schema version after migrating
+    """
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    while version < len(MIGRATIONS):
+        # Take the write lock first so concurrent processes don't migrate twice
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < len(MIGRATIONS):
+                MIGRATIONS[version](connection)
+                version += 1
+                connection.execute(f"PRAGMA user_version = {version}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+    return version
 
 
 class DatabaseManager:
@@ -15,67 +385,109 @@ class DatabaseManager:
 
     def __init__(self, db_path: Optional[str] = None):
         """
-        Initialize database manager with SQLite connection.
+        Initialize database manager on the shared connection pool.
+        The schema is created once per database file, not once per manager.
         
         Args:
             db_path: Path to SQLite database file. If None, uses default location.
         """
         if db_path is None:
-            # Create data directory in home folder
-            data_dir = Path.home() / ".zentype" / "data"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            db_path = str(data_dir / "zentype.db")
+            db_path = default_db_path()
         
         self.db_path = db_path
-        self.connection = None
+        self.pool: Optional[ConnectionPool] = get_pool(db_path)
         self._init_database()
 
+    def _connection(self):
+        """Borrow a pooled connection."""
+        if self.pool is None:
+            raise RuntimeError("Database connection is not initialized")
+        return self.pool.connection()
+
     def _init_database(self) -> None:
-        """Initialize database and create tables if they don't exist."""
-        self.connection = sqlite3.connect(self.db_path)
-        self.connection.row_factory = sqlite3.Row
-        
-        cursor = self.connection.cursor()
-        
-        # Create typing_results table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS typing_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                wpm REAL NOT NULL,
-                accuracy REAL NOT NULL,
-                duration INTEGER NOT NULL,
-                elapsed_time REAL,
-                correct_chars INTEGER,
-                total_chars_typed INTEGER,
-                total_chars_in_test INTEGER,
-                char_index INTEGER
-            )
-        """)
-        
-        self.connection.commit()
+        """Initialize database and bring its schema up to date."""
+        if self.pool.schema_ready:
+            return
+
+        with self._connection() as connection:
+            migrate(connection)
+
+        self.pool.schema_ready = True
 
-    def add_result(self, test_result: Dict) -> None:
+    def add_result(self, test_result: Dict, keystrokes: Optional[KeystrokeLog] = None,
+                   start_time: Optional[int] = None, target_text: Optional[str] = None) -> int:
         """
         Add a new test result to the database.
         
         Args:
             test_result: Dictionary containing test metrics (wpm, accuracy, duration, etc.)
+            keystrokes: Optional keystroke log, stored encoded in test_events and
+                merged into key_stats and bigram_stats
+            start_time: Test start in clock nanoseconds (required with keystrokes)
+            target_text: Text of the test, used to attribute errors to keys
+
+        Returns:
+            Row id of the new result
         """
-        if self.connection is None:
-            raise RuntimeError("Database connection is not initialized")
-        cursor = self.connection.cursor()
-        
+        return self.add_results([(test_result, keystrokes, start_time, target_text)])[0]
+
+    def add_results(self, entries: List[Tuple[Dict, Optional[KeystrokeLog], Optional[int], Optional[str]]]) -> List[int]:
+        """
+        Add several test results in a single transaction.
+
+        Args:
+            entries: Tuples of (test_result, keystrokes, start_time, target_text) as for add_result
+
+        Returns:
+            Row ids of the new results, in order
+        """
+        result_ids = []
+        with self._connection() as connection, connection:
+            for test_result, keystrokes, start_time, target_text in entries:
+                result_ids.append(self._insert_result(connection, test_result, keystrokes, start_time))
+                if keystrokes is not None:
+                    self._merge_latency_stats(connection, keystrokes, start_time, target_text)
+        return result_ids
+
+    @staticmethod
+    def _merge_latency_stats(connection: sqlite3.Connection, keystrokes: KeystrokeLog,
+                             start_time: Optional[int], target_text: Optional[str]) -> None:
+        """Merge one test's per-key and per-bigram latency into the running totals."""
+        # Imported on first save: analytics may pull in NumPy, which startup doesn't need
+        from analytics import analyze
+
+        analysis = analyze(keystrokes, start_time=start_time or 0, target_text=target_text)
+        errors = analysis["char_errors"]
+
+        key_rows = [
+            (key, stats["count"], stats["mean"], stats["m2"], errors.get(key, 0))
+            for key, stats in analysis["char_latency"].items()
+        ]
+        # Keys that were only ever mistyped still record their errors
+        key_rows += [(key, 0, 0.0, 0.0, count) for key, count in errors.items()
+                     if key not in analysis["char_latency"]]
+        bigram_rows = [
+            (bigram, stats["count"], stats["mean"], stats["m2"], 0)
+            for bigram, stats in analysis["bigram_latency"].items()
+        ]
+        connection.executemany(_latency_upsert_sql("key_stats"), key_rows)
+        connection.executemany(_latency_upsert_sql("bigram_stats"), bigram_rows)
+
+    @staticmethod
+    def _insert_result(connection: sqlite3.Connection, test_result: Dict,
+                       keystrokes: Optional[KeystrokeLog], start_time: Optional[int]) -> int:
+        """Insert one result and its keystroke events inside the caller's transaction."""
         # Add timestamp if not present
         if "timestamp" not in test_result:
             test_result["timestamp"] = datetime.now().isoformat()
-        
-        cursor.execute("""
+
+        cursor = connection.execute(f"""
             INSERT INTO typing_results 
-            (timestamp, wpm, accuracy, duration, elapsed_time, correct_chars, 
+            (timestamp, timestamp_ms, wpm, accuracy, duration, elapsed_time, correct_chars, 
              total_chars_typed, total_chars_in_test, char_index)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, {EPOCH_MS_SQL.format('?')}, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
+            test_result.get("timestamp"),
             test_result.get("timestamp"),
             test_result.get("wpm", 0),
             test_result.get("accuracy", 0),
@@ -86,49 +498,120 @@ class DatabaseManager:
             test_result.get("total_chars_in_test", 0),
             test_result.get("char_index", 0),
         ))
-        
-        self.connection.commit()
+        result_id = cursor.lastrowid
+        if keystrokes is not None:
+            connection.execute(
+                "INSERT INTO test_events (result_id, event_count, events) VALUES (?, ?, ?)",
+                (result_id, len(keystrokes), encode_events(keystrokes, start_time or 0)),
+            )
+        return result_id
 
-    def get_statistics(self) -> Dict:
+    def get_statistics(self, duration: Optional[int] = None) -> Dict:
         """
-        Calculate overall statistics from all test results.
+        Read overall statistics from the stats_summary aggregate table (O(1)).
+        
+        Args:
+            duration: Restrict to tests of this duration. If None, covers all tests.
         
         Returns:
             Dictionary with personal best WPM, average WPM, average accuracy, etc.
+            "last_result_id" is the newest result id covered, read in the same
+            statement, so callers can tell which later results are not included.
         """
-        if self.connection is None:
-            raise RuntimeError("Database connection is not initialized")
-        cursor = self.connection.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_tests,
-                MAX(wpm) as best_wpm,
-                AVG(wpm) as average_wpm,
-                AVG(accuracy) as average_accuracy,
-                SUM(total_chars_typed) as total_chars_typed
-            FROM typing_results
-        """)
-        
-        row = cursor.fetchone()
-        
-        if row["total_tests"] == 0:
-            return {
-                "total_tests": 0,
-                "best_wpm": 0,
-                "average_wpm": 0,
-                "average_accuracy": 0,
-                "total_chars_typed": 0,
-            }
+        scope = ALL_DURATIONS if duration is None else duration
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT *, (SELECT MAX(id) FROM typing_results) AS last_result_id "
+                "FROM stats_summary WHERE scope = ?", (scope,)
+            ).fetchone()
+            
+            if row is None or row["total_tests"] == 0:
+                return {
+                    "total_tests": 0,
+                    "best_wpm": 0,
+                    "average_wpm": 0,
+                    "average_accuracy": 0,
+                    "total_chars_typed": 0,
+                    "last_result_id": (row["last_result_id"] or 0) if row is not None else 0,
+                }
+            
+            best_wpm = row["best_wpm"]
+            if best_wpm is None:
+                # The previous best was deleted; recompute once and store it
+                with connection:
+                    best_wpm = self._recompute_best_wpm(connection, scope)
         
         return {
             "total_tests": row["total_tests"],
-            "best_wpm": row["best_wpm"] or 0,
-            "average_wpm": row["average_wpm"] or 0,
-            "average_accuracy": row["average_accuracy"] or 0,
+            "best_wpm": best_wpm or 0,
+            "average_wpm": row["wpm_sum"] / row["total_tests"],
+            "average_accuracy": row["accuracy_sum"] / row["total_tests"],
             "total_chars_typed": row["total_chars_typed"] or 0,
+            "last_result_id": row["last_result_id"],
         }
 
+    @staticmethod
+    def _recompute_best_wpm(connection: sqlite3.Connection, scope: int) -> Optional[float]:
+        """Recompute and store best_wpm for one stats_summary scope."""
+        if scope == ALL_DURATIONS:
+            best_wpm = connection.execute("SELECT MAX(wpm) FROM typing_results").fetchone()[0]
+        else:
+            best_wpm = connection.execute(
+                "SELECT MAX(wpm) FROM typing_results WHERE duration = ?", (scope,)
+            ).fetchone()[0]
+        connection.execute(
+            "UPDATE stats_summary SET best_wpm = ? WHERE scope = ?", (best_wpm, scope)
+        )
+        return best_wpm
+
+    def check_stats_summary(self) -> List[int]:
+        """
+        Compare stats_summary with a full recomputation from typing_results.
+        
+        Returns:
+            Scopes whose summary has drifted, where ALL_DURATIONS (-1) is the all-durations
+            row and any other value is a duration; empty if consistent
+        """
+        with self._connection() as connection:
+            stored = {
+                row["scope"]: row
+                for row in connection.execute("SELECT * FROM stats_summary WHERE total_tests > 0")
+            }
+            actual = {}
+            for scope, group_by in ((str(ALL_DURATIONS), ""), ("duration", "GROUP BY duration")):
+                for row in connection.execute(f"""
+                    SELECT {scope} AS scope, COUNT(*) AS total_tests, MAX(wpm) AS best_wpm,
+                           SUM(wpm) AS wpm_sum, SUM(accuracy) AS accuracy_sum,
+                           COALESCE(SUM(total_chars_typed), 0) AS total_chars_typed
+                    FROM typing_results
+                    {group_by}
+                    HAVING COUNT(*) > 0
+                """):
+                    actual[row["scope"]] = row
+        
+        drifted = []
+        for scope in sorted(set(stored) | set(actual)):
+            expected = actual.get(scope)
+            summary = stored.get(scope)
+            if expected is None or summary is None:
+                drifted.append(scope)
+                continue
+            if (
+                summary["total_tests"] != expected["total_tests"]
+                or summary["total_chars_typed"] != expected["total_chars_typed"]
+                or summary["best_wpm"] not in (None, expected["best_wpm"])
+                or abs(summary["wpm_sum"] - expected["wpm_sum"]) > 1e-6 * max(1.0, abs(expected["wpm_sum"]))
+                or abs(summary["accuracy_sum"] - expected["accuracy_sum"])
+                > 1e-6 * max(1.0, abs(expected["accuracy_sum"]))
+            ):
+                drifted.append(scope)
+        return drifted
+
+    def rebuild_stats_summary(self) -> None:
+        """Recompute the stats_summary table from typing_results."""
+        with self._connection() as connection, connection:
+            _rebuild_stats_summary(connection)
+
     def get_recent_results(self, limit: int = 10) -> List[Dict]:
         """
         Get most recent test results.
@@ -139,23 +622,16 @@ class DatabaseManager:
         Returns:
             List of recent results in reverse chronological order
         """
-        if self.connection is None:
-            raise RuntimeError("Database connection is not initialized")
-        cursor = self.connection.cursor()
+        with self._connection() as connection:
+            rows = connection.execute("""
+                SELECT timestamp, wpm, accuracy, duration, elapsed_time, 
+                       correct_chars, total_chars_typed, total_chars_in_test, char_index
+                FROM typing_results
+                ORDER BY timestamp_ms DESC, id DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
         
-        cursor.execute("""
-            SELECT timestamp, wpm, accuracy, duration, elapsed_time, 
-                   correct_chars, total_chars_typed, total_chars_in_test, char_index
-            FROM typing_results
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append(dict(row))
-        
-        return results
+        return [dict(row) for row in rows]
 
     def get_results_by_duration(self, duration: int) -> List[Dict]:
         """
@@ -167,37 +643,280 @@ class DatabaseManager:
         Returns:
             List of results matching the duration
         """
-        if self.connection is None:
-            raise RuntimeError("Database connection is not initialized")
-        cursor = self.connection.cursor()
+        with self._connection() as connection:
+            rows = connection.execute("""
+                SELECT timestamp, wpm, accuracy, duration, elapsed_time,
+                       correct_chars, total_chars_typed, total_chars_in_test, char_index
+                FROM typing_results
+                WHERE duration = ?
+                ORDER BY timestamp_ms DESC, id DESC
+            """, (duration,)).fetchall()
         
-        cursor.execute("""
-            SELECT timestamp, wpm, accuracy, duration, elapsed_time,
-                   correct_chars, total_chars_typed, total_chars_in_test, char_index
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _result_filters(duration: Optional[int], since: Optional[datetime],
+                        until: Optional[datetime]) -> Tuple[List[str], List]:
+        """WHERE clauses and parameters for the history filters."""
+        clauses, params = [], []
+        if duration is not None:
+            clauses.append("duration = ?")
+            params.append(duration)
+        if since is not None:
+            clauses.append("timestamp_ms >= ?")
+            params.append(to_epoch_ms(since))
+        if until is not None:
+            clauses.append("timestamp_ms < ?")
+            params.append(to_epoch_ms(until))
+        return clauses, params
+
+    @classmethod
+    def _results_page_query(cls, limit: int, before: Optional[Tuple[int, int]],
+                            after: Optional[Tuple[int, int]], duration: Optional[int],
+                            since: Optional[datetime], until: Optional[datetime]) -> Tuple[str, List]:
+        """SQL and parameters of a get_results_page() query; pages after a key are read oldest first."""
+        clauses, params = cls._result_filters(duration, since, until)
+        order = "DESC"
+        if before is not None:
+            clauses.append("(timestamp_ms, id) < (?, ?)")
+            params.extend(before)
+        elif after is not None:
+            clauses.append("(timestamp_ms, id) > (?, ?)")
+            params.extend(after)
+            order = "ASC"
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"""
+            SELECT {RESULT_PAGE_COLUMNS}
             FROM typing_results
-            WHERE duration = ?
-            ORDER BY timestamp DESC
-        """, (duration,))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append(dict(row))
-        
+            {where}
+            ORDER BY timestamp_ms {order}, id {order}
+            LIMIT ?
+        """
+        return query, params + [limit]
+
+    def get_results_page(self, limit: int = HISTORY_PAGE_SIZE, before: Optional[Tuple[int, int]] = None,
+                         after: Optional[Tuple[int, int]] = None, duration: Optional[int] = None,
+                         since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Dict]:
+        """
+        Get one page of results, newest first, by keyset pagination on (timestamp_ms, id).
+        Every page is a range search of a timestamp index in index order, followed by one
+        rowid lookup per returned row for the other columns (the indexes aren't covering),
+        so reading page 20,000 costs the same as reading the first one.
+
+        Args:
+            limit: Maximum number of results
+            before: (timestamp_ms, id) key; return the results just older than it
+            after: (timestamp_ms, id) key; return the results just newer than it
+            duration: Only tests of this duration
+            since: Only tests at or after this time
+            until: Only tests before this time
+
+        Returns:
+            List of results in reverse chronological order, including id and timestamp_ms
+        """
+        if before is not None and after is not None:
+            raise ValueError("Pass either before or after, not both")
+        query, params = self._results_page_query(limit, before, after, duration, since, until)
+        with self._connection() as connection:
+            rows = connection.execute(query, params).fetchall()
+
+        results = [dict(row) for row in rows]
+        if after is not None:
+            results.reverse()
         return results
 
+    def get_timestamp_range(self, duration: Optional[int] = None, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None) -> Optional[Tuple[int, int]]:
+        """
+        Get the oldest and newest timestamp_ms matching the history filters (two index lookups).
+
+        Args:
+            duration: Only tests of this duration
+            since: Only tests at or after this time
+            until: Only tests before this time
+
+        Returns:
+            Tuple of (oldest, newest) epoch milliseconds, or None if nothing matches
+        """
+        clauses, params = self._result_filters(duration, since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        bounds = []
+        with self._connection() as connection:
+            for order in ("ASC", "DESC"):
+                row = connection.execute(f"""
+                    SELECT timestamp_ms FROM typing_results
+                    {where}
+                    ORDER BY timestamp_ms {order}
+                    LIMIT 1
+                """, params).fetchone()
+                if row is None:
+                    return None
+                bounds.append(row[0])
+        return bounds[0], bounds[1]
+
+    def count_results(self, duration: Optional[int] = None, since: Optional[datetime] = None,
+                      until: Optional[datetime] = None) -> int:
+        """
+        Count results matching the history filters.
+        Without a date range the count comes from stats_summary (O(1)).
+
+        Args:
+            duration: Only tests of this duration
+            since: Only tests at or after this time
+            until: Only tests before this time
+
+        Returns:
+            Number of matching results
+        """
+        if since is None and until is None:
+            return self.get_statistics(duration)["total_tests"]
+        clauses, params = self._result_filters(duration, since, until)
+        with self._connection() as connection:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM typing_results WHERE {' AND '.join(clauses)}", params
+            ).fetchone()[0]
+
+    def get_test_events(self, result_id: int) -> Optional[KeystrokeLog]:
+        """
+        Load the keystroke log stored for one result.
+
+        Args:
+            result_id: typing_results row id
+
+        Returns:
+            KeystrokeLog with timestamps since the test start, or None if none was stored
+        """
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT events FROM test_events WHERE result_id = ?", (result_id,)
+            ).fetchone()
+        return decode_events(row["events"]) if row else None
+
+    def iter_test_events(self, batch_size: int = 64) -> Iterator[Tuple[int, KeystrokeLog]]:
+        """
+        Stream every stored keystroke log, oldest result first.
+        Blobs are fetched in keyset pages and decoded one at a time, so memory
+        stays bounded by a single page regardless of history size.
+
+        Args:
+            batch_size: Number of blobs fetched per query
+
+        Yields:
+            Tuples of (result_id, KeystrokeLog)
+        """
+        last_id = 0
+        while True:
+            with self._connection() as connection:
+                rows = connection.execute("""
+                    SELECT result_id, events FROM test_events
+                    WHERE result_id > ?
+                    ORDER BY result_id
+                    LIMIT ?
+                """, (last_id, batch_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["result_id"], decode_events(row["events"])
+            last_id = rows[-1]["result_id"]
+
+    def get_latency_stats(self, bigrams: bool = False, min_count: int = 0) -> Dict[str, Dict]:
+        """
+        Get stored latency statistics for every key (or bigram).
+
+        Args:
+            bigrams: Read bigram_stats instead of key_stats
+            min_count: Ignore keys with fewer latency samples than this
+
+        Returns:
+            Mapping of key to {"count", "mean_latency", "m2", "errors"}
+        """
+        table = LATENCY_TABLES[1] if bigrams else LATENCY_TABLES[0]
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"SELECT key, count, mean_latency, m2, errors FROM {table} WHERE count >= ?",
+                (min_count,),
+            ).fetchall()
+        return {row["key"]: dict(row) for row in rows}
+
+    def get_weakest_keys(self, limit: int = 5, min_count: int = 10, bigrams: bool = False) -> List[Dict]:
+        """
+        Get the keys (or bigrams) with the highest mean latency across all history.
+        Reads the latency index directly; raw keystroke events are not scanned.
+
+        Args:
+            limit: Maximum number of keys to return
+            min_count: Ignore keys with fewer latency samples than this
+            bigrams: Rank two-key transitions instead of single keys
+
+        Returns:
+            List of dictionaries with key, count, mean_latency, std_latency (seconds),
+            errors and error_rate, slowest first
+        """
+        table = LATENCY_TABLES[1] if bigrams else LATENCY_TABLES[0]
+        with self._connection() as connection:
+            rows = connection.execute(f"""
+                SELECT key, count, mean_latency, m2, errors
+                FROM {table}
+                WHERE count >= ?
+                ORDER BY mean_latency DESC
+                LIMIT ?
+            """, (min_count, limit)).fetchall()
+
+        return [
+            {
+                "key": row["key"],
+                "count": row["count"],
+                "mean_latency": row["mean_latency"],
+                "std_latency": (row["m2"] / row["count"]) ** 0.5 if row["count"] else 0.0,
+                "errors": row["errors"],
+                "error_rate": row["errors"] / (row["count"] + row["errors"]),
+            }
+            for row in rows
+        ]
+
     def clear_all_data(self) -> None:
         """Clear all stored test results (use with caution)."""
-        if self.connection is None:
-            raise RuntimeError("Database connection is not initialized")
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM typing_results")
-        self.connection.commit()
+        with self._connection() as connection, connection:
+            connection.execute("DELETE FROM typing_results")
+            for table in LATENCY_TABLES:
+                connection.execute(f"DELETE FROM {table}")
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.connection:
-            self.connection.close()
+        """
+        Detach from the shared connection pool.
+        Pooled connections stay open for other managers; close_all_pools() closes them.
+        """
+        self.pool = None
 
     def __del__(self):
         """Ensure database connection is closed on object deletion."""
         self.close()
+
+
+def main() -> int:
+    """Command-line maintenance for the results database."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ZenType database maintenance")
+    parser.add_argument("--db", help="Path to the database (default: ~/.zentype/data/zentype.db)")
+    parser.add_argument("--check-stats", action="store_true", help="Check stats_summary against typing_results")
+    parser.add_argument("--rebuild-stats", action="store_true", help="Rebuild stats_summary from typing_results")
+    args = parser.parse_args()
+
+    db = DatabaseManager(args.db)
+    if args.rebuild_stats:
+        db.rebuild_stats_summary()
+        print("stats_summary rebuilt")
+    if args.check_stats or not args.rebuild_stats:
+        drifted = db.check_stats_summary()
+        if drifted:
+            print(f"stats_summary has drifted for scopes: {drifted} (run with --rebuild-stats)")
+            return 1
+        print("stats_summary is consistent")
+    close_all_pools()
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
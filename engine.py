@@ -3,14 +3,129 @@ Core Typing Engine for ZenType
 Handles character validation, WPM calculation, accuracy tracking, and test state management.
 """
 
-import time
 import logging
-from typing import List, Tuple
+from array import array
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Tuple
+from clock import Clock, NS_PER_SECOND, default_clock
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Keystroke event codes stored in KeystrokeLog.codes
+EVENT_INCORRECT = 0
+EVENT_CORRECT = 1
+EVENT_BACKSPACE = 2
+
+# Per-position character status stored in TypingEngine's status buffer
+STATUS_UNWRITTEN = 0
+STATUS_CORRECT = 1
+STATUS_ERROR = 2
+STATUS_NAMES = ("unwritten", "correct", "error")
+
+# Untyped characters a streaming engine keeps ahead of the cursor
+STREAM_LOOKAHEAD_CHARS = 600
+
+# Live speed: correct characters are counted per interval in a ring of this many slots
+SPEED_INTERVAL_NS = NS_PER_SECOND // 2
+SPEED_BUCKETS = 40
+
+
+class KeystrokeLog:
+    """
+    Columnar keystroke log.
+    Stores one entry per keystroke across three compact columns instead of a tuple per key:
+    integer nanosecond timestamps, event codes (bytearray) and typed code points.
+    """
+
+    __slots__ = ("_timestamps", "_codes", "_chars")
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self._timestamps = array("q")
+        self._codes = bytearray()
+        self._chars = array("I")
+
+    @classmethod
+    def from_columns(cls, timestamps: array, codes: bytearray, chars: array) -> "KeystrokeLog":
+        """
+        Build a log that takes ownership of existing columns, e.g. decoded from storage.
+
+        Args:
+            timestamps: array('q') of nanosecond timestamps
+            codes: Event codes, one byte per keystroke
+            chars: array('I') of typed code points (0 for backspace)
+
+        Returns:
+            KeystrokeLog wrapping the columns
+        """
+        if not len(timestamps) == len(codes) == len(chars):
+            raise ValueError("Keystroke columns must have the same length")
+        log = cls()
+        log._timestamps = timestamps
+        log._codes = codes
+        log._chars = chars
+        return log
+
+    def append(self, code: int, char: str, timestamp: int) -> None:
+        """
+        Record one keystroke.
+
+        Args:
+            code: EVENT_CORRECT, EVENT_INCORRECT or EVENT_BACKSPACE
+            char: Character typed (empty for backspace)
+            timestamp: Monotonic timestamp of the keystroke in nanoseconds
+        """
+        self._timestamps.append(timestamp)
+        self._codes.append(code)
+        self._chars.append(ord(char) if char else 0)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Read-only view of keystroke timestamps. Release it before recording more keys."""
+        return memoryview(self._timestamps).toreadonly()
+
+    @property
+    def codes(self) -> memoryview:
+        """Read-only view of keystroke event codes. Release it before recording more keys."""
+        return memoryview(self._codes).toreadonly()
+
+    @property
+    def chars(self) -> memoryview:
+        """Read-only view of typed code points (0 for backspace). Release it before recording more keys."""
+        return memoryview(self._chars).toreadonly()
+
+    def cumulative_counts(self) -> Tuple[array, array]:
+        """
+        Build prefix sums of correct and typed (non-backspace) keystrokes in one pass.
+        Entry i of each array counts the keystrokes among the first i recorded.
+
+        Returns:
+            Tuple of (correct_prefix, typed_prefix), each of length len(self) + 1
+        """
+        correct_prefix = array("l", [0]) * (len(self._codes) + 1)
+        typed_prefix = array("l", [0]) * (len(self._codes) + 1)
+        correct = typed = 0
+        for i, code in enumerate(self._codes, 1):
+            if code == EVENT_CORRECT:
+                correct += 1
+                typed += 1
+            elif code == EVENT_INCORRECT:
+                typed += 1
+            correct_prefix[i] = correct
+            typed_prefix[i] = typed
+        return correct_prefix, typed_prefix
+
+    def clear(self) -> None:
+        """Remove all recorded keystrokes."""
+        del self._timestamps[:]
+        del self._codes[:]
+        del self._chars[:]
+
 
 class TypingEngine:
     """
@@ -18,44 +133,139 @@ class TypingEngine:
     Character-level control for precise feedback on typing accuracy.
     """
 
-    def __init__(self, target_text: str, duration_seconds: int):
+    __slots__ = (
+        "target_text",
+        "duration_seconds",
+        "clock",
+        "typed_codes",
+        "char_status",
+        "char_index",
+        "is_active",
+        "start_time",
+        "end_time",
+        "correct_chars",
+        "total_chars_typed",
+        "keystrokes",
+        "current_word_start",
+        "text_stream",
+        "speed_counts",
+        "speed_bucket",
+    )
+
+    def __init__(self, target_text: str, duration_seconds: int, clock: Optional[Clock] = None,
+                 text_stream: Optional[Iterator[str]] = None):
         """
         Initialize typing engine with target text and duration.
 
         Args:
             target_text: The text that user must type
             duration_seconds: Test duration (30, 60, or 90 seconds)
+            clock: Callable returning integer nanoseconds (default: time.perf_counter_ns)
+            text_stream: Optional iterator of further text chunks, appended to target_text
+                as the cursor nears its end (see WordProvider.stream)
         """
         self.target_text = target_text
         self.duration_seconds = duration_seconds
+        self.clock = clock or default_clock
 
         # Typing state variables
-        self.input_text = ""
+        # Typed code points and per-position status, preallocated to the text length
+        self.typed_codes = array("I", [0]) * len(target_text)
+        self.char_status = bytearray(len(target_text))
         self.char_index = 0
         self.is_active = False
-        self.start_time = None
-        self.end_time = None
+        self.start_time = None  # Clock nanoseconds
+        self.end_time = None  # Clock nanoseconds
 
         # Statistics tracking
         self.correct_chars = 0
         self.total_chars_typed = 0
-        self.keystrokes = []  # List of (char, is_correct, timestamp)
+        self.keystrokes = KeystrokeLog()  # Columnar (code, char, timestamp) log
 
         # Current word tracking for backspace restriction
         self.current_word_start = 0  # Character index where current word begins
 
+        # Ring of correct characters per SPEED_INTERVAL_NS; speed_bucket is the interval
+        # (counted from start_time) that the newest slot holds
+        self.speed_counts = array("I", [0]) * SPEED_BUCKETS
+        self.speed_bucket = 0
+
+        self.text_stream = text_stream
+        self.fill_lookahead()
+
+    @classmethod
+    def from_keystrokes(cls, keystrokes: KeystrokeLog, duration_seconds: int,
+                        elapsed_time: float) -> "TypingEngine":
+        """
+        Rebuild a finished engine from a stored keystroke log, so the WPM history
+        series of a past test can be recomputed.
+
+        Args:
+            keystrokes: Log with timestamps in nanoseconds since the test start
+            duration_seconds: Test duration
+            elapsed_time: Seconds the test actually ran
+
+        Returns:
+            Inactive engine with start_time 0 and end_time at elapsed_time
+        """
+        engine = cls("", duration_seconds)
+        engine.keystrokes = keystrokes
+        engine.start_time = 0
+        engine.end_time = round(elapsed_time * NS_PER_SECOND)
+        correct_prefix, typed_prefix = keystrokes.cumulative_counts()
+        engine.correct_chars = correct_prefix[-1]
+        engine.total_chars_typed = typed_prefix[-1]
+        return engine
+
     def calculate_current_word_start(self) -> int:
         """
         Find the starting index of the current word (last space + 1).
+        The value is kept up to date by handle_keypress, so this is O(1).
 
         Returns:
             Index of current word start
         """
-        # Search backwards from char_index to find the last space
-        for i in range(self.char_index - 1, -1, -1):
-            if self.target_text[i] == " ":
-                return i + 1
-        return 0  # Beginning of text if no space found
+        return self.current_word_start
+
+    def extend_text(self, text: str) -> None:
+        """
+        Append text to the end of the target text.
+        The input and status buffers grow by doubling, so appends are amortized O(chunk).
+
+        Args:
+            text: Text to append (including any leading space)
+        """
+        new_length = len(self.target_text) + len(text)
+        capacity = len(self.char_status)
+        if new_length > capacity:
+            grow = max(new_length, capacity * 2) - capacity
+            self.typed_codes.extend(array("I", [0]) * grow)
+            self.char_status.extend(bytes(grow))
+        self.target_text += text
+
+    def fill_lookahead(self) -> int:
+        """
+        Pull chunks from the text stream until STREAM_LOOKAHEAD_CHARS are left to type.
+
+        Returns:
+            Number of characters appended
+        """
+        appended = 0
+        while (self.text_stream is not None
+               and len(self.target_text) - self.char_index < STREAM_LOOKAHEAD_CHARS):
+            try:
+                chunk = next(self.text_stream)
+            except StopIteration:
+                self.text_stream = None
+                break
+            self.extend_text(chunk)
+            appended += len(chunk)
+        return appended
+
+    @property
+    def input_text(self) -> str:
+        """Text typed so far, materialized from the input buffer on access."""
+        return "".join(map(chr, self.typed_codes[:self.char_index]))
 
     def handle_keypress(self, char: str) -> Tuple[bool, int]:
         """
@@ -79,16 +289,62 @@ class TypingEngine:
         target_char = self.target_text[self.char_index]
         is_correct = char == target_char
 
+        now = self.clock()
         if is_correct:
             self.correct_chars += 1
+            bucket = (now - self.start_time) // SPEED_INTERVAL_NS
+            if bucket > self.speed_bucket:
+                self._advance_speed_bucket(now)
+            self.speed_counts[bucket % SPEED_BUCKETS] += 1
 
-        self.input_text += char
+        self.typed_codes[self.char_index] = ord(char)
+        self.char_status[self.char_index] = STATUS_CORRECT if is_correct else STATUS_ERROR
         self.total_chars_typed += 1
         self.char_index += 1
-        self.keystrokes.append((char, is_correct, time.time()))
+        if target_char == " ":
+            # Crossing a space starts a new word; backspace can't return past it
+            self.current_word_start = self.char_index
+            if self.text_stream is not None:
+                self.fill_lookahead()
+        self.keystrokes.append(EVENT_CORRECT if is_correct else EVENT_INCORRECT, char, now)
 
         return is_correct, self.char_index
 
+    def _advance_speed_bucket(self, now: int) -> int:
+        """
+        Move the speed ring forward to the interval containing `now`, zeroing the
+        slots of intervals skipped without keystrokes. Costs at most SPEED_BUCKETS steps.
+
+        Args:
+            now: Clock nanoseconds
+
+        Returns:
+            The interval containing `now`, counted from start_time
+        """
+        bucket = max(0, now - self.start_time) // SPEED_INTERVAL_NS
+        if bucket > self.speed_bucket:
+            for skipped in range(max(self.speed_bucket + 1, bucket - SPEED_BUCKETS + 1), bucket + 1):
+                self.speed_counts[skipped % SPEED_BUCKETS] = 0
+            self.speed_bucket = bucket
+        return bucket
+
+    def get_speed_samples(self) -> List[float]:
+        """
+        WPM in each recent completed interval, read from the speed ring.
+        Only the ring is read, never the keystroke log, so the cost is fixed by SPEED_BUCKETS.
+
+        Returns:
+            Up to SPEED_BUCKETS - 1 WPM values, oldest first
+        """
+        if self.start_time is None:
+            return []
+        end_time = self.end_time if self.end_time is not None else self.clock()
+        current = self._advance_speed_bucket(end_time)
+        first = max(0, current - SPEED_BUCKETS + 1)
+        # Correct characters -> words (5 chars) per minute of interval
+        scale = 60 * NS_PER_SECOND / SPEED_INTERVAL_NS / 5.0
+        return [self.speed_counts[bucket % SPEED_BUCKETS] * scale for bucket in range(first, current)]
+
     def handle_backspace(self) -> int:
         """
         Handle backspace with restriction: only allow within current word.
@@ -100,15 +356,12 @@ class TypingEngine:
         if self.char_index <= 0:
             return self.char_index
 
-        # Calculate where current word starts
-        current_word_start = self.calculate_current_word_start()
-
         # Only allow backspace if not at word boundary
-        if self.char_index > current_word_start:
+        if self.char_index > self.current_word_start:
             self.char_index -= 1
-            self.input_text = self.input_text[:-1]
+            self.char_status[self.char_index] = STATUS_UNWRITTEN
             self.total_chars_typed += 1  # Backspace counts as a keystroke
-            self.keystrokes.append(("BACKSPACE", False, time.time()))
+            self.keystrokes.append(EVENT_BACKSPACE, "", self.clock())
 
             return self.char_index
         else:
@@ -119,7 +372,7 @@ class TypingEngine:
         """Start the test timer on first keypress."""
         if not self.is_active:
             self.is_active = True
-            self.start_time = time.time()
+            self.start_time = self.clock()
             logger.debug(f"Timer started. start_time={self.start_time}")
 
     def get_elapsed_time(self) -> float:
@@ -133,9 +386,8 @@ class TypingEngine:
             return 0
         
         # If test is finished, use end_time; otherwise use current time
-        if self.end_time is not None:
-            return self.end_time - self.start_time
-        return time.time() - self.start_time
+        end_time = self.end_time if self.end_time is not None else self.clock()
+        return (end_time - self.start_time) / NS_PER_SECOND
 
     def is_time_exceeded(self) -> bool:
         """
@@ -149,6 +401,7 @@ class TypingEngine:
     def is_completed(self) -> bool:
         """
         Check if test is completed (time limit reached).
+        A streaming engine only runs out of text if its stream ends.
 
         Returns:
             True if time limit exceeded or all text typed
@@ -213,19 +466,14 @@ class TypingEngine:
         """
         if index >= self.char_index:
             return "unwritten"
-        elif index < len(self.input_text):
-            # Check if this character matches
-            is_correct = self.target_text[index] == self.input_text[index]
-            return "correct" if is_correct else "error"
-        else:
-            return "unwritten"
+        return STATUS_NAMES[self.char_status[index]]
 
     def finish_test(self) -> None:
         """Mark test as finished and record end time."""
         logger.debug(f"finish_test: Called. is_active={self.is_active}, start_time={self.start_time}")
         
         self.is_active = False
-        self.end_time = time.time()
+        self.end_time = self.clock()
         
         # Calculate final metrics immediately
         final_wpm = self.calculate_wpm()
@@ -252,6 +500,31 @@ class TypingEngine:
             "char_index": self.char_index,
         }
 
+    def _sample_indices(self, interval: float) -> Tuple[List[float], List[int]]:
+        """
+        Map each sample time to the number of keystrokes recorded up to it.
+        Timestamps are sorted, so one forward bisect per sample covers the whole log.
+
+        Args:
+            interval: Time interval in seconds between samples
+
+        Returns:
+            Tuple of (sample times in seconds, keystroke counts at each sample)
+        """
+        elapsed = self.get_elapsed_time()
+        times = [i * interval for i in range(int(elapsed / interval) + 1)]
+        if self.start_time is None:
+            return times, [0] * len(times)
+
+        timestamps = self.keystrokes.timestamps
+        counts = []
+        idx = 0
+        for t in times:
+            idx = bisect_right(timestamps, self.start_time + round(t * NS_PER_SECOND), idx)
+            counts.append(idx)
+        del timestamps
+        return times, counts
+
     def get_wpm_history(self, interval: float = 1.0) -> List[float]:
         """
         Get WPM progression over time at specified intervals.
@@ -263,33 +536,110 @@ class TypingEngine:
         Returns:
             List of WPM values at each interval
         """
+        times, counts = self._sample_indices(interval)
+        correct_prefix, _ = self.keystrokes.cumulative_counts()
+
         wpm_history = []
-        elapsed = self.get_elapsed_time()
+        for t, idx in zip(times, counts):
+            if t == 0:
+                wpm_history.append(0)
+            else:
+                words = correct_prefix[idx] / 5.0
+                wpm_history.append(max(0, words / (t / 60.0)))
+
+        return wpm_history
+
+    def get_raw_wpm_history(self, interval: float = 1.0) -> List[float]:
+        """
+        Get raw WPM progression, counting every typed character whether correct or not.
+
+        Args:
+            interval: Time interval in seconds between data points (default: 1.0)
+
+        Returns:
+            List of raw WPM values at each interval
+        """
+        times, counts = self._sample_indices(interval)
+        _, typed_prefix = self.keystrokes.cumulative_counts()
 
-        # Generate data points at regular intervals
-        for t in [i * interval for i in range(int(elapsed / interval) + 1)]:
+        wpm_history = []
+        for t, idx in zip(times, counts):
+            if t == 0:
+                wpm_history.append(0)
+            else:
+                words = typed_prefix[idx] / 5.0
+                wpm_history.append(max(0, words / (t / 60.0)))
+
+        return wpm_history
+
+    def get_net_wpm_history(self, interval: float = 1.0) -> List[float]:
+        """
+        Get net WPM progression.
+        Formula: (Typed Characters / 5 - Errors) / (Time in Minutes), where errors are incorrect keystrokes.
+
+        Args:
+            interval: Time interval in seconds between data points (default: 1.0)
+
+        Returns:
+            List of net WPM values at each interval (never below 0)
+        """
+        times, counts = self._sample_indices(interval)
+        correct_prefix, typed_prefix = self.keystrokes.cumulative_counts()
+
+        wpm_history = []
+        for t, idx in zip(times, counts):
             if t == 0:
                 wpm_history.append(0)
             else:
-                # Count correct chars up to time t
-                correct_at_time = sum(
-                    1 for char, is_correct, ts in self.keystrokes
-                    if ts - self.start_time <= t and is_correct
+                errors = typed_prefix[idx] - correct_prefix[idx]
+                words = typed_prefix[idx] / 5.0 - errors
+                wpm_history.append(max(0, words / (t / 60.0)))
+
+        return wpm_history
+
+    def get_rolling_wpm_history(self, interval: float = 1.0, window: float = 5.0) -> List[float]:
+        """
+        Get WPM over a trailing window at each interval, showing bursts and slowdowns.
+
+        Args:
+            interval: Time interval in seconds between data points (default: 1.0)
+            window: Width of the trailing window in seconds (default: 5.0)
+
+        Returns:
+            List of rolling WPM values at each interval
+        """
+        times, counts = self._sample_indices(interval)
+        correct_prefix, _ = self.keystrokes.cumulative_counts()
+
+        wpm_history = []
+        window_start = 0
+        timestamps = self.keystrokes.timestamps
+        for t, idx in zip(times, counts):
+            if t == 0:
+                wpm_history.append(0)
+                continue
+            span = min(window, t)
+            if t > window:
+                # Keystrokes at or before (t - window) fall outside the window
+                window_start = bisect_right(
+                    timestamps, self.start_time + round((t - window) * NS_PER_SECOND), window_start, idx
                 )
-                words = correct_at_time / 5.0
-                wpm = words / (t / 60.0)
-                wpm_history.append(max(0, wpm))
+            words = (correct_prefix[idx] - correct_prefix[window_start]) / 5.0
+            wpm_history.append(max(0, words / (span / 60.0)))
+        del timestamps
 
         return wpm_history
 
     def reset(self) -> None:
         """Reset all test state variables for new test."""
-        self.input_text = ""
+        self.char_status[:] = bytes(len(self.char_status))
         self.char_index = 0
         self.is_active = False
         self.start_time = None
         self.end_time = None
         self.correct_chars = 0
         self.total_chars_typed = 0
-        self.keystrokes = []
+        self.keystrokes.clear()
         self.current_word_start = 0
+        self.speed_counts[:] = array("I", [0]) * SPEED_BUCKETS
+        self.speed_bucket = 0
@@ -0,0 +1,106 @@
+"""
+Keystroke Event Codec for ZenType
+Packs a test's keystroke log into a compact, compressed binary blob and back.
+"""
+
+import zlib
+from array import array
+from typing import Tuple
+from engine import KeystrokeLog
+
+# Leading byte of every blob, bumped if the layout ever changes
+FORMAT_VERSION = 1
+
+# Timestamps are stored at microsecond resolution
+NS_PER_US = 1000
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(data: bytes, offset: int, count: int) -> Tuple[array, int]:
+    """
+    Read consecutive unsigned LEB128 varints.
+
+    Args:
+        data: Decompressed payload
+        offset: Position of the first varint
+        count: Number of varints to read
+
+    Returns:
+        Tuple of (values as array('q'), offset after the last varint)
+    """
+    values = array("q")
+    for _ in range(count):
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        values.append(value)
+    return values, offset
+
+
+def encode_events(log: KeystrokeLog, start_time: int) -> bytes:
+    """
+    Encode a keystroke log as a compressed blob.
+    Timestamps become microsecond deltas from the previous keystroke (the first from
+    start_time) and each column is stored contiguously, which compresses well.
+
+    Args:
+        log: Keystroke log to encode
+        start_time: Test start in clock nanoseconds
+
+    Returns:
+        Version byte followed by the zlib-compressed payload
+    """
+    payload = bytearray()
+    _write_varint(payload, len(log))
+
+    previous_us = start_time // NS_PER_US
+    for timestamp in log.timestamps:
+        current_us = max(previous_us, timestamp // NS_PER_US)
+        _write_varint(payload, current_us - previous_us)
+        previous_us = current_us
+
+    payload += log.codes
+    for char in log.chars:
+        _write_varint(payload, char)
+
+    return bytes([FORMAT_VERSION]) + zlib.compress(bytes(payload), 9)
+
+
+def decode_events(blob: bytes) -> KeystrokeLog:
+    """
+    Decode a blob produced by encode_events.
+
+    Args:
+        blob: Encoded keystroke events
+
+    Returns:
+        KeystrokeLog with timestamps in nanoseconds since the test start
+    """
+    if not blob or blob[0] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported keystroke event format: {blob[:1]!r}")
+
+    data = zlib.decompress(blob[1:])
+    (count,), offset = _read_varints(data, 0, 1)
+
+    deltas, offset = _read_varints(data, offset, count)
+    timestamps = array("q")
+    elapsed_us = 0
+    for delta in deltas:
+        elapsed_us += delta
+        timestamps.append(elapsed_us * NS_PER_US)
+
+    codes = bytearray(data[offset:offset + count])
+    chars, _ = _read_varints(data, offset + count, count)
+    return KeystrokeLog.from_columns(timestamps, codes, array("I", chars))
@@ -0,0 +1,194 @@
+"""
+Virtualized History Window for ZenType
+Keeps a small buffer of result rows around the visible part of the history list,
+loaded from keyset pages, so scrolling cost doesn't depend on history size.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from database import HISTORY_PAGE_SIZE
+
+# Key that sorts after every (timestamp_ms, id), used to start a page at a point in time
+_MAX_ID = 2 ** 63 - 1
+
+
+class ResultWindow:
+    """
+    Scrollable window over the results matching some filters, newest first.
+
+    `buffer` holds consecutive rows around the view and `top` is the buffer position
+    of the first visible row. Scrolling extends the buffer with keyset pages on
+    either side and trims rows far from the view. Positions are expressed in time
+    between the oldest and newest matching result, so jumping anywhere is one
+    indexed query instead of an OFFSET scan.
+    """
+
+    def __init__(self, store, visible_rows: int, buffer_rows: int = 4 * HISTORY_PAGE_SIZE,
+                 page_size: int = HISTORY_PAGE_SIZE):
+        """
+        Initialize an empty window.
+
+        Args:
+            store: Object with get_results_page, get_timestamp_range and count_results,
+                e.g. DatabaseManager
+            visible_rows: Rows shown at once
+            buffer_rows: Most rows kept in memory
+            page_size: Rows fetched per query
+        """
+        self.store = store
+        self.visible_rows = visible_rows
+        self.buffer_rows = max(buffer_rows, visible_rows + 2 * page_size)
+        self.page_size = page_size
+        self.filters: Dict = {}
+        self.buffer: List[Dict] = []
+        self.top = 0
+        self.total = 0
+        self.time_range: Optional[Tuple[int, int]] = None
+        # True while buffer[0] is the newest matching result
+        self.at_newest = False
+
+    @staticmethod
+    def _key(result: Dict) -> Tuple[int, int]:
+        """Keyset pagination key of a row."""
+        return result["timestamp_ms"], result["id"]
+
+    def _page(self, **keyset) -> List[Dict]:
+        return self.store.get_results_page(limit=self.page_size, **keyset, **self.filters)
+
+    def set_filters(self, duration: Optional[int] = None, since: Optional[datetime] = None,
+                    until: Optional[datetime] = None) -> None:
+        """
+        Show the newest results matching new filters.
+
+        Args:
+            duration: Only tests of this duration
+            since: Only tests at or after this time
+            until: Only tests before this time
+        """
+        self.filters = {"duration": duration, "since": since, "until": until}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reload counts and go back to the newest results."""
+        self.total = self.store.count_results(**self.filters)
+        self.time_range = self.store.get_timestamp_range(**self.filters)
+        self.buffer = []
+        self.at_newest = True
+        self.top = self._load_around(0)
+
+    def _load_around(self, top: int) -> int:
+        """
+        Buffer rows top .. top + visible_rows, fetching pages on either side as needed.
+
+        Args:
+            top: Wanted buffer position of the first visible row
+
+        Returns:
+            top, clamped to the rows that exist and adjusted for trimming
+        """
+        while top + self.visible_rows > len(self.buffer):
+            page = self._page(before=self._key(self.buffer[-1])) if self.buffer else self._page()
+            if not page:
+                break
+            self.buffer.extend(page)
+
+        top = min(top, len(self.buffer) - self.visible_rows)
+        while top < 0 and self.buffer:
+            page = self._page(after=self._key(self.buffer[0]))
+            if len(page) < self.page_size:
+                self.at_newest = True
+            if not page:
+                break
+            self.buffer[:0] = page
+            top += len(page)
+        top = max(0, top)
+
+        # Drop rows far from the view: newer rows above it first, then older rows below it
+        excess = len(self.buffer) - self.buffer_rows
+        if excess > 0:
+            cut = min(excess, max(0, top - self.page_size))
+            if cut:
+                del self.buffer[:cut]
+                top -= cut
+                self.at_newest = False
+            del self.buffer[max(self.buffer_rows, top + self.visible_rows + self.page_size):]
+        return top
+
+    def scroll(self, rows: int) -> None:
+        """
+        Scroll by a number of rows.
+
+        Args:
+            rows: Rows to move; positive scrolls toward older results
+        """
+        self.top = self._load_around(self.top + rows)
+
+    def jump_to(self, fraction: float) -> None:
+        """
+        Show the results at a point in time.
+
+        Args:
+            fraction: 0.0 for the newest result, 1.0 for the oldest
+        """
+        if self.time_range is None:
+            return
+        oldest, newest = self.time_range
+        moment = round(newest - min(1.0, max(0.0, fraction)) * (newest - oldest))
+        self.buffer = self._page(before=(moment, _MAX_ID))
+        self.at_newest = moment >= newest
+        self.top = self._load_around(0)
+
+    def load_newer(self) -> int:
+        """
+        Take in results saved since the window was filled, without reloading it.
+        If the newest rows are buffered, the new rows are fetched with one keyset
+        query and prepended; the view stays on the same rows unless it was at the top.
+
+        Returns:
+            Number of rows added to the buffer
+        """
+        if not self.buffer:
+            self.refresh()
+            return len(self.buffer)
+        if not self.at_newest:
+            # New rows are far above the view; only the scrollbar needs updating
+            self.total = self.store.count_results(**self.filters)
+            self.time_range = self.store.get_timestamp_range(**self.filters)
+            return 0
+
+        added = []
+        while True:
+            key = self._key(added[0] if added else self.buffer[0])
+            page = self._page(after=key)
+            added[:0] = page
+            if len(page) < self.page_size:
+                break
+        if added:
+            self.buffer[:0] = added
+            if self.top > 0:
+                self.top += len(added)
+            self.total += len(added)
+            self.time_range = (self.time_range[0] if self.time_range else added[-1]["timestamp_ms"],
+                               added[0]["timestamp_ms"])
+            self.top = self._load_around(self.top)
+        return len(added)
+
+    def visible(self) -> List[Dict]:
+        """Rows currently in view, newest first."""
+        return self.buffer[self.top:self.top + self.visible_rows]
+
+    def scroll_fraction(self) -> Tuple[float, float]:
+        """
+        Scrollbar thumb for the view: its position in time and its share of all rows.
+
+        Returns:
+            Tuple of (first, last) fractions, as for a Tk scrollbar's set()
+        """
+        if not self.buffer or self.time_range is None or self.total <= self.visible_rows:
+            return 0.0, 1.0
+        oldest, newest = self.time_range
+        span = newest - oldest
+        first = (newest - self.buffer[self.top]["timestamp_ms"]) / span if span else 0.0
+        size = max(self.visible_rows / self.total, 0.02)
+        first = min(first, 1.0 - size)
+        return first, first + size
@@ -4,20 +4,59 @@ Main application file with UI and event handling.
 Uses customtkinter for modern UI and tkinter.Text for character-level typing control.
 """
 
+# Imported first so startup phases are timed from here (python -X zentype_startup main.py)
+from startup import timer as startup_timer
 import customtkinter as ctk
 from tkinter import Canvas
 import tkinter as tk
 import logging
-from words import WordProvider
-from engine import TypingEngine
-from database import DatabaseManager
-from datetime import datetime
+from words import WordProvider, MODE_ADAPTIVE, MODE_FREQUENCY, MODE_UNIFORM
+from corpus import BUILTIN_CORPUS, CorpusRegistry, default_registry
+from engine import SPEED_INTERVAL_NS, TypingEngine
+from persistence import ResultWriter
+from renderer import TagRenderer
+from charts import LineChart
+from scheduler import AfterScheduler
+from datetime import datetime, timedelta
 import math
 
+# The database, history paging and analytics are imported when first used, not at startup
+startup_timer.mark("imports")
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Delay used to coalesce stats pushes from a burst of keystrokes
+STATS_PUSH_DELAY_MS = 50
+# Refresh interval for WPM while the user pauses (WPM decays as time passes)
+STATS_IDLE_REFRESH_MS = 1000
+# How often the UI collects notifications from the background result writer
+PERSISTENCE_POLL_MS = 250
+# How long a save error stays visible in the status line
+STATUS_MESSAGE_MS = 5000
+# Longest wait for queued results to be written when the window closes
+WRITER_CLOSE_TIMEOUT_S = 5.0
+# Display lines kept above the cursor's line; older lines are deleted from the widget
+DISPLAY_HISTORY_LINES = 1
+# History rows shown at once; the list reuses this many row widgets
+HISTORY_VISIBLE_ROWS = 10
+# History rows moved per mouse wheel notch
+HISTORY_WHEEL_ROWS = 3
+# History filters, by label: test duration and number of calendar days including today
+HISTORY_DURATIONS = {"All": None, "30s": 30, "60s": 60, "90s": 90}
+HISTORY_DATE_RANGES = {"All time": None, "Today": 1, "Last 7 days": 7, "Last 30 days": 30, "Last year": 365}
+# Results chart size in pixels and seconds between its WPM samples
+CHART_WIDTH = 600
+CHART_HEIGHT = 200
+CHART_INTERVAL_S = 1.0
+# Live speed sparkline size in pixels; it redraws once per speed interval
+SPARKLINE_WIDTH = 160
+SPARKLINE_HEIGHT = 48
+SPARKLINE_REFRESH_MS = SPEED_INTERVAL_NS // 1_000_000
+# Word selection modes offered on the typing screen, by button label
+WORD_MODES = {"Uniform": MODE_UNIFORM, "Common": MODE_FREQUENCY, "Adaptive": MODE_ADAPTIVE}
+
 
 class TypingDisplay(ctk.CTkFrame):
     """
@@ -57,44 +96,54 @@ class TypingDisplay(ctk.CTkFrame):
         # All input will be handled manually through our event bindings
         self.text_widget.config(state="normal")
 
+        # Incremental tag renderer (re-tags only changed characters)
+        self.renderer = TagRenderer(self.text_widget)
+
     def display_text(self, text: str):
         """Set initial text in display widget."""
         self.text_widget.config(state="normal")
         self.text_widget.delete("1.0", "end")
         self.text_widget.insert("1.0", text)
         # Keep in normal state so key bindings work
-        self.update_colors(text, "", 0)
+        self.renderer.reset(len(text))
+
+    @property
+    def text_end(self) -> int:
+        """Target text offset just past the last displayed character."""
+        return self.renderer.text_length
+
+    def append_text(self, text: str):
+        """Append streamed text without re-inserting what is already displayed."""
+        self.text_widget.insert("end-1c", text)
+        self.renderer.append(len(text))
 
-    def update_colors(self, target_text: str, input_text: str, char_index: int):
+    def scroll_to(self, char_index: int):
         """
-        Update character colors based on typing progress.
-        Unwritten: #646669, Correct: #D1D0C5, Error: #CA4754
+        Keep the cursor near the top by deleting display lines that scrolled away,
+        so a long streamed test holds only a window of its text in the widget.
 
         Args:
-            target_text: The text being typed
-            input_text: User's input so far
             char_index: Current position in target text
         """
-        # Remove all existing tags
-        for tag in ["unwritten", "correct", "error", "cursor"]:
-            self.text_widget.tag_remove(tag, "1.0", "end")
-
-        # Apply color tags based on character status
-        for i, char in enumerate(target_text):
-            pos_start = f"1.0+{i}c"
-            pos_end = f"1.0+{i+1}c"
-
-            if i >= char_index:
-                # Unwritten characters
-                self.text_widget.tag_add("unwritten", pos_start, pos_end)
-            elif i < len(input_text):
-                # Compare with input
-                if target_text[i] == input_text[i]:
-                    self.text_widget.tag_add("correct", pos_start, pos_end)
-                else:
-                    self.text_widget.tag_add("error", pos_start, pos_end)
-            else:
-                self.text_widget.tag_add("unwritten", pos_start, pos_end)
+        keep_from = self.text_widget.index(
+            f"{self.renderer.index(char_index)} display linestart"
+            f" -{DISPLAY_HISTORY_LINES} display lines display linestart"
+        )
+        removed = len(self.text_widget.get("1.0", keep_from))
+        if removed:
+            # Whole display lines go, so the remaining text wraps exactly as before
+            self.text_widget.delete("1.0", keep_from)
+            self.renderer.trim(removed)
+
+    def render_progress(self, char_index: int, status_of):
+        """
+        Update character colors from per-position statuses without materializing the input text.
+
+        Args:
+            char_index: Current position in target text
+            status_of: Callable returning "unwritten", "correct" or "error" for a position
+        """
+        self.renderer.render(char_index, status_of)
 
 
 class StatisticsPanel(ctk.CTkFrame):
@@ -139,15 +188,20 @@ class StatisticsPanel(ctk.CTkFrame):
         self.accuracy_unit.pack(side="left", padx=(0, 40))
 
     def update_stats(self, wpm: float, accuracy: float):
-        """Update displayed statistics."""
-        self.wpm_label.configure(text=f"{int(wpm)}")
-        self.accuracy_label.configure(text=f"{accuracy:.1f}%")
+        """Update displayed statistics, skipping labels whose text is unchanged."""
+        wpm_text = f"{int(wpm)}"
+        accuracy_text = f"{accuracy:.1f}%"
+        if wpm_text != self.wpm_label.cget("text"):
+            self.wpm_label.configure(text=wpm_text)
+        if accuracy_text != self.accuracy_label.cget("text"):
+            self.accuracy_label.configure(text=accuracy_text)
 
 
 class TypingScreen(ctk.CTkFrame):
     """Main typing test screen with text display and real-time feedback."""
 
-    def __init__(self, parent, on_test_complete, on_show_history, **kwargs):
+    def __init__(self, parent, on_test_complete, on_show_history, result_writer: ResultWriter,
+                 corpora: CorpusRegistry, **kwargs):
         super().__init__(parent, **kwargs)
         self.configure(fg_color="#2C2E31")
 
@@ -155,8 +209,16 @@ class TypingScreen(ctk.CTkFrame):
         self.on_show_history = on_show_history
         self.engine: TypingEngine | None = None
         self.selected_duration = 30
-        self.text_provider = WordProvider()
-        self.data_manager = DatabaseManager()
+        self.corpora = corpora
+        # One provider per corpus, so adaptive indexes survive switching back and forth
+        self.text_provider = WordProvider(corpora.get(BUILTIN_CORPUS))
+        self.providers = {BUILTIN_CORPUS: self.text_provider}
+        self.current_corpus = BUILTIN_CORPUS
+        self.result_writer = result_writer
+        self.result_writer.add_result_listener(self.on_result_saved)
+        self.scheduler = AfterScheduler(self)
+        self._pushed_counters = None
+        self._scrolled_word_start = 0
 
         # Header with title
         header = ctk.CTkLabel(
@@ -192,9 +254,57 @@ class TypingScreen(ctk.CTkFrame):
             btn.pack(side="left", padx=5)
             setattr(self, f"btn_{duration}", btn)
 
-        # Statistics panel
-        self.stats_panel = StatisticsPanel(self)
-        self.stats_panel.pack(pady=20)
+        # Word selection: uniform, weighted by word frequency, or drilling the
+        # user's slow and error-prone bigrams
+        self.mode_selector = ctk.CTkSegmentedButton(
+            duration_frame,
+            values=list(WORD_MODES),
+            font=("JetBrains Mono", 12),
+            height=30,
+            fg_color="#3C3E42",
+            selected_color="#E2B714",
+            selected_hover_color="#E2B714",
+            unselected_color="#3C3E42",
+            text_color="#D1D0C5",
+            command=self.set_word_mode,
+        )
+        self.mode_selector.set("Uniform")
+        self.mode_selector.pack(side="left", padx=(20, 5))
+
+        # Corpus files are only opened once selected here
+        self.corpus_menu = ctk.CTkOptionMenu(
+            duration_frame,
+            values=corpora.names(),
+            font=("JetBrains Mono", 12),
+            width=120,
+            height=30,
+            fg_color="#3C3E42",
+            button_color="#3C3E42",
+            text_color="#D1D0C5",
+            command=self.select_corpus,
+        )
+        self.corpus_menu.set(BUILTIN_CORPUS)
+        self.corpus_menu.pack(side="left", padx=5)
+
+        # Statistics panel with the live speed sparkline beside it
+        stats_row = ctk.CTkFrame(self, fg_color="#2C2E31")
+        stats_row.pack(pady=20)
+
+        self.stats_panel = StatisticsPanel(stats_row)
+        self.stats_panel.pack(side="left")
+
+        sparkline_canvas = Canvas(
+            stats_row,
+            width=SPARKLINE_WIDTH,
+            height=SPARKLINE_HEIGHT,
+            bg="#2C2E31",
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        sparkline_canvas.pack(side="left", padx=(0, 20))
+        self.sparkline = LineChart(
+            sparkline_canvas, SPARKLINE_WIDTH, SPARKLINE_HEIGHT, margin=4, x_labels=0, axes=False
+        )
 
         # Text display
         self.typing_display = TypingDisplay(self, height=200)
@@ -263,16 +373,64 @@ class TypingScreen(ctk.CTkFrame):
 
         self.reset_test()
 
+    def set_word_mode(self, label: str):
+        """Switch how test words are selected."""
+        self.text_provider.mode = WORD_MODES[label]
+        if self.text_provider.mode == MODE_ADAPTIVE:
+            self.refresh_adaptive_weights()
+        self.reset_test()
+
+    def select_corpus(self, name: str):
+        """Draw test words from another registered corpus."""
+        provider = self.providers.get(name)
+        if provider is None:
+            try:
+                words = self.corpora.get(name)
+                # len() maps the file, so a bad corpus fails here rather than mid-test
+                if not len(words):
+                    raise ValueError("corpus has no words")
+            except (OSError, ValueError) as e:
+                logger.error(f"Error opening corpus {name}: {e}")
+                self.status_label.configure(text=f"Could not open corpus {name}")
+                self.corpus_menu.set(self.current_corpus)
+                return
+            provider = self.providers[name] = WordProvider(words)
+        provider.mode = self.text_provider.mode
+        self.text_provider = provider
+        self.current_corpus = name
+        if provider.mode == MODE_ADAPTIVE:
+            self.refresh_adaptive_weights()
+        self.reset_test()
+
+    def refresh_adaptive_weights(self):
+        """Reload bigram difficulty from the latency statistics in the database."""
+        store = self.result_writer.store
+        self.text_provider.update_weights(
+            store.get_latency_stats(bigrams=True), store.get_latency_stats()
+        )
+
+    def on_result_saved(self, result_id: int, results: dict):
+        """Fold the saved test's latencies into the next adaptive text."""
+        if self.text_provider.mode == MODE_ADAPTIVE:
+            self.refresh_adaptive_weights()
+
     def init_test(self):
         """Initialize a new typing test."""
-        word_count = self.text_provider.get_word_count_for_duration(
-            self.selected_duration
+        # Stop timers and stats updates belonging to the previous test
+        self.scheduler.cancel_all()
+        self._pushed_counters = None
+
+        # Text is streamed in chunks as the cursor advances, so fast typists never run out.
+        # Frequency-weighted text would otherwise often repeat "the the"
+        text_stream = self.text_provider.stream(
+            no_repeats=self.text_provider.mode == MODE_FREQUENCY
         )
-        target_text = self.text_provider.generate_text(word_count)
 
-        self.engine = TypingEngine(target_text, self.selected_duration)
-        self.typing_display.display_text(target_text)
+        self.engine = TypingEngine("", self.selected_duration, text_stream=text_stream)
+        self._scrolled_word_start = 0
+        self.typing_display.display_text(self.engine.target_text)
         self.stats_panel.update_stats(0, 0)
+        self.sparkline.clear()
         self.status_label.configure(text="Press Start to begin typing...")
 
         # Bind keyboard events to the text widget itself for better control
@@ -297,9 +455,6 @@ class TypingScreen(ctk.CTkFrame):
         self.master.bind("<FocusIn>", self.on_focus_in)
         self.master.bind("<FocusOut>", self.on_focus_out)
 
-        # Start the update loop
-        self.update_stats_loop()
-
     def start_test(self):
         """Start the typing test and allow user input."""
         # Ensure engine is initialized (defensive check)
@@ -312,6 +467,9 @@ class TypingScreen(ctk.CTkFrame):
         # Start the test timer (safe to call multiple times - has guard)
         if self.engine is not None:
             self.engine.start_timer()
+            self.schedule_end_of_test()
+            self.schedule_stats_push()
+            self.refresh_sparkline()
         
         # Update status
         self.status_label.configure(text="Test started! Type away!")
@@ -351,7 +509,14 @@ class TypingScreen(ctk.CTkFrame):
         char = event.char
         if char and ord(char) >= 32:  # Printable characters only
             is_correct, idx = self.engine.handle_keypress(char)
+            if startup_timer.enabled and startup_timer.elapsed_ms("first keystroke") is None:
+                startup_timer.mark("first keystroke")
+                startup_timer.check_budget("first keystroke")
             self.update_display()
+            if self.engine.is_completed():
+                self.finish_test()
+            else:
+                self.schedule_stats_push()
 
         return "break"
 
@@ -360,6 +525,7 @@ class TypingScreen(ctk.CTkFrame):
         if self.engine and not self.engine.is_completed() and self.engine.is_active:
             self.engine.handle_backspace()
             self.update_display()
+            self.schedule_stats_push()
         return "break"
     
     def on_tab(self, event):
@@ -370,27 +536,76 @@ class TypingScreen(ctk.CTkFrame):
     def update_display(self):
         """Update text colors and statistics."""
         if self.engine is not None:
-            self.typing_display.update_colors(
-                self.engine.target_text, 
-                self.engine.input_text, 
-                self.engine.char_index
+            display = self.typing_display
+            if len(self.engine.target_text) > display.text_end:
+                display.append_text(self.engine.target_text[display.text_end:])
+            display.render_progress(
+                self.engine.char_index,
+                self.engine.get_character_status,
+            )
+            # Lines can only scroll away when the cursor enters a new word
+            if self.engine.current_word_start != self._scrolled_word_start:
+                self._scrolled_word_start = self.engine.current_word_start
+                display.scroll_to(self.engine.char_index)
+
+    def schedule_stats_push(self):
+        """Request a stats update; bursts of keystrokes are coalesced into one push."""
+        self.scheduler.schedule_once("stats_push", STATS_PUSH_DELAY_MS, self.push_stats)
+
+    def push_stats(self, refresh: bool = False):
+        """
+        Push WPM and accuracy to the statistics panel when the engine counters changed.
+        While the user pauses, an idle refresh keeps the decaying WPM current.
+
+        Args:
+            refresh: Recalculate even if the counters are unchanged
+        """
+        if self.engine is None or not self.engine.is_active:
+            return
+
+        counters = (self.engine.correct_chars, self.engine.total_chars_typed)
+        if refresh or counters != self._pushed_counters:
+            self._pushed_counters = counters
+            self.stats_panel.update_stats(
+                self.engine.calculate_wpm(), self.engine.calculate_accuracy()
             )
 
-    def update_stats_loop(self):
-        """Update statistics every 500ms."""
-        if self.engine and self.engine.is_active and not self.engine.is_completed():
-            wpm = self.engine.calculate_wpm()
-            accuracy = self.engine.calculate_accuracy()
-            self.stats_panel.update_stats(wpm, accuracy)
+        # Fires only if no keystroke arrives in the meantime
+        self.scheduler.schedule(
+            "stats_refresh", STATS_IDLE_REFRESH_MS, lambda: self.push_stats(refresh=True)
+        )
+
+    def refresh_sparkline(self):
+        """Redraw the live speed sparkline from the engine's speed ring, once per interval."""
+        if self.engine is None or not self.engine.is_active:
+            return
+        self.sparkline.plot(self.engine.get_speed_samples())
+        self.scheduler.schedule("sparkline", SPARKLINE_REFRESH_MS, self.refresh_sparkline)
+
+    def schedule_end_of_test(self):
+        """Schedule finish_test for the exact moment the time limit is reached."""
+        if self.engine is None:
+            return
+        remaining = self.engine.duration_seconds - self.engine.get_elapsed_time()
+        self.scheduler.schedule(
+            "end_of_test", math.ceil(max(0.0, remaining) * 1000), self.on_time_limit
+        )
 
-        if self.engine and not self.engine.is_completed():
-            self.after(500, self.update_stats_loop)
-        elif self.engine and self.engine.is_completed():
+    def on_time_limit(self):
+        """Finish the test when the end-of-test timer fires."""
+        if self.engine is None or not self.engine.is_active:
+            return
+        if self.engine.is_time_exceeded():
             self.finish_test()
+        else:
+            # Timer fired early (clock granularity); wait for the remainder
+            self.schedule_end_of_test()
 
     def finish_test(self):
         """Complete test and show results."""
-        if self.engine is not None:
+        if self.engine is not None and self.engine.end_time is None:
+            self.scheduler.cancel_all()
+
             logger.debug("TypingScreen.finish_test: Calling engine.finish_test()")
             self.engine.finish_test()
             
@@ -399,7 +614,10 @@ class TypingScreen(ctk.CTkFrame):
             
             logger.debug(f"TypingScreen.finish_test: Results: {results}")
             
-            self.data_manager.add_result(results)
+            # Saved on the writer thread; the engine is replaced, not reused, by the next test
+            self.result_writer.submit(
+                results, self.engine.keystrokes, self.engine.start_time, self.engine.target_text
+            )
             # Re-enable start button
             self.start_button.configure(state="normal")
             
@@ -450,13 +668,14 @@ class ResultsScreen(ctk.CTkFrame):
         # Chart canvas
         self.chart_canvas = Canvas(
             self,
-            width=600,
-            height=200,
+            width=CHART_WIDTH,
+            height=CHART_HEIGHT,
             bg="#2C2E31",
             highlightthickness=0,
             borderwidth=0,
         )
         self.chart_canvas.pack(pady=20)
+        self.chart = LineChart(self.chart_canvas, CHART_WIDTH, CHART_HEIGHT)
 
         # Buttons
         button_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
@@ -503,62 +722,114 @@ class ResultsScreen(ctk.CTkFrame):
 
     def draw_chart(self, engine):
         """Draw WPM progression chart on canvas."""
-        self.chart_canvas.delete("all")
+        self.chart.plot(engine.get_wpm_history(interval=CHART_INTERVAL_S), x_step=CHART_INTERVAL_S)
 
-        # Get WPM history
-        wpm_history = engine.get_wpm_history(interval=1.0)
 
-        if not wpm_history or len(wpm_history) < 2:
-            return
+def format_result_row(result: dict) -> str:
+    """One line of the history list."""
+    return (f"{result.get('wpm', 0):.0f} WPM | {result.get('accuracy', 0):.1f}% | "
+            f"{result.get('duration', 0)}s | {result.get('timestamp', 'N/A').split('T')[0]}")
 
-        # Canvas dimensions
-        canvas_width = 600
-        canvas_height = 200
-        margin = 40
 
-        # Data ranges
-        max_wpm = max(wpm_history) if wpm_history else 1
-        max_time = len(wpm_history) - 1
+class HistoryList(ctk.CTkFrame):
+    """
+    Virtualized result list: a fixed set of row labels shows the rows in view of a
+    ResultWindow, so the widget count stays constant however long the history is.
+    """
 
-        # Draw axes
-        self.chart_canvas.create_line(
-            margin, canvas_height - margin, canvas_width - margin, canvas_height - margin,
-            fill="#646669", width=2
-        )
-        self.chart_canvas.create_line(
-            margin, margin, margin, canvas_height - margin,
-            fill="#646669", width=2
-        )
+    def __init__(self, parent, store, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.configure(fg_color="#3C3E42")
 
-        # Draw grid lines and labels
-        for i in range(0, max(int(max_time) + 1, 2), max(1, int(max_time / 4))):
-            x = margin + (i / max_time) * (canvas_width - 2 * margin) if max_time > 0 else margin
-            self.chart_canvas.create_text(
-                x, canvas_height - margin + 20,
-                text=f"{i}s", fill="#646669", font=("JetBrains Mono", 10)
-            )
+        from history import ResultWindow
 
-        # Draw WPM history line
-        for i in range(len(wpm_history) - 1):
-            x1 = margin + (i / max_time) * (canvas_width - 2 * margin) if max_time > 0 else margin
-            y1 = canvas_height - margin - (wpm_history[i] / max_wpm) * (canvas_height - 2 * margin) if max_wpm > 0 else canvas_height - margin
+        self.window = ResultWindow(store, HISTORY_VISIBLE_ROWS)
+        self._shown_texts = [None] * HISTORY_VISIBLE_ROWS
 
-            x2 = margin + ((i + 1) / max_time) * (canvas_width - 2 * margin) if max_time > 0 else margin
-            y2 = canvas_height - margin - (wpm_history[i + 1] / max_wpm) * (canvas_height - 2 * margin) if max_wpm > 0 else canvas_height - margin
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
 
-            self.chart_canvas.create_line(x1, y1, x2, y2, fill="#E2B714", width=2)
-            self.chart_canvas.create_oval(x1 - 3, y1 - 3, x1 + 3, y1 + 3, fill="#E2B714")
+        rows_frame = ctk.CTkFrame(self, fg_color="#3C3E42")
+        rows_frame.pack(side="left", fill="both", expand=True, pady=5)
+        self.row_labels = []
+        for _ in range(HISTORY_VISIBLE_ROWS):
+            label = ctk.CTkLabel(
+                rows_frame,
+                text="",
+                font=("JetBrains Mono", 11),
+                text_color="#D1D0C5",
+                anchor="w",
+            )
+            label.pack(anchor="w", fill="x", padx=10, pady=2)
+            self.row_labels.append(label)
+
+        for widget in [self, rows_frame, *self.row_labels]:
+            widget.bind("<MouseWheel>", self.on_mousewheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_rows(-HISTORY_WHEEL_ROWS))
+            widget.bind("<Button-5>", lambda e: self.scroll_rows(HISTORY_WHEEL_ROWS))
+
+    def set_filters(self, **filters):
+        """Show the newest results matching new filters (see ResultWindow.set_filters)."""
+        self.window.set_filters(**filters)
+        self.render()
+
+    def load_newer(self):
+        """Show results saved since the list was filled (see ResultWindow.load_newer)."""
+        if self.window.load_newer():
+            self.render()
+        else:
+            self.scrollbar.set(*self.window.scroll_fraction())
+
+    def scroll_rows(self, rows: int):
+        """Scroll by a number of rows (positive scrolls toward older results)."""
+        self.window.scroll(rows)
+        self.render()
+
+    def on_scrollbar(self, *args):
+        """Handle scrollbar drags and clicks ("moveto" or "scroll" commands)."""
+        if args and args[0] == "moveto":
+            self.window.jump_to(float(args[1]))
+            self.render()
+        elif args and args[0] == "scroll":
+            step = HISTORY_VISIBLE_ROWS if len(args) > 2 and args[2] == "pages" else 1
+            self.scroll_rows(int(float(args[1])) * step)
+
+    def on_mousewheel(self, event):
+        """Scroll a few rows per wheel notch."""
+        self.scroll_rows(-HISTORY_WHEEL_ROWS if event.delta > 0 else HISTORY_WHEEL_ROWS)
+
+    def render(self):
+        """Show the rows in view, reconfiguring only labels whose text changed."""
+        rows = self.window.visible()
+        for i, label in enumerate(self.row_labels):
+            if i < len(rows):
+                text = format_result_row(rows[i])
+            elif i == 0:
+                text = "No tests match these filters"
+            else:
+                text = ""
+            if text != self._shown_texts[i]:
+                self._shown_texts[i] = text
+                label.configure(text=text)
+        self.scrollbar.set(*self.window.scroll_fraction())
 
 
 class HistoryScreen(ctk.CTkFrame):
-    """Display typing test history and statistics."""
+    """
+    Display typing test history and statistics.
+    Built once and kept alive: each saved result updates the totals in memory and
+    adds its row to the list, instead of rebuilding the screen on every visit.
+    """
 
-    def __init__(self, parent, on_back_to_typing, **kwargs):
+    def __init__(self, parent, on_back_to_typing, result_writer: ResultWriter, **kwargs):
         super().__init__(parent, **kwargs)
         self.configure(fg_color="#2C2E31")
 
         self.on_back_to_typing = on_back_to_typing
-        self.data_manager = DatabaseManager()
+        self.data_manager = result_writer.store
+        result_writer.add_result_listener(self.on_result_saved)
+        # Parts that query the database are refreshed when the screen is next shown
+        self._stale = False
 
         # Back button at top-left
         back_button_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
@@ -582,86 +853,170 @@ class HistoryScreen(ctk.CTkFrame):
         )
         title.pack(pady=(0, 20))
 
-        # Overall statistics
-        stats = self.data_manager.get_statistics()
-        
-        # Check if there's any history
-        if stats['total_tests'] == 0:
-            # Show "No history" message
-            no_history_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
-            no_history_frame.pack(pady=50, expand=True)
-            
-            ctk.CTkLabel(
-                no_history_frame,
-                text="No History Yet",
-                font=("JetBrains Mono", 24, "bold"),
-                text_color="#646669",
-            ).pack(pady=20)
-            
-            ctk.CTkLabel(
-                no_history_frame,
-                text="Complete a typing test to see your results here",
-                font=("JetBrains Mono", 12),
-                text_color="#646669",
-            ).pack(pady=10)
-        else:
-            # Show statistics and history
-            stats_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
-            stats_frame.pack(pady=20)
+        # "No history" message, shown until the first result is saved
+        self.no_history_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
 
-            ctk.CTkLabel(
-                stats_frame,
-                text=f"Total Tests: {stats['total_tests']}",
-                font=("JetBrains Mono", 12),
-                text_color="#D1D0C5",
-            ).pack(anchor="w", padx=20, pady=5)
+        ctk.CTkLabel(
+            self.no_history_frame,
+            text="No History Yet",
+            font=("JetBrains Mono", 24, "bold"),
+            text_color="#646669",
+        ).pack(pady=20)
 
-            ctk.CTkLabel(
-                stats_frame,
-                text=f"Best WPM: {int(stats['best_wpm'])}",
-                font=("JetBrains Mono", 12),
-                text_color="#D1D0C5",
-            ).pack(anchor="w", padx=20, pady=5)
+        ctk.CTkLabel(
+            self.no_history_frame,
+            text="Complete a typing test to see your results here",
+            font=("JetBrains Mono", 12),
+            text_color="#646669",
+        ).pack(pady=10)
 
-            ctk.CTkLabel(
-                stats_frame,
-                text=f"Average WPM: {stats['average_wpm']:.1f}",
-                font=("JetBrains Mono", 12),
-                text_color="#D1D0C5",
-            ).pack(anchor="w", padx=20, pady=5)
+        # Statistics and history
+        self.content_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
+
+        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="#2C2E31")
+        stats_frame.pack(pady=20)
 
-            ctk.CTkLabel(
+        self.stat_labels = {}
+        for name in ("total_tests", "best_wpm", "average_wpm", "average_accuracy", "slowest_keys"):
+            label = ctk.CTkLabel(
                 stats_frame,
-                text=f"Average Accuracy: {stats['average_accuracy']:.1f}%",
+                text="",
                 font=("JetBrains Mono", 12),
                 text_color="#D1D0C5",
-            ).pack(anchor="w", padx=20, pady=5)
-
-            # Recent results
-            ctk.CTkLabel(
-                self,
-                text="Recent Tests",
-                font=("JetBrains Mono", 14, "bold"),
-                text_color="#E2B714",
-            ).pack(pady=(20, 10))
-
-            # Results list frame with scrolling
-            list_frame = ctk.CTkScrollableFrame(self, fg_color="#3C3E42", height=250)
-            list_frame.pack(pady=10, padx=20, fill="both", expand=True)
-
-            recent = self.data_manager.get_recent_results(10)
-            for result in recent:
-                result_text = f"{result.get('wpm', 0):.0f} WPM | {result.get('accuracy', 0):.1f}% | {result.get('duration', 0)}s | {result.get('timestamp', 'N/A').split('T')[0]}"
-                ctk.CTkLabel(
-                    list_frame,
-                    text=result_text,
-                    font=("JetBrains Mono", 11),
-                    text_color="#D1D0C5",
-                ).pack(anchor="w", padx=10, pady=5)
+            )
+            label.pack(anchor="w", padx=20, pady=5)
+            self.stat_labels[name] = label
+
+        # Test history with filters
+        filter_frame = ctk.CTkFrame(self.content_frame, fg_color="#2C2E31")
+        filter_frame.pack(pady=(20, 10))
+
+        ctk.CTkLabel(
+            filter_frame,
+            text="Tests",
+            font=("JetBrains Mono", 14, "bold"),
+            text_color="#E2B714",
+        ).pack(side="left", padx=(0, 15))
+
+        self.duration_filter = ctk.CTkSegmentedButton(
+            filter_frame,
+            values=list(HISTORY_DURATIONS),
+            font=("JetBrains Mono", 12),
+            fg_color="#3C3E42",
+            selected_color="#E2B714",
+            selected_hover_color="#E2B714",
+            unselected_color="#3C3E42",
+            text_color="#D1D0C5",
+            command=self.on_filter_change,
+        )
+        self.duration_filter.set("All")
+        self.duration_filter.pack(side="left", padx=5)
+
+        self.date_filter = ctk.CTkOptionMenu(
+            filter_frame,
+            values=list(HISTORY_DATE_RANGES),
+            font=("JetBrains Mono", 12),
+            fg_color="#3C3E42",
+            button_color="#3C3E42",
+            text_color="#D1D0C5",
+            command=self.on_filter_change,
+        )
+        self.date_filter.set("All time")
+        self.date_filter.pack(side="left", padx=5)
+
+        # Only the visible rows exist as widgets, whatever the history size
+        self.history_list = HistoryList(self.content_frame, self.data_manager)
+        self.history_list.pack(pady=10, padx=20, fill="both", expand=True)
+
+        # Running totals, so a new result updates the statistics without a query
+        stats = self.data_manager.get_statistics()
+        self.summary = {
+            "total_tests": stats["total_tests"],
+            "best_wpm": stats["best_wpm"],
+            "wpm_sum": stats["average_wpm"] * stats["total_tests"],
+            "accuracy_sum": stats["average_accuracy"] * stats["total_tests"],
+        }
+        # Results already in the totals may still be notified if they were written
+        # after the last poll(); they must not be counted twice
+        self._counted_through = stats["last_result_id"]
+        self.update_summary()
+        self.update_slowest_keys()
+        self.on_filter_change()
+
+    def update_summary(self):
+        """Show the running totals, or the "no history" message if there are none."""
+        total = self.summary["total_tests"]
+        if total == 0:
+            self.content_frame.pack_forget()
+            self.no_history_frame.pack(pady=50, expand=True)
+            return
+        self.no_history_frame.pack_forget()
+        self.content_frame.pack(fill="both", expand=True)
+
+        self.stat_labels["total_tests"].configure(text=f"Total Tests: {total}")
+        self.stat_labels["best_wpm"].configure(text=f"Best WPM: {int(self.summary['best_wpm'])}")
+        self.stat_labels["average_wpm"].configure(
+            text=f"Average WPM: {self.summary['wpm_sum'] / total:.1f}"
+        )
+        self.stat_labels["average_accuracy"].configure(
+            text=f"Average Accuracy: {self.summary['accuracy_sum'] / total:.1f}%"
+        )
+
+    def update_slowest_keys(self):
+        """Reload the slowest keys from the latency statistics."""
+        weakest = self.data_manager.get_weakest_keys(limit=5)
+        slowest = "  ".join(
+            f"{'␣' if entry['key'] == ' ' else entry['key']} {entry['mean_latency'] * 1000:.0f}ms"
+            for entry in weakest
+        )
+        self.stat_labels["slowest_keys"].configure(text=f"Slowest Keys: {slowest}" if weakest else "")
+
+    def on_result_saved(self, result_id: int, results: dict):
+        """Fold a newly saved result into the totals; the rest waits until the screen is shown."""
+        if result_id <= self._counted_through:
+            return
+        self.summary["total_tests"] += 1
+        self.summary["best_wpm"] = max(self.summary["best_wpm"], results.get("wpm", 0))
+        self.summary["wpm_sum"] += results.get("wpm", 0)
+        self.summary["accuracy_sum"] += results.get("accuracy", 0)
+        self.update_summary()
+        self._stale = True
+        if self.winfo_ismapped():
+            self.refresh()
+
+    def refresh(self):
+        """Add rows saved since the last refresh and reload the slowest keys."""
+        if not self._stale:
+            return
+        self._stale = False
+        self.update_slowest_keys()
+        self.history_list.load_newer()
+
+    def on_filter_change(self, _=None):
+        """Reload the history list for the selected duration and date range."""
+        days = HISTORY_DATE_RANGES[self.date_filter.get()]
+        since = None
+        if days is not None:
+            midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            since = midnight - timedelta(days=days - 1)
+        self.history_list.set_filters(
+            duration=HISTORY_DURATIONS[self.duration_filter.get()], since=since
+        )
+
+
+def open_database():
+    """Open the results database. Called on first save or history view, not at startup."""
+    from database import DatabaseManager
+
+    return DatabaseManager()
 
 
 class ZenTypeApp(ctk.CTk):
-    """Main application window for ZenType."""
+    """
+    Main application window for ZenType.
+    Only the typing screen is built before the first frame; the results and history
+    screens are built when first shown and the database is opened on first use.
+    """
 
     def __init__(self):
         super().__init__()
@@ -679,6 +1034,21 @@ class ZenTypeApp(ctk.CTk):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f"{width}x{height}+{x}+{y}")
 
+        # Results are saved in the background; errors come back through poll_persistence
+        self.scheduler = AfterScheduler(self)
+        self.result_writer = ResultWriter(open_store=open_database, on_error=self.on_persistence_error)
+        self.corpora = default_registry()
+        startup_timer.mark("window")
+
+        # Status line for errors that must not interrupt typing
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("JetBrains Mono", 11),
+            text_color="#CA4754",
+        )
+        self.status_label.pack(side="bottom", pady=5)
+
         # Main container
         self.main_frame = ctk.CTkFrame(self, fg_color="#2C2E31")
         self.main_frame.pack(fill="both", expand=True)
@@ -688,46 +1058,90 @@ class ZenTypeApp(ctk.CTk):
             self.main_frame,
             on_test_complete=self.show_results,
             on_show_history=self.show_history,
+            result_writer=self.result_writer,
+            corpora=self.corpora,
         )
+        startup_timer.mark("typing screen")
 
-        self.results_screen = ResultsScreen(
-            self.main_frame,
-            on_retry=self.retry_test,
-            on_new_duration=self.show_typing,
-            on_show_history=self.show_history,
-        )
+        # Built on first use
+        self.results_screen: ResultsScreen | None = None
+        self.history_screen: HistoryScreen | None = None
 
-        self.history_screen = HistoryScreen(
-            self.main_frame,
-            on_back_to_typing=self.show_typing,
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.show_typing()
+        self.poll_persistence()
+        # Idle callbacks run after the pending redraws, so this fires once the first frame is up
+        self.after_idle(self.on_first_frame)
+
+    def on_first_frame(self):
+        """Record that the window is drawn and the typing screen can take keystrokes."""
+        startup_timer.mark("first frame")
+
+    def hide_screens(self):
+        """Unpack every screen that has been built."""
+        for screen in (self.typing_screen, self.results_screen, self.history_screen):
+            if screen is not None:
+                screen.pack_forget()
+
+    def poll_persistence(self):
+        """Deliver result writer notifications on the Tk thread."""
+        self.result_writer.poll()
+        self.scheduler.schedule("poll_persistence", PERSISTENCE_POLL_MS, self.poll_persistence)
+
+    def on_persistence_error(self, error: Exception):
+        """Show a save error in the status line without blocking."""
+        logger.error(f"Error saving result: {error}")
+        self.status_label.configure(text=f"Could not save result: {error}")
+        self.scheduler.schedule(
+            "clear_status", STATUS_MESSAGE_MS, lambda: self.status_label.configure(text="")
         )
 
-        self.show_typing()
+    def on_close(self):
+        """Write queued results, close shared database connections and exit."""
+        self.scheduler.cancel_all()
+        if not self.result_writer.close(WRITER_CLOSE_TIMEOUT_S):
+            logger.error(f"Result writer still busy after {WRITER_CLOSE_TIMEOUT_S}s; exiting anyway")
+        if self.result_writer.store_opened:
+            from database import close_all_pools
+
+            close_all_pools()
+        self.corpora.close_all()
+        self.destroy()
 
     def show_typing(self):
         """Show typing screen."""
-        self.results_screen.pack_forget()
-        self.history_screen.pack_forget()
+        self.hide_screens()
         self.typing_screen.pack(fill="both", expand=True)
         self.typing_screen.typing_display.text_widget.focus_set()
 
     def show_results(self, results: dict):
         """Show results screen."""
-        self.typing_screen.pack_forget()
-        self.history_screen.pack_forget()
+        self.hide_screens()
+        if self.results_screen is None:
+            self.results_screen = ResultsScreen(
+                self.main_frame,
+                on_retry=self.retry_test,
+                on_new_duration=self.show_typing,
+                on_show_history=self.show_history,
+            )
         self.results_screen.pack(fill="both", expand=True)
         self.results_screen.display_results(results, self.typing_screen.engine)
 
     def show_history(self):
         """Show history screen."""
-        self.typing_screen.pack_forget()
-        self.results_screen.pack_forget()
-        # Destroy old history screen and create fresh one
-        self.history_screen.destroy()
-        self.history_screen = HistoryScreen(
-            self.main_frame,
-            on_back_to_typing=self.show_typing,
-        )
+        self.hide_screens()
+        # Never wait for the writer here: a result still being saved reaches the
+        # screen through its result listener when poll_persistence delivers it
+        self.result_writer.poll()
+        if self.history_screen is None:
+            self.history_screen = HistoryScreen(
+                self.main_frame,
+                on_back_to_typing=self.show_typing,
+                result_writer=self.result_writer,
+            )
+        else:
+            # The screen is long-lived; it only takes in what changed since the last visit
+            self.history_screen.refresh()
         self.history_screen.pack(fill="both", expand=True)
 
     def retry_test(self):
@@ -0,0 +1,225 @@
+"""
+Background Result Persistence for ZenType
+Write-behind queue that saves test results on a dedicated writer thread,
+so a slow disk never stalls the Tk main loop.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from engine import KeystrokeLog
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of queued results written in one transaction
+BATCH_SIZE = 32
+
+# Marker that tells the writer thread to stop after draining the queue
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    Write-behind queue in front of a results store (DatabaseManager).
+
+    submit() only enqueues and returns immediately. The writer thread drains
+    whatever has accumulated and saves it with one add_results() call, which
+    is a single transaction. Outcomes are not delivered on the writer thread:
+    they wait in a notification queue until the UI calls poll() from the main
+    thread, because Tk widgets must only be touched there.
+    """
+
+    def __init__(self, store=None, batch_size: int = BATCH_SIZE,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 open_store: Optional[Callable[[], object]] = None):
+        """
+        Initialize writer and start its thread.
+
+        Args:
+            store: Object with add_results(entries) -> List[int], e.g. DatabaseManager
+            batch_size: Maximum results per transaction
+            on_error: Called from poll() with each exception raised while saving
+            open_store: Creates the store on first use instead of passing `store`,
+                so opening the database stays out of application startup
+        """
+        if store is None and open_store is None:
+            raise ValueError("ResultWriter needs a store or open_store")
+        self._store = store
+        self._open_store = open_store
+        self._store_lock = threading.Lock()
+        self.batch_size = batch_size
+        self.on_error = on_error
+        self._result_added_callbacks: List[Callable[[int, Dict], None]] = []
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._notifications: "queue.Queue" = queue.Queue()
+        self._closed = False
+
+        # Observability: updated by the writer thread, read from anywhere
+        self.written_count = 0
+        self.failed_count = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="ResultWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def store(self):
+        """The results store, opened on first access from either thread."""
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = self._open_store()
+        return self._store
+
+    @property
+    def store_opened(self) -> bool:
+        """True once the store exists."""
+        return self._store is not None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of results submitted but not yet written."""
+        return self._queue.unfinished_tasks
+
+    def stats(self) -> Dict:
+        """
+        Snapshot of queue depth and flush latency.
+
+        Returns:
+            Dictionary with queue_depth, written, failed, last_flush_ms and max_flush_ms
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "written": self.written_count,
+            "failed": self.failed_count,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+        }
+
+    def add_result_listener(self, callback: Callable[[int, Dict], None]) -> None:
+        """
+        Register a callback run from poll() after each result is saved.
+
+        Args:
+            callback: Called with (result_id, test_result)
+        """
+        self._result_added_callbacks.append(callback)
+
+    def submit(self, test_result: Dict, keystrokes: Optional[KeystrokeLog] = None,
+               start_time: Optional[int] = None, target_text: Optional[str] = None) -> None:
+        """
+        Queue a result for saving without blocking.
+
+        Args:
+            test_result: Dictionary of test metrics
+            keystrokes: Optional keystroke log (must not be modified afterwards)
+            start_time: Test start in clock nanoseconds
+            target_text: Text of the test
+        """
+        if self._closed:
+            raise RuntimeError("ResultWriter is closed")
+        self._queue.put((test_result, keystrokes, start_time, target_text))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted result has been written.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting results, write everything queued and stop the thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer thread
+
+        Returns:
+            True if the thread finished, False on timeout
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def poll(self) -> int:
+        """
+        Deliver pending notifications on the calling (UI) thread. Never blocks.
+
+        Returns:
+            Number of notifications delivered
+        """
+        delivered = 0
+        while True:
+            try:
+                kind, payload = self._notifications.get_nowait()
+            except queue.Empty:
+                return delivered
+            delivered += 1
+            if kind == "error":
+                if self.on_error is not None:
+                    self.on_error(payload)
+            else:
+                for callback in list(self._result_added_callbacks):
+                    callback(*payload)
+
+    def _next_batch(self) -> Tuple[List, bool]:
+        """Block for one entry, then take whatever else is already queued."""
+        batch = []
+        stop = False
+        item = self._queue.get()
+        while True:
+            if item is _STOP:
+                self._queue.task_done()
+                stop = True
+            else:
+                batch.append(item)
+            if len(batch) >= self.batch_size:
+                break
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+        return batch, stop
+
+    def _run(self) -> None:
+        """Writer thread loop."""
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                result_ids = self.store.add_results(batch)
+            except Exception as e:
+                logger.error(f"Error saving {len(batch)} result(s): {e}")
+                self.failed_count += len(batch)
+                self._notifications.put(("error", e))
+            else:
+                self.written_count += len(batch)
+                for result_id, (test_result, *_) in zip(result_ids, batch):
+                    self._notifications.put(("added", (result_id, test_result)))
+            finally:
+                self.last_flush_ms = (time.perf_counter() - start) * 1000
+                self.max_flush_ms = max(self.max_flush_ms, self.last_flush_ms)
+                for _ in batch:
+                    self._queue.task_done()
@@ -0,0 +1,107 @@
+"""
+Incremental Text Renderer for ZenType
+Applies character color tags to the typing display, re-tagging only the cells that changed.
+"""
+
+from typing import Callable
+
+
+class TagRenderer:
+    """
+    Diff-based tag renderer for a tkinter.Text-like widget.
+    Remembers the last rendered cursor position and re-tags only the cells between
+    the old and new cursor, merging neighbouring cells with the same status into one range.
+
+    Offsets are positions in the target text. For streamed text the widget holds a
+    window of it: append() records text added at the end and trim() text deleted
+    from the start, so `origin` is the target offset of the widget's first character.
+    """
+
+    STATUS_TAGS = ("unwritten", "correct", "error")
+
+    def __init__(self, text_widget):
+        """
+        Initialize renderer for a text widget.
+
+        Args:
+            text_widget: Widget exposing tag_add(tag, start, end) and tag_remove(tag, start, end)
+        """
+        self.text_widget = text_widget
+        self.text_length = 0
+        self.rendered_index = 0
+        self.origin = 0
+
+    def index(self, offset: int) -> str:
+        """Convert a target text offset into a Text widget index."""
+        return f"1.0+{offset - self.origin}c"
+
+    def reset(self, text_length: int) -> None:
+        """
+        Render a freshly inserted text with every character unwritten.
+
+        Args:
+            text_length: Number of characters in the displayed text
+        """
+        for tag in self.STATUS_TAGS + ("cursor",):
+            self.text_widget.tag_remove(tag, "1.0", "end")
+        self.text_length = text_length
+        self.rendered_index = 0
+        self.origin = 0
+        if text_length > 0:
+            self.text_widget.tag_add("unwritten", "1.0", self.index(text_length))
+
+    def append(self, count: int) -> None:
+        """
+        Tag text just inserted at the end of the widget as unwritten.
+
+        Args:
+            count: Number of characters appended
+        """
+        if count > 0:
+            self.text_widget.tag_add(
+                "unwritten", self.index(self.text_length), self.index(self.text_length + count)
+            )
+            self.text_length += count
+
+    def trim(self, count: int) -> None:
+        """
+        Record that characters were deleted from the start of the widget.
+        Only text before the cursor's word may be trimmed.
+
+        Args:
+            count: Number of characters deleted
+        """
+        self.origin += count
+
+    def render(self, char_index: int, status_of: Callable[[int], str]) -> None:
+        """
+        Re-tag the cells whose status may have changed since the last render.
+        Typing forward or backspacing only touches cells between the old and new cursor.
+
+        Args:
+            char_index: Current position in target text
+            status_of: Callable returning "unwritten", "correct" or "error" for a cell
+        """
+        char_index = min(char_index, self.text_length)
+        start = max(min(self.rendered_index, char_index), self.origin)
+        end = max(self.rendered_index, char_index)
+        self.rendered_index = char_index
+
+        if start >= end:
+            return
+
+        start_pos = self.index(start)
+        end_pos = self.index(end)
+        for tag in self.STATUS_TAGS:
+            self.text_widget.tag_remove(tag, start_pos, end_pos)
+
+        # Apply one tag range per run of equal statuses
+        run_start = start
+        run_status = status_of(start)
+        for i in range(start + 1, end):
+            status = status_of(i)
+            if status != run_status:
+                self.text_widget.tag_add(run_status, self.index(run_start), self.index(i))
+                run_start = i
+                run_status = status
+        self.text_widget.tag_add(run_status, self.index(run_start), end_pos)
@@ -0,0 +1,402 @@
+"""
+Weighted Word Sampling for ZenType
+Indexes which bigrams each word contains and samples words by weight, so practice
+text can favour the transitions a user types slowly or inaccurately. Also samples
+by word frequency through Walker alias tables, optionally under word filters.
+"""
+
+import random
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from statistics import median
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Weight every word keeps, so no word disappears from adaptive text
+BASE_WORD_WEIGHT = 1.0
+
+# How strongly bigram difficulty pulls words into the text
+DIFFICULTY_STRENGTH = 4.0
+
+# Difficulty added per unit of error rate of a bigram's second key
+ERROR_WEIGHT = 5.0
+
+# Bigrams with fewer latency samples than this are not trusted
+MIN_BIGRAM_SAMPLES = 5
+
+# Zipf exponent used to weight word lists ordered by frequency but without counts
+ZIPF_EXPONENT = 1.0
+
+# Filtered alias tables kept per sampler (one per distinct filter)
+MAX_CACHED_TABLES = 8
+
+
+def word_bigrams(word: str) -> List[str]:
+    """
+    Bigrams typed for a word in running text, including the space before and after it.
+
+    Args:
+        word: Word to split
+
+    Returns:
+        List of two-character strings
+    """
+    padded = f" {word} "
+    return [padded[i:i + 2] for i in range(len(padded) - 1)]
+
+
+class BigramIndex:
+    """
+    Word <-> bigram index in compressed sparse row form.
+    word_bigrams[word_offsets[w]:word_offsets[w + 1]] are the distinct bigram ids of
+    word w, and bigram_words[bigram_offsets[b]:bigram_offsets[b + 1]] are the ids of
+    the words containing bigram b (the inverted index).
+    """
+
+    def __init__(self, words: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            words: Word list; word ids are positions in this sequence
+        """
+        self.words = words
+        self.bigram_ids: Dict[str, int] = {}
+        self.word_offsets = array("I", [0])
+        self.word_bigrams = array("I")
+
+        postings: List[List[int]] = []
+        for word_id, word in enumerate(words):
+            ids = set()
+            for bigram in word_bigrams(word):
+                bigram_id = self.bigram_ids.get(bigram)
+                if bigram_id is None:
+                    bigram_id = self.bigram_ids[bigram] = len(postings)
+                    postings.append([])
+                ids.add(bigram_id)
+            for bigram_id in sorted(ids):
+                postings[bigram_id].append(word_id)
+                self.word_bigrams.append(bigram_id)
+            self.word_offsets.append(len(self.word_bigrams))
+
+        self.bigram_offsets = array("I", [0])
+        self.bigram_words = array("I")
+        for posting in postings:
+            self.bigram_words.extend(posting)
+            self.bigram_offsets.append(len(self.bigram_words))
+
+    @property
+    def bigram_count(self) -> int:
+        """Number of distinct bigrams."""
+        return len(self.bigram_ids)
+
+    def bigrams_of(self, word_id: int) -> array:
+        """Bigram ids contained in a word."""
+        return self.word_bigrams[self.word_offsets[word_id]:self.word_offsets[word_id + 1]]
+
+    def words_with(self, bigram_id: int) -> array:
+        """Ids of the words that contain a bigram."""
+        return self.bigram_words[self.bigram_offsets[bigram_id]:self.bigram_offsets[bigram_id + 1]]
+
+
+class WeightedWordSampler:
+    """
+    Samples words in proportion to BASE_WORD_WEIGHT plus the difficulty of the bigrams
+    they contain. Word weights are kept as running sums: a weight refresh touches only
+    the words containing a changed bigram (via the inverted index) and then rebuilds
+    the cumulative weights once, so each draw is a bisect, O(log V).
+    """
+
+    def __init__(self, index: BigramIndex, strength: float = DIFFICULTY_STRENGTH):
+        """
+        Initialize sampler with every bigram at zero difficulty (uniform sampling).
+
+        Args:
+            index: Bigram index of the word list
+            strength: Weight added to a word per unit of bigram difficulty
+        """
+        self.index = index
+        self.strength = strength
+        self.bigram_weights = array("d", [0.0]) * index.bigram_count
+        self.word_weights = array("d", [BASE_WORD_WEIGHT]) * len(index.words)
+        self.cumulative = list(accumulate(self.word_weights))
+
+    def set_bigram_weights(self, difficulty: Dict[str, float]) -> int:
+        """
+        Replace bigram difficulties; bigrams not mentioned go back to zero.
+
+        Args:
+            difficulty: Mapping of bigram to non-negative difficulty
+
+        Returns:
+            Number of word weight updates applied
+        """
+        targets = {}
+        for bigram, value in difficulty.items():
+            bigram_id = self.index.bigram_ids.get(bigram)
+            if bigram_id is not None:
+                targets[bigram_id] = max(0.0, value)
+        for bigram_id, weight in enumerate(self.bigram_weights):
+            if weight and bigram_id not in targets:
+                targets[bigram_id] = 0.0
+
+        updates = 0
+        word_weights = self.word_weights
+        for bigram_id, value in targets.items():
+            delta = (value - self.bigram_weights[bigram_id]) * self.strength
+            if delta == 0:
+                continue
+            self.bigram_weights[bigram_id] = value
+            for word_id in self.index.words_with(bigram_id):
+                word_weights[word_id] += delta
+            updates += self.index.bigram_offsets[bigram_id + 1] - self.index.bigram_offsets[bigram_id]
+
+        if updates:
+            self.cumulative = list(accumulate(word_weights))
+        return updates
+
+    def sample(self, count: int, rng: Optional[random.Random] = None) -> List[str]:
+        """
+        Draw words with replacement.
+
+        Args:
+            count: Number of words
+            rng: Random generator (default: the random module)
+
+        Returns:
+            List of sampled words
+        """
+        choices = (rng or random).choices
+        return choices(self.index.words, cum_weights=self.cumulative, k=count)
+
+
+def bigram_difficulty(bigram_stats: Dict[str, Dict], key_stats: Optional[Dict[str, Dict]] = None,
+                      min_count: int = MIN_BIGRAM_SAMPLES) -> Dict[str, float]:
+    """
+    Score bigrams from stored latency statistics.
+    Difficulty is how much slower than the median bigram a transition is (0 when
+    faster), plus ERROR_WEIGHT times the error rate of the key it lands on.
+
+    Args:
+        bigram_stats: Mapping of bigram to {"count", "mean_latency", ...}
+        key_stats: Mapping of key to {"count", "errors", ...}
+        min_count: Ignore bigrams with fewer samples
+
+    Returns:
+        Mapping of bigram to difficulty
+    """
+    trusted = {bigram: stats for bigram, stats in bigram_stats.items() if stats["count"] >= min_count}
+    if not trusted:
+        return {}
+    baseline = median(stats["mean_latency"] for stats in trusted.values())
+
+    error_rates = {}
+    for key, stats in (key_stats or {}).items():
+        attempts = stats["count"] + stats["errors"]
+        error_rates[key] = stats["errors"] / attempts if attempts else 0.0
+
+    difficulty = {}
+    for bigram, stats in trusted.items():
+        slowness = max(0.0, stats["mean_latency"] / baseline - 1.0) if baseline > 0 else 0.0
+        score = slowness + ERROR_WEIGHT * error_rates.get(bigram[1], 0.0)
+        if score > 0:
+            difficulty[bigram] = score
+    return difficulty
+
+
+def zipf_weights(count: int, exponent: float = ZIPF_EXPONENT) -> array:
+    """
+    Zipf weights for a word list sorted from most to least common.
+
+    Args:
+        count: Number of words
+        exponent: Zipf exponent; the word at rank r gets weight 1 / r ** exponent
+
+    Returns:
+        Array of weights
+    """
+    return array("d", (1.0 / rank ** exponent for rank in range(1, count + 1)))
+
+
+class AliasTable:
+    """
+    Walker alias table (Vose's construction): O(n) to build, O(1) per draw.
+    Slot i is kept with probability prob[i] and otherwise replaced by alias[i].
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Build the table.
+
+        Args:
+            weights: Non-negative weights with a positive sum
+        """
+        size = len(weights)
+        total = float(sum(weights))
+        if size == 0 or total <= 0:
+            raise ValueError("Alias table needs weights with a positive sum")
+        if min(weights) < 0:
+            raise ValueError("Alias table weights must not be negative")
+
+        scaled = array("d", (weight * size / total for weight in weights))
+        self.size = size
+        self.prob = array("d", [1.0]) * size
+        self.alias = array("I", range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+        # Whatever is left is 1.0 up to rounding and keeps prob 1.0
+
+    def draw(self, rng=random) -> int:
+        """
+        Draw one index.
+
+        Args:
+            rng: Random generator (default: the random module)
+
+        Returns:
+            Index drawn with probability proportional to its weight
+        """
+        u = rng.random() * self.size
+        slot = int(u)
+        return slot if u - slot < self.prob[slot] else self.alias[slot]
+
+
+class _FilteredTable:
+    """Alias table over the words passing one filter, plus cumulative weights."""
+
+    __slots__ = ("word_ids", "weights", "cumulative", "alias")
+
+    def __init__(self, word_ids: array, weights: array):
+        self.word_ids = word_ids
+        self.weights = weights
+        self.cumulative = array("d", accumulate(weights))
+        self.alias = AliasTable(weights)
+
+    def draw_excluding(self, position: int, rng) -> int:
+        """
+        Draw a position other than `position` in proportion to weight, in O(log n).
+
+        Args:
+            position: Position to exclude
+            rng: Random generator
+
+        Returns:
+            Position drawn (position itself only if it is the only word)
+        """
+        excluded = self.weights[position]
+        remaining = self.cumulative[-1] - excluded
+        if remaining <= 0:
+            return position
+        # Draw on the weight line with the excluded word's interval cut out
+        u = rng.random() * remaining
+        if u >= self.cumulative[position] - excluded:
+            u += excluded
+        drawn = min(bisect_right(self.cumulative, u), len(self.cumulative) - 1)
+        return drawn if drawn != position else (position + 1) % len(self.cumulative)
+
+
+class AliasWordSampler:
+    """
+    Samples words in proportion to fixed weights (e.g. corpus frequencies) in O(1)
+    per draw. Filters (maximum length, required characters) are applied once to
+    build a smaller alias table, which is cached, so restrictive filters never
+    turn into rejection loops. A word listed more than once gets one table entry
+    with the summed weight. Immediate repeats are avoided exactly: when the
+    alias draw repeats the previous word, one draw is taken from the remaining
+    words by bisecting the cumulative weights.
+    """
+
+    def __init__(self, words: Sequence[str], weights: Optional[Sequence[float]] = None):
+        """
+        Initialize sampler; tables are built on first use.
+
+        Args:
+            words: Word list
+            weights: Weight per word (default: all equal)
+        """
+        if weights is not None and len(weights) != len(words):
+            raise ValueError(f"Expected {len(words)} weights, got {len(weights)}")
+        self.words = words
+        self.weights = weights
+        self._tables: Dict[Hashable, _FilteredTable] = {}
+
+    def _table(self, max_length: Optional[int], required_chars: Optional[str]) -> _FilteredTable:
+        """Get the cached table for a filter, building it if needed."""
+        required = frozenset(required_chars) if required_chars else None
+        key = (max_length, required)
+        table = self._tables.pop(key, None)
+        if table is None:
+            word_ids = array("I")
+            weights = array("d")
+            # Table position of each word, so duplicates share an entry
+            positions: Dict[str, int] = {}
+            for word_id in range(len(self.words)):
+                weight = 1.0 if self.weights is None else self.weights[word_id]
+                if weight <= 0:
+                    continue
+                word = self.words[word_id]
+                if max_length is not None and len(word) > max_length:
+                    continue
+                if required is not None and required.isdisjoint(word):
+                    continue
+                position = positions.get(word)
+                if position is not None:
+                    weights[position] += weight
+                    continue
+                positions[word] = len(word_ids)
+                word_ids.append(word_id)
+                weights.append(weight)
+            if not word_ids:
+                raise ValueError("No words match the filter")
+            table = _FilteredTable(word_ids, weights)
+            if len(self._tables) >= MAX_CACHED_TABLES:
+                # Evict the least recently used table
+                del self._tables[next(iter(self._tables))]
+        # Reinserting keeps the dict ordered by last use
+        self._tables[key] = table
+        return table
+
+    def sample(self, count: int, rng: Optional[random.Random] = None, max_length: Optional[int] = None,
+               required_chars: Optional[str] = None, no_repeats: bool = False,
+               previous: Optional[str] = None) -> List[str]:
+        """
+        Draw words with replacement.
+
+        Args:
+            count: Number of words
+            rng: Random generator (default: the random module)
+            max_length: Only draw words with at most this many characters
+            required_chars: Only draw words containing at least one of these characters
+            no_repeats: Never draw the same word twice in a row
+            previous: Word just before this sample, e.g. the end of the last chunk;
+                with no_repeats the first word won't repeat it
+
+        Returns:
+            List of sampled words
+        """
+        rng = rng or random
+        table = self._table(max_length, required_chars)
+        draw = table.alias.draw
+        word_ids = table.word_ids
+        positions: List[int] = []
+        last = -1
+        for _ in range(count):
+            position = draw(rng)
+            if no_repeats and (position == last
+                               or (last == -1 and self.words[word_ids[position]] == previous)):
+                position = table.draw_excluding(position, rng)
+            positions.append(position)
+            last = position
+        return [self.words[word_ids[position]] for position in positions]
+
+    def cached_filters(self) -> List[Tuple[Optional[int], Optional[frozenset]]]:
+        """Filters with a cached table, least recently used first."""
+        return list(self._tables)
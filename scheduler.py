@@ -0,0 +1,69 @@
+"""
+Callback Scheduler for ZenType
+Tracks tkinter after() jobs by name so screens can replace or cancel them reliably.
+"""
+
+from typing import Callable, Dict
+
+
+class AfterScheduler:
+    """
+    Owns the after() jobs of one widget.
+    Each job has a name; at most one job per name is pending, and all of them
+    can be cancelled at once when a test is reset or finished.
+    """
+
+    def __init__(self, widget):
+        """
+        Initialize scheduler for a widget.
+
+        Args:
+            widget: Widget exposing after(ms, func) and after_cancel(id)
+        """
+        self.widget = widget
+        self._jobs: Dict[str, str] = {}
+
+    def schedule(self, name: str, delay_ms: int, callback: Callable[[], None]) -> None:
+        """
+        Schedule a named job, replacing any pending job with the same name.
+
+        Args:
+            name: Job name
+            delay_ms: Delay in milliseconds
+            callback: Function to call
+        """
+        self.cancel(name)
+        self._jobs[name] = self.widget.after(max(0, int(delay_ms)), self._run, name, callback)
+
+    def schedule_once(self, name: str, delay_ms: int, callback: Callable[[], None]) -> None:
+        """
+        Schedule a named job unless one with that name is already pending.
+        Used to coalesce bursts of requests into a single callback.
+
+        Args:
+            name: Job name
+            delay_ms: Delay in milliseconds
+            callback: Function to call
+        """
+        if name not in self._jobs:
+            self.schedule(name, delay_ms, callback)
+
+    def is_scheduled(self, name: str) -> bool:
+        """Return True if a job with this name is pending."""
+        return name in self._jobs
+
+    def cancel(self, name: str) -> None:
+        """Cancel the pending job with this name, if any."""
+        job_id = self._jobs.pop(name, None)
+        if job_id is not None:
+            self.widget.after_cancel(job_id)
+
+    def cancel_all(self) -> None:
+        """Cancel every pending job."""
+        for name in list(self._jobs):
+            self.cancel(name)
+
+    def _run(self, name: str, callback: Callable[[], None]) -> None:
+        """Forget the job before running it so the callback can reschedule itself."""
+        self._jobs.pop(name, None)
+        callback()
@@ -0,0 +1,176 @@
+"""
+Headless Typing Simulation for ZenType
+Drives TypingEngine with synthetic keystrokes from a typist model under a simulated
+clock, for tests and benchmarks that run without Tk.
+"""
+
+import random
+from typing import Iterator, Optional, Tuple
+from clock import FakeClock, NS_PER_SECOND
+from engine import TypingEngine
+
+# Key in a script that stands for the backspace key
+BACKSPACE = "\b"
+
+# Keys next to each other on a QWERTY row; wrong keys are drawn from these
+_KEYBOARD_ROWS = ("qwertyuiop", "asdfghjkl", "zxcvbnm")
+ADJACENT_KEYS = {
+    row[i]: row[max(0, i - 1):i] + row[i + 1:i + 2]
+    for row in _KEYBOARD_ROWS
+    for i in range(len(row))
+}
+
+
+class TypistModel:
+    """
+    Statistical model of a typist.
+    Keys arrive at a jittered rate matching `wpm`; each non-space key is mistyped with
+    probability `error_rate`, and a mistake is corrected with probability `correction_rate`
+    after up to `max_notice_delay` further keys in the same word.
+    """
+
+    def __init__(self, wpm: float = 60.0, error_rate: float = 0.03, correction_rate: float = 0.8,
+                 max_notice_delay: int = 2, jitter: float = 0.3, seed: Optional[int] = None):
+        """
+        Initialize typist model.
+
+        Args:
+            wpm: Typing speed in words (5 keys) per minute
+            error_rate: Probability that a non-space key is mistyped
+            correction_rate: Probability that a mistake is backspaced and retyped
+            max_notice_delay: Most keys typed past a mistake before backspacing
+            jitter: Standard deviation of key intervals as a fraction of the mean
+            seed: Random seed for reproducible scripts
+        """
+        self.wpm = wpm
+        self.error_rate = error_rate
+        self.correction_rate = correction_rate
+        self.max_notice_delay = max_notice_delay
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+
+    @property
+    def mean_interval(self) -> float:
+        """Mean seconds between keystrokes."""
+        return 60.0 / (self.wpm * 5)
+
+    def _interval(self) -> float:
+        """Draw one jittered key interval in seconds."""
+        mean = self.mean_interval
+        return max(mean * 0.1, self.rng.gauss(mean, mean * self.jitter))
+
+    def _wrong_key(self, char: str) -> str:
+        """Draw a plausible wrong key for a target character."""
+        neighbours = ADJACENT_KEYS.get(char.lower())
+        if neighbours:
+            return self.rng.choice(neighbours)
+        return self.rng.choice([c for c in "etaoinshr" if c != char])
+
+    def keystrokes(self, target_text: str) -> Iterator[Tuple[float, str]]:
+        """
+        Generate a keystroke script that types target_text to the end.
+
+        Args:
+            target_text: Text to type
+
+        Yields:
+            Tuples of (seconds since the previous key, key), where key is a
+            character or BACKSPACE
+        """
+        index = 0
+        while index < len(target_text):
+            char = target_text[index]
+            if char == " " or self.rng.random() >= self.error_rate:
+                yield self._interval(), char
+                index += 1
+                continue
+
+            # Mistype, maybe keep going a few keys in the same word, then maybe correct
+            yield self._interval(), self._wrong_key(char)
+            if self.rng.random() >= self.correction_rate:
+                index += 1
+                continue
+            word_end = target_text.find(" ", index)
+            if word_end == -1:
+                word_end = len(target_text)
+            overrun = min(self.rng.randint(0, self.max_notice_delay), word_end - index - 1)
+            for offset in range(1, overrun + 1):
+                yield self._interval(), target_text[index + offset]
+            for _ in range(overrun + 1):
+                yield self._interval(), BACKSPACE
+            # Pause briefly on noticing, then retype the mistyped key correctly
+            yield self._interval() * 2, char
+            index += 1
+
+
+def feed_keys(engine: TypingEngine, clock: FakeClock, keys: str, interval: float = 0.1) -> None:
+    """
+    Type a fixed key sequence with evenly spaced keystrokes.
+
+    Args:
+        engine: Engine driven by clock
+        clock: Simulated clock of the engine
+        keys: Characters to type; BACKSPACE characters press backspace
+        interval: Seconds between keystrokes
+    """
+    for key in keys:
+        clock.advance(interval)
+        if key == BACKSPACE:
+            engine.handle_backspace()
+        else:
+            engine.handle_keypress(key)
+
+
+def run_script(engine: TypingEngine, clock: FakeClock, script: Iterator[Tuple[float, str]],
+               stop_at_time_limit: bool = True) -> int:
+    """
+    Feed a keystroke script into an engine, as the Tk key handler would.
+
+    Args:
+        engine: Engine driven by clock
+        clock: Simulated clock of the engine
+        script: (interval, key) pairs, e.g. from TypistModel.keystrokes
+        stop_at_time_limit: Stop once the engine's duration has elapsed
+
+    Returns:
+        Number of keystrokes fed
+    """
+    fed = 0
+    for interval, key in script:
+        clock.advance(interval)
+        if stop_at_time_limit and engine.is_active and engine.is_time_exceeded():
+            break
+        if key == BACKSPACE:
+            engine.handle_backspace()
+        else:
+            engine.handle_keypress(key)
+        fed += 1
+        if engine.is_completed():
+            break
+    return fed
+
+
+def simulate_test(target_text: str, duration: int = 30, model: Optional[TypistModel] = None,
+                  finish: bool = True) -> Tuple[TypingEngine, FakeClock]:
+    """
+    Run a complete simulated test.
+
+    Args:
+        target_text: Text to type
+        duration: Test duration in seconds
+        model: Typist model (default: 60 WPM, seeded)
+        finish: Call finish_test() at the end, as TypingScreen does
+
+    Returns:
+        Tuple of (engine, clock)
+    """
+    model = model or TypistModel(seed=0)
+    clock = FakeClock()
+    engine = TypingEngine(target_text, duration, clock=clock)
+    run_script(engine, clock, model.keystrokes(target_text))
+    if finish:
+        if engine.is_active and engine.is_time_exceeded():
+            # Finish exactly at the limit, as the end-of-test timer does
+            clock.now_ns = engine.start_time + duration * NS_PER_SECOND
+        engine.finish_test()
+    return engine, clock
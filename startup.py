@@ -0,0 +1,118 @@
+"""
+Startup Timing for ZenType
+Phase markers for measuring cold start, printed in the style of `python -X importtime`.
+
+Usage:
+    python -X zentype_startup main.py      # or ZENTYPE_STARTUP=1 python main.py
+
+Times are measured from the moment this module is imported, which main.py does first.
+"""
+
+import os
+import sys
+from typing import List, Optional, TextIO, Tuple
+from clock import Clock, default_clock
+
+# Captured at import, before main.py imports its UI modules
+PROCESS_START_NS = default_clock()
+
+# Target for the app to accept the first keystroke after launch
+STARTUP_BUDGET_MS = 300
+
+# `python -X zentype_startup` or this environment variable turns the report on
+STARTUP_XOPTION = "zentype_startup"
+STARTUP_ENV_VAR = "ZENTYPE_STARTUP"
+
+
+def timing_requested() -> bool:
+    """True if startup timing was requested on the command line or in the environment."""
+    return STARTUP_XOPTION in sys._xoptions or bool(os.environ.get(STARTUP_ENV_VAR))
+
+
+class StartupTimer:
+    """
+    Records named startup phases and prints one line per phase:
+
+        startup time: self [us] | cumulative | phase
+        startup time:     41210 |      41210 | imports
+        startup time:     88507 |     129717 | typing screen
+
+    Disabled timers record nothing, so markers can stay in the code permanently.
+    """
+
+    def __init__(self, enabled: bool = False, clock: Clock = default_clock,
+                 origin_ns: Optional[int] = None, stream: Optional[TextIO] = None):
+        """
+        Initialize timer.
+
+        Args:
+            enabled: Record and print phases
+            clock: Nanosecond clock
+            origin_ns: Time phases are measured from (default: import of this module)
+            stream: Where lines are printed (default: stderr, like -X importtime)
+        """
+        self.enabled = enabled
+        self.clock = clock
+        self.origin_ns = PROCESS_START_NS if origin_ns is None else origin_ns
+        self.stream = stream
+        self.marks: List[Tuple[str, int]] = []
+        self._header_printed = False
+
+    def _print(self, line: str) -> None:
+        print(line, file=self.stream if self.stream is not None else sys.stderr)
+
+    def mark(self, phase: str) -> None:
+        """
+        Record the end of a phase. Repeated phases are recorded once.
+
+        Args:
+            phase: Phase name
+        """
+        if not self.enabled or self.elapsed_ms(phase) is not None:
+            return
+        now = self.clock()
+        previous = self.marks[-1][1] if self.marks else self.origin_ns
+        self.marks.append((phase, now))
+        if not self._header_printed:
+            self._print("startup time: self [us] | cumulative | phase")
+            self._header_printed = True
+        self._print(f"startup time: {(now - previous) // 1000:>9} | "
+                    f"{(now - self.origin_ns) // 1000:>10} | {phase}")
+
+    def elapsed_ms(self, phase: str) -> Optional[float]:
+        """
+        Time from the origin to the end of a phase.
+
+        Args:
+            phase: Phase name
+
+        Returns:
+            Milliseconds, or None if the phase wasn't recorded
+        """
+        for name, moment in self.marks:
+            if name == phase:
+                return (moment - self.origin_ns) / 1e6
+        return None
+
+    def check_budget(self, phase: str, budget_ms: float = STARTUP_BUDGET_MS) -> Optional[bool]:
+        """
+        Print whether a phase finished within the startup budget.
+
+        Args:
+            phase: Phase that should finish within the budget
+            budget_ms: Budget in milliseconds
+
+        Returns:
+            True if within budget, False if over, None if the phase wasn't recorded
+        """
+        elapsed = self.elapsed_ms(phase)
+        if elapsed is None:
+            return None
+        within = elapsed <= budget_ms
+        self._print(f"startup time: {phase} after {elapsed:.0f} ms "
+                    f"({'within' if within else 'OVER'} {budget_ms:.0f} ms budget)")
+        return within
+
+
+# Shared timer used by the app's phase markers
+timer = StartupTimer(enabled=timing_requested())
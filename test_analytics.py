@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script to verify keystroke analytics.
+Runs on whichever backend is available (NumPy or the pure-Python fallback).
+"""
+
+from analytics import analyze, analyze_batch, analyze_engine, has_numpy
+from clock import NS_PER_SECOND
+from engine import KeystrokeLog, EVENT_BACKSPACE, EVENT_CORRECT, EVENT_INCORRECT
+from simulation import TypistModel, simulate_test
+from words import WordProvider
+
+
+def close(a: float, b: float) -> bool:
+    """Compare floats with a small tolerance."""
+    return abs(a - b) < 1e-9
+
+
+def build_log() -> KeystrokeLog:
+    """Type 'the t' + mistake + backspace + 'he' with known timings (seconds)."""
+    log = KeystrokeLog()
+    for code, char, seconds in [
+        (EVENT_CORRECT, "t", 0.0),
+        (EVENT_CORRECT, "h", 0.2),
+        (EVENT_CORRECT, "e", 0.3),
+        (EVENT_CORRECT, " ", 0.6),
+        (EVENT_CORRECT, "t", 0.8),
+        (EVENT_INCORRECT, "j", 1.0),
+        (EVENT_BACKSPACE, "", 1.5),
+        (EVENT_CORRECT, "h", 1.9),
+        (EVENT_CORRECT, "e", 2.0),
+    ]:
+        log.append(code, char, round(seconds * NS_PER_SECOND))
+    return log
+
+
+def test_single_test_metrics():
+    """Test interval, latency and error metrics against hand-computed values."""
+    print(f"Testing single-test analytics (NumPy: {has_numpy()})...")
+    analysis = analyze(build_log(), target_text="the the")
+
+    intervals = analysis["intervals"]
+    assert intervals["count"] == 8, f"Should have 8 intervals, got {intervals['count']}"
+    assert close(intervals["mean"], 0.25), f"Mean interval should be 0.25s, got {intervals['mean']}"
+    assert close(intervals["median"], 0.2), f"Median interval should be 0.2s, got {intervals['median']}"
+
+    h = analysis["char_latency"]["h"]
+    assert h["count"] == 2 and close(h["mean"], 0.3) and close(h["m2"], 0.02), f"Unexpected 'h' stats: {h}"
+    bigrams = analysis["bigram_latency"]
+    assert set(bigrams) == {"th", "he", "e ", " t"}, f"Unexpected bigrams: {sorted(bigrams)}"
+    assert bigrams["he"]["count"] == 2 and close(bigrams["he"]["mean"], 0.1), f"Unexpected 'he': {bigrams['he']}"
+    assert bigrams["th"]["count"] == 1, "The 'h' typed after a backspace has no bigram"
+
+    assert analysis["error_positions"] == [5], f"Error should be at position 5, got {analysis['error_positions']}"
+    assert analysis["char_errors"] == {"h": 1}, f"Error should count against 'h', got {analysis['char_errors']}"
+    assert close(analysis["error_rate"], 1 / 8), f"Error rate should be 1/8, got {analysis['error_rate']}"
+
+    # 7 correct keys within the 2s test
+    assert close(analysis["burst_wpm"], 7 / 5 / (2 / 60)), f"Unexpected burst WPM {analysis['burst_wpm']}"
+
+    print("  ✓ Single-test metrics match hand-computed values")
+    return True
+
+
+def test_matches_engine():
+    """Test that rolling WPM matches the engine on a simulated test."""
+    print("\nTesting rolling WPM against TypingEngine...")
+    engine, _ = simulate_test(WordProvider.generate_text(200), 30, TypistModel(wpm=75, seed=9))
+    analysis = analyze_engine(engine, interval=0.5, window=2.0)
+
+    expected = engine.get_rolling_wpm_history(interval=0.5, window=2.0)
+    assert len(analysis["rolling_wpm"]) == len(expected), "Rolling WPM should have one sample per interval"
+    assert all(close(a, b) for a, b in zip(analysis["rolling_wpm"], expected)), "Rolling WPM should match the engine"
+    assert analysis["burst_wpm"] >= engine.calculate_wpm(), "Burst WPM should be at least the average"
+    assert 0 < analysis["consistency"] < 1, f"Consistency CV should be in (0, 1), got {analysis['consistency']}"
+
+    print("  ✓ Rolling WPM matches the engine")
+    return True
+
+
+def test_batch():
+    """Test that batch analytics pool latency across tests and keep per-test results."""
+    print("\nTesting batch analytics...")
+    text = WordProvider.generate_text(100)
+    logs = [
+        simulate_test(text, 30, TypistModel(wpm=50 + 10 * i, seed=i))[0].keystrokes
+        for i in range(5)
+    ]
+    batch = analyze_batch(logs + [KeystrokeLog()])
+    singles = [analyze(log) for log in logs]
+
+    assert batch["tests"] == 6, f"Should have 6 tests, got {batch['tests']}"
+    assert batch["keystrokes"] == sum(len(log) for log in logs), "Keystrokes should be pooled"
+    assert batch["intervals"]["count"] == sum(s["intervals"]["count"] for s in singles), \
+        "Intervals must not span two tests"
+    for i, single in enumerate(singles):
+        per_test = batch["per_test"][i]
+        assert close(per_test["consistency"], single["consistency"]), f"Consistency mismatch in test {i}"
+        assert close(per_test["burst_wpm"], single["burst_wpm"]), f"Burst WPM mismatch in test {i}"
+    assert batch["per_test"][5]["keystrokes"] == 0, "Empty logs should be reported, not skipped"
+
+    for char, stats in batch["char_latency"].items():
+        counts = sum(s["char_latency"].get(char, {"count": 0})["count"] for s in singles)
+        assert stats["count"] == counts, f"Pooled count for {char!r} should be {counts}"
+
+    print(f"  ✓ {batch['keystrokes']} keystrokes across {batch['tests']} tests analyzed together")
+    return True
+
+
+def main():
+    """Run all analytics tests."""
+    print("=" * 60)
+    print("ZenType Analytics Test")
+    print("=" * 60)
+
+    tests = [
+        ("Single Test Metrics", test_single_test_metrics),
+        ("Matches Engine", test_matches_engine),
+        ("Batch", test_batch),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Analytics are working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
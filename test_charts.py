@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script to verify LTTB downsampling and the reusable-item line chart.
+Draws on a fake Canvas that records its items.
+"""
+
+import math
+import sys
+from charts import LineChart, lttb
+
+
+class FakeCanvas:
+    """Minimal stand-in for tkinter.Canvas that keeps item coordinates and options."""
+
+    def __init__(self):
+        self.items = {}
+        self.calls = 0
+
+    def _create(self, kind, coords, options):
+        self.calls += 1
+        item = len(self.items) + 1
+        self.items[item] = {"kind": kind, "coords": list(coords), **options}
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def coords(self, item, *coords):
+        self.calls += 1
+        flat = []
+        for value in coords:
+            flat.extend(value if isinstance(value, (list, tuple)) else [value])
+        self.items[item]["coords"] = flat
+
+    def itemconfigure(self, item, **options):
+        self.calls += 1
+        self.items[item].update(options)
+
+
+def test_lttb():
+    """Test that LTTB keeps the endpoints, one point per bucket, and the peaks."""
+    print("Testing LTTB downsampling...")
+    assert lttb([1, 2, 3], 10) == [0, 1, 2], "Short series should be kept whole"
+    assert lttb(list(range(100)), 2) == [0, 99], "Two points keep the endpoints"
+
+    values = [math.sin(i / 50) * 40 + 60 for i in range(9000)]
+    values[4321] = 400.0
+    indices = lttb(values, 520)
+    assert len(indices) == 520, f"Should keep 520 points, got {len(indices)}"
+    assert indices[0] == 0 and indices[-1] == 8999, "Endpoints should be kept"
+    assert all(a < b for a, b in zip(indices, indices[1:])), "Indices should increase"
+    assert 4321 in indices, "A spike should survive downsampling"
+
+    bucket_size = (9000 - 2) / (520 - 2)
+    for bucket, index in enumerate(indices[1:-1]):
+        assert int(bucket * bucket_size) + 1 <= index < int((bucket + 1) * bucket_size) + 1, \
+            f"Point {index} is outside bucket {bucket}"
+
+    print(f"  ✓ 9000 points reduced to {len(indices)} with the spike kept")
+    return True
+
+
+def test_line_chart():
+    """Test that redraws reuse one polyline and stay within the pixel width."""
+    print("\nTesting line chart...")
+    canvas = FakeCanvas()
+    chart = LineChart(canvas, width=600, height=200, margin=40)
+    item_count = len(canvas.items)
+    assert canvas.items[chart.line]["state"] == "hidden", "No line before the first plot"
+
+    assert chart.plot([10.0, 20.0, 40.0, 30.0]) == 4, "Short series are drawn point by point"
+    line = canvas.items[chart.line]
+    assert line["state"] == "normal", "Line should be shown"
+    assert line["coords"] == [40.0, 130.0, 213.33333333333334, 100.0, 386.6666666666667, 40.0, 560.0, 70.0], \
+        f"Points should span the plot area: {line['coords']}"
+    assert [canvas.items[label]["text"] for label in chart.labels] == ["0s", "0.8s", "1.5s", "2.2s", "3s"], \
+        "Labels should span the series"
+
+    # A 90 second test sampled every 10ms
+    values = [50 + 10 * math.sin(i / 300) for i in range(9001)]
+    canvas.calls = 0
+    points = chart.plot(values, x_step=0.01)
+    assert points <= chart.plot_width, f"At most one point per pixel, got {points}"
+    assert len(canvas.items) == item_count, "Redraws should not create canvas items"
+    assert canvas.calls == 2 + 2 * len(chart.labels), f"Redraw should take a fixed {canvas.calls} calls"
+    assert canvas.items[chart.labels[-1]]["text"] == "90s", "Last label should be the test length"
+
+    chart.plot([])
+    assert canvas.items[chart.line]["state"] == "hidden", "An empty series hides the line"
+    assert len(canvas.items) == item_count, "Clearing should not delete items"
+
+    sparkline = LineChart(FakeCanvas(), width=160, height=48, margin=4, x_labels=0, axes=False)
+    assert len(sparkline.canvas.items) == 1, "A sparkline is a single line item"
+    assert sparkline.plot([0.0] * 39) == 39, "A flat series should still be drawn"
+
+    print(f"  ✓ 9001 samples drawn as {points} points with {item_count} items")
+    return True
+
+
+def main():
+    """Run all chart tests."""
+    print("=" * 60)
+    print("ZenType Chart Test")
+    print("=" * 60)
+
+    tests = [
+        ("LTTB Downsampling", test_lttb),
+        ("Line Chart", test_line_chart),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Charts are working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,8 @@ Simulation script to test the complete flow from typing to results display.
 This mimics what happens when a user completes a typing test.
 """
 
-import time
 import logging
+from clock import FakeClock
 from engine import TypingEngine
 
 # Configure logging
@@ -26,7 +26,8 @@ def simulate_typing_test():
     print(f"  Target text: '{target_text}'")
     print(f"  Duration: {duration}s")
     
-    engine = TypingEngine(target_text, duration)
+    clock = FakeClock()
+    engine = TypingEngine(target_text, duration, clock=clock)
     
     # Simulate user typing (with some errors)
     print("\nSimulating user typing...")
@@ -50,6 +51,7 @@ def simulate_typing_test():
     ]
     
     for char, expected_correct in typing_sequence:
+        clock.advance(0.01)
         is_correct, idx = engine.handle_keypress(char)
         if is_correct != expected_correct:
             print(f"  WARNING: Expected {expected_correct} for '{char}', got {is_correct}")
@@ -57,8 +59,8 @@ def simulate_typing_test():
     print(f"  Typed: '{engine.input_text}'")
     print(f"  Progress: {engine.char_index}/{len(target_text)} characters")
     
-    # Wait a bit to simulate time passing
-    time.sleep(0.15)
+    # Simulate time passing
+    clock.advance(0.15)
     
     # Get metrics before finishing (what update_stats_loop does)
     print("\nMetrics during typing (from update_stats_loop):")
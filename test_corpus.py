@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script to verify memory-mapped word corpora and the corpus registry.
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from corpus import Corpus, CorpusRegistry, read_word_list, write_corpus
+from words import WordProvider
+
+
+def test_corpus_roundtrip():
+    """Test that a written corpus reads back word for word, including non-ASCII words."""
+    print("Testing corpus round trip...")
+    words = ["the", "naïve", "straße", "日本語", "def", "x"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "mixed.ztc"
+        assert write_corpus(path, words, [50, 40, 30, 20, 10, 1]) == len(words), "Wrong word count"
+
+        corpus = Corpus(path)
+        assert not corpus.is_open, "Corpus should not be mapped before first access"
+        assert len(corpus) == len(words), f"Expected {len(words)} words, got {len(corpus)}"
+        assert corpus.is_open, "len() should map the file"
+        assert list(corpus) == words, f"Words don't match: {list(corpus)}"
+        assert corpus[-1] == "x" and corpus[1:3] == ["naïve", "straße"], "Indexing doesn't match a list"
+        assert list(corpus.frequencies) == [50, 40, 30, 20, 10, 1], "Frequencies don't match"
+        try:
+            corpus[len(words)]
+            assert False, "Out-of-range index should raise IndexError"
+        except IndexError:
+            pass
+        corpus.close()
+        assert not corpus.is_open, "close() should unmap the file"
+        assert corpus[2] == "straße", "Corpus should reopen after close()"
+        corpus.close()
+
+        plain = Path(tmp) / "plain.ztc"
+        write_corpus(plain, ["a", "b"])
+        corpus = Corpus(plain)
+        assert corpus.frequencies is None, "Corpus without counts should have no frequencies"
+        corpus.close()
+
+        bogus = Path(tmp) / "bogus.ztc"
+        bogus.write_bytes(b"not a corpus at all")
+        try:
+            len(Corpus(bogus))
+            assert False, "A file without the magic header should be rejected"
+        except ValueError:
+            pass
+
+        truncated = Path(tmp) / "truncated.ztc"
+        truncated.write_bytes(path.read_bytes()[:-4])
+        try:
+            len(Corpus(truncated))
+            assert False, "A truncated file should be rejected"
+        except ValueError:
+            pass
+
+    print(f"  ✓ {len(words)} words, frequencies and bad files handled")
+    return True
+
+
+def test_word_list_import():
+    """Test reading text word lists with and without counts."""
+    print("\nTesting word list import...")
+    with tempfile.TemporaryDirectory() as tmp:
+        counted = Path(tmp) / "counted.txt"
+        counted.write_text("the\t500\nof 300\n\nand\t200\n", encoding="utf-8")
+        words, frequencies = read_word_list(counted)
+        assert words == ["the", "of", "and"], f"Unexpected words: {words}"
+        assert frequencies == [500, 300, 200], f"Unexpected counts: {frequencies}"
+
+        plain = Path(tmp) / "plain.txt"
+        plain.write_text("self\nreturn\nlambda\n", encoding="utf-8")
+        words, frequencies = read_word_list(plain)
+        assert words == ["self", "return", "lambda"] and frequencies is None, "Plain list misread"
+
+    print("  ✓ Counted and plain lists read")
+    return True
+
+
+def test_registry():
+    """Test that registering is free, corpora open on first use and are cached."""
+    print("\nTesting corpus registry...")
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(Path(tmp) / "code.ztc", ["def", "class", "return", "yield"])
+        write_corpus(Path(tmp) / "german.ztc", ["und", "der", "die"])
+        (Path(tmp) / "notes.txt").write_text("ignored", encoding="utf-8")
+
+        registry = CorpusRegistry()
+        registry.register("english", WordProvider.WORDS)
+        registry.register("missing", Path(tmp) / "missing.ztc")
+        assert registry.discover(tmp) == ["code", "german"], "discover() should find .ztc files only"
+        assert registry.names() == ["english", "missing", "code", "german"], f"Names: {registry.names()}"
+
+        code = registry.get("code")
+        assert not code.is_open, "get() should not map the file until it is read"
+        assert registry.get("code") is code, "Corpora should be cached across calls"
+        assert registry.get("english") is WordProvider.WORDS, "In-memory sources are returned as is"
+
+        provider = WordProvider(code, rng=random.Random(0))
+        text = provider.generate(200)
+        assert set(text.split()) <= {"def", "class", "return", "yield"}, "Words must come from the corpus"
+        assert code.is_open, "Sampling should map the file"
+
+        try:
+            len(registry.get("missing"))
+            assert False, "Reading a missing corpus should raise"
+        except OSError:
+            pass
+
+        registry.close_all()
+        assert not code.is_open, "close_all() should unmap opened corpora"
+
+    print("  ✓ Lazy registration, caching and sampling work")
+    return True
+
+
+def main():
+    """Run all corpus tests."""
+    print("=" * 60)
+    print("ZenType Corpus Test")
+    print("=" * 60)
+
+    tests = [
+        ("Corpus Round Trip", test_corpus_roundtrip),
+        ("Word List Import", test_word_list_import),
+        ("Corpus Registry", test_registry),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Corpora are working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
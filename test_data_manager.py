@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the JSON Lines storage of DataManager.
+Every test uses a throwaway data directory.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from data_manager import DataManager
+
+
+def make_result(wpm: float, timestamp: str) -> dict:
+    """Build a test result dictionary."""
+    return {"wpm": wpm, "accuracy": 95.0, "duration": 30, "total_chars_typed": 100, "timestamp": timestamp}
+
+
+def test_append_and_load():
+    """Test that results are appended one line each and read back."""
+    print("Testing append and load...")
+    with tempfile.TemporaryDirectory() as tmp:
+        dm = DataManager(data_dir=tmp)
+        dm.add_result(make_result(40, "2024-01-01T10:00:00"))
+        dm.add_result(make_result(60, "2024-01-02T10:00:00"))
+
+        lines = dm.results_file.read_text().splitlines()
+        assert len(lines) == 2, f"Should have 2 lines, got {len(lines)}"
+        assert [r["wpm"] for r in dm.load_results()] == [40, 60], "Results should load in order"
+        assert dm.get_statistics()["average_wpm"] == 50, "Average WPM should be 50"
+        assert [r["wpm"] for r in dm.get_recent_results(1)] == [60], "Newest result should come first"
+
+        dm.clear_all_data()
+        assert dm.load_results() == [], "Results should be empty after clear"
+
+    print("  ✓ Results appended and loaded correctly")
+    return True
+
+
+def test_legacy_migration():
+    """Test the one-shot migration from the legacy JSON array file."""
+    print("\nTesting legacy JSON migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = [make_result(30 + i, f"2024-01-0{i + 1}T10:00:00") for i in range(3)]
+        (Path(tmp) / "typing_results.json").write_text(json.dumps(legacy, indent=2))
+
+        dm = DataManager(data_dir=tmp)
+        assert dm.load_results() == legacy, "Migrated results should match the legacy file"
+        assert not (Path(tmp) / "typing_results.json").exists(), "Legacy file should be renamed"
+        assert (Path(tmp) / "typing_results.json.migrated").exists(), "Legacy file should be kept"
+
+        # A second start must not migrate again
+        dm = DataManager(data_dir=tmp)
+        assert len(dm.load_results()) == 3, "Results should not be duplicated"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A legacy file truncated by a crash mid-write must not stop the app starting
+        legacy_file = Path(tmp) / "typing_results.json"
+        legacy_file.write_text(json.dumps([make_result(30, "2024-01-01T10:00:00")] * 2)[:-20])
+        dm = DataManager(data_dir=tmp)
+        assert dm.load_results() == [], "Should start with an empty results file"
+        assert legacy_file.exists(), "Unreadable legacy file should be left in place"
+        dm.add_result(make_result(40, "2024-01-02T10:00:00"))
+        assert [r["wpm"] for r in dm.load_results()] == [40], "New results should be saved"
+
+    print("  ✓ Legacy results migrated once")
+    return True
+
+
+def test_torn_write_recovery():
+    """Test that a partial last line from a crash is discarded."""
+    print("\nTesting torn write recovery...")
+    with tempfile.TemporaryDirectory() as tmp:
+        dm = DataManager(data_dir=tmp)
+        dm.add_result(make_result(40, "2024-01-01T10:00:00"))
+        with open(dm.results_file, "a") as f:
+            f.write('{"wpm": 99, "accur')
+
+        dm = DataManager(data_dir=tmp)
+        dm.add_result(make_result(50, "2024-01-02T10:00:00"))
+        assert [r["wpm"] for r in dm.load_results()] == [40, 50], "Partial line should be dropped"
+
+    print("  ✓ Partial last line discarded")
+    return True
+
+
+def main():
+    """Run all data manager tests."""
+    print("=" * 60)
+    print("ZenType Data Manager Test")
+    print("=" * 60)
+
+    tests = [
+        ("Append and Load", test_append_and_load),
+        ("Legacy Migration", test_legacy_migration),
+        ("Torn Write Recovery", test_torn_write_recovery),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Data manager is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Test script to verify DatabaseManager and its shared connection pool.
+Every test uses a throwaway database file in a temporary directory.
+"""
+
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from clock import NS_PER_SECOND
+from database import (DatabaseManager, MIGRATIONS, _summary_remove_sql, _summary_upsert_sql,
+                      close_all_pools, get_pool)
+from engine import KeystrokeLog, TypingEngine, EVENT_BACKSPACE, EVENT_CORRECT, EVENT_INCORRECT
+from event_codec import decode_events, encode_events
+from analytics import analyze, analyze_batch
+from simulation import TypistModel, simulate_test
+from words import WordProvider
+
+
+def make_result(wpm: float, duration: int = 30, timestamp: str = None) -> dict:
+    """Build a test result dictionary."""
+    result = {
+        "wpm": wpm,
+        "accuracy": 95.0,
+        "duration": duration,
+        "elapsed_time": float(duration),
+        "correct_chars": int(wpm * 5),
+        "total_chars_typed": int(wpm * 5) + 5,
+        "total_chars_in_test": 300,
+        "char_index": int(wpm * 5),
+    }
+    if timestamp is not None:
+        result["timestamp"] = timestamp
+    return result
+
+
+def test_add_and_query():
+    """Test adding results and reading statistics back."""
+    print("Testing add and query...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        db.add_result(make_result(40, timestamp="2024-01-01T10:00:00"))
+        db.add_result(make_result(60, duration=60, timestamp="2024-01-02T10:00:00"))
+
+        stats = db.get_statistics()
+        assert stats["total_tests"] == 2, f"Should have 2 tests, got {stats['total_tests']}"
+        assert stats["best_wpm"] == 60, f"Best WPM should be 60, got {stats['best_wpm']}"
+        assert stats["average_wpm"] == 50, f"Average WPM should be 50, got {stats['average_wpm']}"
+
+        recent = db.get_recent_results(10)
+        assert [r["wpm"] for r in recent] == [60, 40], f"Newest result should come first, got {recent}"
+        assert len(db.get_results_by_duration(60)) == 1, "Should have 1 result for 60s"
+
+        db.clear_all_data()
+        assert db.get_statistics()["total_tests"] == 0, "Statistics should be empty after clear"
+        close_all_pools()
+
+    print("  ✓ Results stored and queried correctly")
+    return True
+
+
+def test_shared_pool():
+    """Test that managers for the same file share one tuned pool."""
+    print("\nTesting shared connection pool...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "zentype.db")
+        first = DatabaseManager(db_path)
+        second = DatabaseManager(db_path)
+        assert first.pool is second.pool, "Managers should share one pool"
+        assert first.pool is get_pool(db_path), "get_pool should return the shared pool"
+
+        with first.pool.connection() as connection:
+            journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+        assert journal_mode == "wal", f"Journal mode should be WAL, got {journal_mode}"
+        assert synchronous == 1, f"Synchronous should be NORMAL (1), got {synchronous}"
+
+        first.add_result(make_result(50))
+        assert second.get_statistics()["total_tests"] == 1, "Second manager should see the result"
+        close_all_pools()
+
+    print("  ✓ Managers share a WAL-tuned pool")
+    return True
+
+
+def test_worker_threads():
+    """Test that pooled connections can be used from worker threads."""
+    print("\nTesting worker thread access...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    db.add_result(make_result(45))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, f"Worker threads raised errors: {errors}"
+        total = db.get_statistics()["total_tests"]
+        assert total == 120, f"Should have 120 results, got {total}"
+        assert len(db.pool._all) <= db.pool.size, "Pool should not exceed its size"
+        close_all_pools()
+
+    print("  ✓ Worker threads write through the pool safely")
+    return True
+
+
+def test_legacy_migration():
+    """Test that an unversioned database is migrated and backfilled."""
+    print("\nTesting legacy schema migration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "zentype.db")
+        legacy = sqlite3.connect(db_path)
+        legacy.execute("""
+            CREATE TABLE typing_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+                wpm REAL NOT NULL, accuracy REAL NOT NULL, duration INTEGER NOT NULL,
+                elapsed_time REAL, correct_chars INTEGER, total_chars_typed INTEGER,
+                total_chars_in_test INTEGER, char_index INTEGER
+            )
+        """)
+        legacy.execute(
+            "INSERT INTO typing_results (timestamp, wpm, accuracy, duration) "
+            "VALUES ('1970-01-01T00:00:01.250000', 42, 90, 30)"
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = DatabaseManager(db_path)
+        with db.pool.connection() as connection:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            timestamp_ms = connection.execute("SELECT timestamp_ms FROM typing_results").fetchone()[0]
+            plan = " ".join(row[3] for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM typing_results "
+                "WHERE duration = 30 ORDER BY timestamp_ms DESC, id DESC"
+            ))
+        assert version == len(MIGRATIONS), f"Schema should be at version {len(MIGRATIONS)}, got {version}"
+        assert timestamp_ms == 1250, f"Backfilled timestamp_ms should be 1250, got {timestamp_ms}"
+        assert "idx_typing_results_duration_timestamp" in plan, f"Query should use the index: {plan}"
+        assert "TEMP B-TREE" not in plan, f"Query should not sort: {plan}"
+
+        db.add_result(make_result(50, timestamp="1970-01-01T00:00:02"))
+        recent = db.get_recent_results(10)
+        assert [r["wpm"] for r in recent] == [50, 42], f"Newest result should come first, got {recent}"
+        close_all_pools()
+
+    print("  ✓ Legacy database migrated, backfilled and indexed")
+    return True
+
+
+def test_stats_summary():
+    """Test that stats_summary follows inserts and deletes and can be rebuilt."""
+    print("\nTesting stats summary...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        assert db.get_statistics()["last_result_id"] == 0, "An empty database covers no results"
+        db.add_result(make_result(40))
+        db.add_result(make_result(80))
+        newest = db.add_result(make_result(70, duration=60))
+
+        stats = db.get_statistics()
+        assert stats["total_tests"] == 3, f"Should have 3 tests, got {stats['total_tests']}"
+        assert stats["last_result_id"] == newest, f"Totals should cover result {newest}"
+        assert stats["best_wpm"] == 80, f"Best WPM should be 80, got {stats['best_wpm']}"
+        thirty = db.get_statistics(duration=30)
+        assert thirty["total_tests"] == 2, f"Should have 2 tests of 30s, got {thirty['total_tests']}"
+        assert thirty["average_wpm"] == 60, f"30s average should be 60, got {thirty['average_wpm']}"
+
+        # Deleting the best result must not leave a stale best
+        with db.pool.connection() as connection, connection:
+            connection.execute("DELETE FROM typing_results WHERE wpm = 80")
+        assert db.get_statistics()["best_wpm"] == 70, "Best WPM should fall back to 70"
+        assert db.get_statistics(duration=30)["best_wpm"] == 40, "30s best should fall back to 40"
+        assert db.check_stats_summary() == [], "Summary should be consistent"
+
+        # Simulate drift, detect it and rebuild
+        with db.pool.connection() as connection, connection:
+            connection.execute("UPDATE stats_summary SET total_tests = 99 WHERE scope = 60")
+        assert db.check_stats_summary() == [60], f"Drift should be reported for 60s"
+        db.rebuild_stats_summary()
+        assert db.check_stats_summary() == [], "Summary should be consistent after rebuild"
+
+        db.clear_all_data()
+        assert db.get_statistics()["total_tests"] == 0, "Statistics should be empty after clear"
+        close_all_pools()
+
+    print("  ✓ Stats summary maintained, checked and rebuilt")
+    return True
+
+
+def test_results_without_duration():
+    """Test that results saved without a duration don't collide with the all-durations totals."""
+    print("\nTesting results without a duration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "zentype.db")
+        db = DatabaseManager(db_path)
+        db.add_result({"wpm": 50, "accuracy": 90})
+        db.add_result(make_result(70))
+
+        stats = db.get_statistics()
+        assert stats["total_tests"] == 2, f"Each result should be counted once, got {stats['total_tests']}"
+        assert db.get_statistics(duration=0)["total_tests"] == 1, "The result without a duration has its own row"
+        db.rebuild_stats_summary()
+        assert db.check_stats_summary() == [], "Summary should rebuild without conflicts"
+
+        # A database summarized before the fix, with the global row on scope 0
+        with db.pool.connection() as connection, connection:
+            connection.execute("DROP TRIGGER trg_typing_results_summary_insert")
+            connection.execute("DROP TRIGGER trg_typing_results_summary_delete")
+            connection.execute(f"CREATE TRIGGER trg_typing_results_summary_insert AFTER INSERT ON typing_results "
+                               f"BEGIN {_summary_upsert_sql('0')} {_summary_upsert_sql('NEW.duration')} END")
+            connection.execute(f"CREATE TRIGGER trg_typing_results_summary_delete AFTER DELETE ON typing_results "
+                               f"BEGIN {_summary_remove_sql('0')} {_summary_remove_sql('OLD.duration')} END")
+            connection.execute("DELETE FROM stats_summary")
+            connection.execute("DELETE FROM typing_results")
+            connection.execute(f"PRAGMA user_version = {len(MIGRATIONS) - 1}")
+        db.add_result({"wpm": 50, "accuracy": 90})
+        db.add_result(make_result(70))
+        close_all_pools()
+
+        db = DatabaseManager(db_path)
+        assert db.get_statistics()["total_tests"] == 2, "Migration should recount the summary"
+        assert db.check_stats_summary() == [], "Summary should be consistent after migrating"
+        db.add_result({"wpm": 60, "accuracy": 90})
+        assert db.get_statistics()["total_tests"] == 3, "New triggers should count each result once"
+        close_all_pools()
+
+        # An unversioned database holding a result with duration 0 migrates cleanly
+        legacy_path = str(Path(tmp) / "legacy.db")
+        legacy = sqlite3.connect(legacy_path)
+        legacy.execute("""
+            CREATE TABLE typing_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+                wpm REAL NOT NULL, accuracy REAL NOT NULL, duration INTEGER NOT NULL,
+                elapsed_time REAL, correct_chars INTEGER, total_chars_typed INTEGER,
+                total_chars_in_test INTEGER, char_index INTEGER
+            )
+        """)
+        legacy.execute("INSERT INTO typing_results (timestamp, wpm, accuracy, duration) "
+                       "VALUES ('2024-01-01T00:00:00', 42, 90, 0)")
+        legacy.commit()
+        legacy.close()
+        assert DatabaseManager(legacy_path).get_statistics()["total_tests"] == 1, "Legacy result counted once"
+        close_all_pools()
+
+    print("  ✓ Results without a duration are counted once")
+    return True
+
+
+def make_keystrokes(count: int, start_time: int) -> KeystrokeLog:
+    """Build a keystroke log of roughly 100 WPM with some errors and backspaces."""
+    log = KeystrokeLog()
+    timestamp = start_time
+    for i in range(count):
+        timestamp += 100_000_000 + (i % 7) * 3_000_000
+        if i % 29 == 0:
+            log.append(EVENT_BACKSPACE, "", timestamp)
+        else:
+            log.append(EVENT_INCORRECT if i % 17 == 0 else EVENT_CORRECT, "abcde "[i % 6], timestamp)
+    return log
+
+
+def test_test_events():
+    """Test encoding, storing, streaming and cascading deletes of keystroke events."""
+    print("\nTesting keystroke event storage...")
+    start_time = 5 * NS_PER_SECOND
+    log = make_keystrokes(900, start_time)
+
+    blob = encode_events(log, start_time)
+    assert len(blob) < 4096, f"A 90s test should encode to a few KB, got {len(blob)} bytes"
+    decoded = decode_events(blob)
+    assert bytes(decoded.codes) == bytes(log.codes), "Event codes should round-trip"
+    assert list(decoded.chars) == list(log.chars), "Characters should round-trip"
+    assert list(decoded.timestamps) == [t - start_time for t in log.timestamps], \
+        "Timestamps should round-trip relative to the test start"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        first = db.add_result(make_result(40), log, start_time)
+        db.add_result(make_result(50))
+        third = db.add_result(make_result(60), make_keystrokes(10, 0), 0)
+
+        streamed = [(result_id, len(events)) for result_id, events in db.iter_test_events(batch_size=1)]
+        assert streamed == [(first, 900), (third, 10)], f"Unexpected streamed events: {streamed}"
+
+        # The stored log redraws the same chart as the live engine
+        engine = TypingEngine.from_keystrokes(db.get_test_events(first), 90, 90.0)
+        live = TypingEngine.from_keystrokes(log, 90, 90.0)
+        live.start_time = start_time
+        live.end_time = start_time + 90 * NS_PER_SECOND
+        assert engine.get_wpm_history() == live.get_wpm_history(), "Replayed WPM history should match"
+
+        with db.pool.connection() as connection, connection:
+            connection.execute("DELETE FROM typing_results WHERE id = ?", (first,))
+        assert db.get_test_events(first) is None, "Events should be deleted with their result"
+        db.clear_all_data()
+        assert list(db.iter_test_events()) == [], "Clearing results should clear events"
+        close_all_pools()
+
+    print(f"  ✓ 900 keystrokes stored in {len(blob)} bytes and streamed back")
+    return True
+
+
+def test_latency_stats():
+    """Test that per-key latency merges across tests like a pooled recount."""
+    print("\nTesting key and bigram latency stats...")
+    text = WordProvider.generate_text(120)
+    engines = [
+        simulate_test(text, 30, TypistModel(wpm=wpm, error_rate=0.08, seed=wpm))[0]
+        for wpm in (45, 70, 95)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        db.add_result(make_result(45), engines[0].keystrokes, engines[0].start_time, text)
+        # The other two go in one batch, as the background writer does
+        db.add_results([
+            (make_result(engine.calculate_wpm()), engine.keystrokes, engine.start_time, text)
+            for engine in engines[1:]
+        ])
+
+        pooled = analyze_batch(engine.keystrokes for engine in engines)["char_latency"]
+        expected_errors = {}
+        for engine in engines:
+            for key, count in analyze(engine.keystrokes, target_text=text)["char_errors"].items():
+                expected_errors[key] = expected_errors.get(key, 0) + count
+
+        with db.pool.connection() as connection:
+            rows = {row["key"]: row for row in connection.execute("SELECT * FROM key_stats")}
+            plan = " ".join(row[3] for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM key_stats WHERE count >= 10 "
+                "ORDER BY mean_latency DESC LIMIT 5"
+            ))
+        for key, stats in pooled.items():
+            row = rows[key]
+            assert row["count"] == stats["count"], f"Count mismatch for {key!r}"
+            assert abs(row["mean_latency"] - stats["mean"]) < 1e-9, f"Mean mismatch for {key!r}"
+            assert abs(row["m2"] - stats["m2"]) < 1e-9, f"M2 mismatch for {key!r}"
+        assert {key: row["errors"] for key, row in rows.items() if row["errors"]} == expected_errors, \
+            "Errors should be attributed to the intended keys"
+        assert "idx_key_stats_mean_latency" in plan, f"Weakest keys should use the index: {plan}"
+
+        weakest = db.get_weakest_keys(limit=3, min_count=5)
+        latencies = [entry["mean_latency"] for entry in weakest]
+        assert len(weakest) == 3 and latencies == sorted(latencies, reverse=True), \
+            f"Weakest keys should be slowest first: {weakest}"
+        assert db.get_weakest_keys(limit=3, min_count=5, bigrams=True), "Bigram stats should be stored"
+
+        db.clear_all_data()
+        assert db.get_weakest_keys(min_count=0) == [], "Clearing results should clear latency stats"
+        close_all_pools()
+
+    print(f"  ✓ Slowest key: {weakest[0]['key']!r} at {weakest[0]['mean_latency'] * 1000:.0f} ms")
+    return True
+
+
+def main():
+    """Run all database tests."""
+    print("=" * 60)
+    print("ZenType Database Test")
+    print("=" * 60)
+
+    tests = [
+        ("Add and Query", test_add_and_query),
+        ("Shared Pool", test_shared_pool),
+        ("Worker Threads", test_worker_threads),
+        ("Legacy Migration", test_legacy_migration),
+        ("Stats Summary", test_stats_summary),
+        ("Results Without Duration", test_results_without_duration),
+        ("Test Events", test_test_events),
+        ("Latency Stats", test_latency_stats),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Database layer is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
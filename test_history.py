@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Test script to verify keyset history pages and the virtualized history window.
+Every test uses a throwaway database file in a temporary directory.
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from database import DatabaseManager, close_all_pools, to_epoch_ms
+from history import ResultWindow
+
+START = datetime(2024, 1, 1)
+
+
+def seeded_database(tmp: str, count: int) -> DatabaseManager:
+    """Store `count` results an hour apart, cycling through durations, with some shared timestamps."""
+    db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+    entries = []
+    for i in range(count):
+        # Every fifth result shares its timestamp with the previous one, so ids break ties
+        moment = START + timedelta(hours=i - (1 if i % 5 == 4 else 0))
+        result = {
+            "wpm": float(i % 120), "accuracy": 95.0, "duration": (30, 60, 90)[i % 3],
+            "elapsed_time": 30.0, "timestamp": moment.isoformat(),
+        }
+        entries.append((result, None, None, None))
+    db.add_results(entries)
+    return db
+
+
+def newest_first(db: DatabaseManager, **filters) -> list:
+    """Every matching result id in history order, read without pagination."""
+    clauses, params = db._result_filters(filters.get("duration"), filters.get("since"), filters.get("until"))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    with db.pool.connection() as connection:
+        rows = connection.execute(
+            f"SELECT id FROM typing_results {where} ORDER BY timestamp_ms DESC, id DESC", params
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def test_results_pages():
+    """Test that keyset pages walk the whole history in order, both ways and filtered."""
+    print("Testing keyset result pages...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = seeded_database(tmp, 500)
+        expected = newest_first(db)
+
+        walked, page = [], db.get_results_page(limit=37)
+        while page:
+            walked.extend(row["id"] for row in page)
+            last = page[-1]
+            page = db.get_results_page(limit=37, before=(last["timestamp_ms"], last["id"]))
+        assert walked == expected, "Walking pages backwards should visit every result once, in order"
+
+        oldest = db.get_results_page(limit=1, before=(0, 0)) or None
+        assert oldest is None, "Nothing is older than the epoch"
+        middle = db.get_results_page(limit=10, before=(to_epoch_ms(START + timedelta(hours=250)), 0))
+        newer = db.get_results_page(limit=10, after=(middle[0]["timestamp_ms"], middle[0]["id"]))
+        position = expected.index(middle[0]["id"])
+        assert [row["id"] for row in newer] == expected[position - 10:position], \
+            "after= should return the rows just newer, newest first"
+
+        since, until = START + timedelta(days=3), START + timedelta(days=6)
+        filtered = db.get_results_page(limit=1000, duration=60, since=since, until=until)
+        assert [row["id"] for row in filtered] == newest_first(db, duration=60, since=since, until=until), \
+            "Filtered page doesn't match"
+        assert all(row["duration"] == 60 for row in filtered), "Duration filter leaked other durations"
+        assert db.count_results(duration=60, since=since, until=until) == len(filtered), "Count doesn't match"
+        assert db.count_results(duration=60) == len(newest_first(db, duration=60)), "Summary count doesn't match"
+        # The last result shares the timestamp of the one before it
+        assert db.get_timestamp_range() == (to_epoch_ms(START), to_epoch_ms(START + timedelta(hours=498))), \
+            f"Unexpected range {db.get_timestamp_range()}"
+        assert db.get_timestamp_range(since=START + timedelta(days=365)) is None, "Empty range should be None"
+        close_all_pools()
+
+    print(f"  ✓ {len(expected)} results paged in order with filters")
+    return True
+
+
+def test_page_query_plans():
+    """Test that every kind of page is an index search in index order, without a sort."""
+    print("\nTesting page query plans...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = seeded_database(tmp, 50)
+        key = (to_epoch_ms(START + timedelta(hours=20)), 0)
+        cases = {
+            "first page": ({}, "idx_typing_results_timestamp"),
+            "older page": ({"before": key}, "idx_typing_results_timestamp"),
+            "newer page": ({"after": key}, "idx_typing_results_timestamp"),
+            "duration page": ({"before": key, "duration": 30}, "idx_typing_results_duration_timestamp"),
+            "date range": ({"duration": 30, "since": START, "until": START + timedelta(days=1)},
+                           "idx_typing_results_duration_timestamp"),
+        }
+        with db.pool.connection() as connection:
+            for name, (filters, index) in cases.items():
+                filters = {"before": None, "after": None, "duration": None, "since": None, "until": None, **filters}
+                query, params = db._results_page_query(10, **filters)
+                plan = " ".join(row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {query}", params))
+                assert f"USING INDEX {index}" in plan, f"{name} should use {index}: {plan}"
+                assert "TEMP B-TREE" not in plan, f"{name} should not sort: {plan}"
+        close_all_pools()
+
+    print(f"  ✓ {len(cases)} page queries read an index in order")
+    return True
+
+
+def test_result_window():
+    """Test scrolling, trimming and jumping in the virtualized window."""
+    print("\nTesting virtualized result window...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = seeded_database(tmp, 1000)
+        expected = newest_first(db)
+        window = ResultWindow(db, visible_rows=10, buffer_rows=60, page_size=20)
+        window.set_filters()
+        assert [row["id"] for row in window.visible()] == expected[:10], "Should start at the newest results"
+        assert window.scroll_fraction()[0] == 0.0, "Thumb should start at the top"
+
+        # Scroll to the bottom, checking every view against the full ordering
+        position = 0
+        while True:
+            window.scroll(7)
+            position = min(position + 7, len(expected) - 10)
+            assert [row["id"] for row in window.visible()] == expected[position:position + 10], \
+                f"Wrong rows after scrolling to {position}"
+            assert len(window.buffer) <= 60, f"Buffer grew to {len(window.buffer)} rows"
+            if position == len(expected) - 10:
+                break
+        window.scroll(50)
+        assert [row["id"] for row in window.visible()] == expected[-10:], "Should stop at the oldest results"
+
+        # And back up past trimmed rows
+        for _ in range(200):
+            window.scroll(-9)
+        assert [row["id"] for row in window.visible()] == expected[:10], "Should scroll back to the newest"
+
+        window.jump_to(0.5)
+        first = window.visible()[0]
+        middle = to_epoch_ms(START + timedelta(hours=499))
+        assert abs(first["timestamp_ms"] - middle) <= 3600 * 1000, "Jump should land in the middle of time"
+        assert 0.45 < window.scroll_fraction()[0] < 0.55, f"Thumb should be mid-way: {window.scroll_fraction()}"
+        window.jump_to(1.0)
+        assert [row["id"] for row in window.visible()] == expected[-10:], "Jump to the end shows the oldest"
+
+        window.set_filters(duration=90, since=START + timedelta(days=40))
+        assert [row["id"] for row in window.visible()] == newest_first(
+            db, duration=90, since=START + timedelta(days=40))[:10], "Filters should apply to the window"
+        window.set_filters(since=START + timedelta(days=365))
+        assert window.visible() == [] and window.scroll_fraction() == (0.0, 1.0), "No rows should match"
+        close_all_pools()
+
+    print("  ✓ Window scrolls, trims and jumps with bounded memory")
+    return True
+
+
+def test_load_newer():
+    """Test that new results are added to the window without reloading it."""
+    print("\nTesting incremental window updates...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = seeded_database(tmp, 200)
+        window = ResultWindow(db, visible_rows=10, buffer_rows=60, page_size=20)
+        window.set_filters()
+
+        def add(count, first_hour):
+            db.add_results([({"wpm": 50.0, "accuracy": 95.0, "duration": 30, "elapsed_time": 30.0,
+                              "timestamp": (START + timedelta(hours=first_hour + i)).isoformat()},
+                             None, None, None) for i in range(count)])
+
+        # At the top, new rows come into view
+        add(3, 1000)
+        assert window.load_newer() == 3, "Should fetch just the three new results"
+        expected = newest_first(db)
+        assert [row["id"] for row in window.visible()] == expected[:10], "New results should show at the top"
+        assert window.total == 203, f"Total should count new results: {window.total}"
+
+        # Scrolled down, the view stays on the same rows
+        window.scroll(5)
+        before = [row["id"] for row in window.visible()]
+        add(45, 2000)
+        assert window.load_newer() == 45, "Should fetch new results across several pages"
+        assert [row["id"] for row in window.visible()] == before, "View should not move when scrolled"
+        assert len(window.buffer) <= 60, f"Buffer grew to {len(window.buffer)} rows"
+        for _ in range(20):
+            window.scroll(-3)
+        assert [row["id"] for row in window.visible()] == newest_first(db)[:10], "Should scroll up to new rows"
+
+        # Far from the newest rows only the counts change
+        window.jump_to(1.0)
+        tail = [row["id"] for row in window.visible()]
+        add(2, 3000)
+        assert window.load_newer() == 0 and window.total == 250, "Only the total should change"
+        assert [row["id"] for row in window.visible()] == tail, "View should stay on the oldest results"
+        assert window.scroll_fraction()[0] > 0.9, "Thumb should still be near the bottom"
+        close_all_pools()
+
+    print("  ✓ New results are added incrementally")
+    return True
+
+
+def main():
+    """Run all history tests."""
+    print("=" * 60)
+    print("ZenType History Test")
+    print("=" * 60)
+
+    tests = [
+        ("Keyset Result Pages", test_results_pages),
+        ("Page Query Plans", test_page_query_plans),
+        ("Virtualized Result Window", test_result_window),
+        ("Incremental Window Updates", test_load_newer),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! History paging is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -5,7 +5,9 @@ Tests the TypingEngine functionality which underlies the key bindings.
 """
 
 import logging
-from engine import TypingEngine
+import random
+from engine import TypingEngine, EVENT_CORRECT, EVENT_INCORRECT, EVENT_BACKSPACE, STREAM_LOOKAHEAD_CHARS
+from words import WordProvider, MODE_FREQUENCY
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s %(name)s] %(message)s')
@@ -109,6 +111,48 @@ def test_backspace_at_word_boundary():
     return True
 
 
+def test_backspace_in_long_word():
+    """Test that the word boundary is tracked through long words and errors."""
+    print("\nTesting backspace in a long word...")
+    long_word = "x" * 500
+    engine = TypingEngine(f"ab {long_word} cd", 30)
+
+    for char in "ab ":
+        engine.handle_keypress(char)
+    for _ in range(300):
+        engine.handle_keypress('x')
+    engine.handle_keypress('y')  # Incorrect
+    assert engine.current_word_start == 3, f"Word should start at 3, got {engine.current_word_start}"
+
+    for _ in range(400):
+        engine.handle_backspace()
+    assert engine.char_index == 3, f"Backspace should stop at word start 3, got {engine.char_index}"
+    assert engine.input_text == "ab ", f"Input should be 'ab ', got '{engine.input_text}'"
+
+    print("  ✓ Backspace stops at the start of a long word")
+    return True
+
+
+def test_character_status():
+    """Test per-position character status after typing and backspace."""
+    print("\nTesting character status...")
+    engine = TypingEngine("test", 30)
+
+    engine.handle_keypress('t')  # Correct
+    engine.handle_keypress('x')  # Incorrect (should be 'e')
+    statuses = [engine.get_character_status(i) for i in range(4)]
+    assert statuses == ["correct", "error", "unwritten", "unwritten"], f"Unexpected statuses: {statuses}"
+
+    engine.handle_backspace()
+    engine.handle_keypress('e')  # Correct
+    statuses = [engine.get_character_status(i) for i in range(4)]
+    assert statuses == ["correct", "correct", "unwritten", "unwritten"], f"Unexpected statuses: {statuses}"
+    assert engine.input_text == "te", f"Input text should be 'te', got '{engine.input_text}'"
+
+    print("  ✓ Character status tracked per position")
+    return True
+
+
 def test_wpm_calculation():
     """Test WPM calculation."""
     print("\nTesting WPM calculation...")
@@ -162,6 +206,70 @@ def test_completion_detection():
     return True
 
 
+def test_keystroke_log():
+    """Test that keystrokes are recorded in the columnar log."""
+    print("\nTesting keystroke log...")
+    engine = TypingEngine("hello", 30)
+
+    engine.handle_keypress('h')  # Correct
+    engine.handle_keypress('x')  # Incorrect (should be 'e')
+    engine.handle_backspace()
+
+    log = engine.keystrokes
+    assert len(log) == 3, f"Should have 3 keystrokes, got {len(log)}"
+    assert list(log.codes) == [EVENT_CORRECT, EVENT_INCORRECT, EVENT_BACKSPACE], \
+        f"Unexpected event codes: {list(log.codes)}"
+    assert list(log.chars) == [ord('h'), ord('x'), 0], f"Unexpected chars: {list(log.chars)}"
+    timestamps = log.timestamps
+    assert all(a <= b for a, b in zip(timestamps, timestamps[1:])), "Timestamps should be monotonic"
+    del timestamps
+
+    engine.reset()
+    assert len(engine.keystrokes) == 0, "Reset should clear the keystroke log"
+
+    print("  ✓ Keystroke log records codes, chars and timestamps")
+    return True
+
+
+def test_text_stream():
+    """Test that a streaming engine keeps text ahead of the cursor and never runs out."""
+    print("\nTesting streamed target text...")
+    chunks = iter(["alpha beta"] + [" gamma delta"] * 1000)
+    engine = TypingEngine("", 30, text_stream=chunks)
+    assert len(engine.target_text) >= STREAM_LOOKAHEAD_CHARS, "Lookahead should be filled up front"
+    assert engine.target_text.startswith("alpha beta gamma delta"), "Chunks should join with spaces"
+
+    typed = 5 * STREAM_LOOKAHEAD_CHARS
+    for _ in range(typed):
+        engine.handle_keypress(engine.target_text[engine.char_index])
+        assert len(engine.target_text) > engine.char_index, "The cursor reached the end of the text"
+    assert not engine.is_completed(), "A streaming engine should not run out of text"
+    assert engine.correct_chars == typed and engine.input_text == engine.target_text[:typed], \
+        "Input buffer should survive growing"
+    assert len(engine.char_status) >= len(engine.target_text), "Status buffer should cover the text"
+    assert len(engine.target_text) - engine.char_index <= STREAM_LOOKAHEAD_CHARS + len(" gamma delta") + 6, \
+        "Text should be pulled lazily, not far ahead of the cursor"
+
+    finite = TypingEngine("", 30, text_stream=iter(["one two", " three"]))
+    assert finite.target_text == "one two three" and finite.text_stream is None, "Stream should be drained"
+    for char in "one two three":
+        finite.handle_keypress(char)
+    assert finite.is_completed(), "An exhausted stream should complete like fixed text"
+
+    provider_stream = WordProvider().stream(chunk_words=4)
+    first, second = next(provider_stream), next(provider_stream)
+    assert len(first.split()) == 4 and not first.startswith(" "), f"Bad first chunk: {first!r}"
+    assert second.startswith(" ") and len(second.split()) == 4, f"Bad next chunk: {second!r}"
+
+    # Single-word chunks make every word a chunk boundary; "the" would often follow itself
+    common = WordProvider(mode=MODE_FREQUENCY, rng=random.Random(3)).stream(chunk_words=1, no_repeats=True)
+    streamed = "".join(next(common) for _ in range(5000)).split()
+    assert all(a != b for a, b in zip(streamed, streamed[1:])), "no_repeats should hold across chunks"
+
+    print(f"  ✓ {typed} characters typed through a {len(engine.target_text)}-character stream")
+    return True
+
+
 def main():
     """Run all key binding tests."""
     print("=" * 60)
@@ -173,9 +281,13 @@ def main():
         ("Incorrect Typing", test_incorrect_typing),
         ("Backspace Within Word", test_backspace_within_word),
         ("Backspace at Boundary", test_backspace_at_word_boundary),
+        ("Backspace in Long Word", test_backspace_in_long_word),
+        ("Character Status", test_character_status),
         ("WPM Calculation", test_wpm_calculation),
         ("Accuracy Calculation", test_accuracy_calculation),
         ("Completion Detection", test_completion_detection),
+        ("Keystroke Log", test_keystroke_log),
+        ("Text Stream", test_text_stream),
     ]
     
     results = []
@@ -4,9 +4,12 @@ Test script to verify that metrics are calculated correctly after finish_test()
 This addresses the issue where metrics would return 0 after the test is marked as finished.
 """
 
-import time
 import logging
-from engine import TypingEngine
+from clock import FakeClock, NS_PER_SECOND
+from engine import (TypingEngine, EVENT_CORRECT, EVENT_INCORRECT, EVENT_BACKSPACE,
+                    SPEED_BUCKETS, SPEED_INTERVAL_NS)
+from simulation import TypistModel, simulate_test
+from words import WordProvider
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s %(name)s] %(message)s')
@@ -17,7 +20,8 @@ def test_metrics_after_finish():
     print("Testing metrics calculation after finish_test()...")
     
     # Create engine with a simple test
-    engine = TypingEngine("hello world test", 30)
+    clock = FakeClock()
+    engine = TypingEngine("hello world test", 30, clock=clock)
     
     # Type some characters correctly
     engine.handle_keypress('h')  # Correct
@@ -26,8 +30,8 @@ def test_metrics_after_finish():
     engine.handle_keypress('l')  # Correct
     engine.handle_keypress('o')  # Correct
     
-    # Sleep a tiny bit to ensure some time passes
-    time.sleep(0.1)
+    # Let some time pass
+    clock.advance(0.1)
     
     # Type a space and more characters
     engine.handle_keypress(' ')  # Correct
@@ -83,13 +87,14 @@ def test_get_test_results():
     print("\n\nTesting get_test_results() after finish_test()...")
     
     # Create engine
-    engine = TypingEngine("test text", 30)
+    clock = FakeClock()
+    engine = TypingEngine("test text", 30, clock=clock)
     
     # Type some characters
     for char in "test tex":
         engine.handle_keypress(char)
     
-    time.sleep(0.05)
+    clock.advance(0.05)
     
     # Finish the test
     print("\n  Calling finish_test()...")
@@ -124,13 +129,14 @@ def test_elapsed_time_after_finish():
     print("\n\nTesting elapsed time calculation after finish_test()...")
     
     # Create engine
-    engine = TypingEngine("test", 30)
+    clock = FakeClock()
+    engine = TypingEngine("test", 30, clock=clock)
     
     # Start typing
     engine.handle_keypress('t')
     
-    # Sleep to accumulate some time
-    time.sleep(0.2)
+    # Accumulate some time
+    clock.advance(0.2)
     
     # Get elapsed time before finishing
     elapsed_before = engine.get_elapsed_time()
@@ -143,16 +149,146 @@ def test_elapsed_time_after_finish():
     elapsed_after = engine.get_elapsed_time()
     print(f"  Elapsed time after finish: {elapsed_after:.3f}s")
     
-    # Elapsed time should be approximately the same (within a small margin)
-    # and should not be 0
+    # Time passing after the finish must not change the elapsed time
+    clock.advance(5.0)
+    elapsed_frozen = engine.get_elapsed_time()
+
     assert elapsed_after > 0, f"Elapsed time after finish should be > 0, got {elapsed_after}"
-    assert abs(elapsed_after - elapsed_before) < 0.05, \
-        f"Elapsed time should be similar before and after finish, got {elapsed_before:.3f}s vs {elapsed_after:.3f}s"
+    assert elapsed_after == elapsed_before == 0.2, \
+        f"Elapsed time should be 0.2s before and after finish, got {elapsed_before:.3f}s vs {elapsed_after:.3f}s"
+    assert elapsed_frozen == elapsed_after, \
+        f"Elapsed time should stop at finish, got {elapsed_frozen:.3f}s"
     
     print(f"\n  ✓ Elapsed time calculated correctly after finish_test()")
     return True
 
 
+def test_wpm_history_series():
+    """Test that WPM history series match a brute-force recount."""
+    print("\n\nTesting WPM history series...")
+
+    # Build a 10 second session with known timestamps
+    engine = TypingEngine("hello world test", 30)
+    engine.start_time = 100 * NS_PER_SECOND
+    engine.end_time = 110 * NS_PER_SECOND
+    events = []
+    for i in range(40):
+        code = EVENT_BACKSPACE if i % 9 == 8 else (EVENT_INCORRECT if i % 5 == 4 else EVENT_CORRECT)
+        ts = 100.0 + i * 0.25
+        engine.keystrokes.append(code, "" if code == EVENT_BACKSPACE else "a", round(ts * NS_PER_SECOND))
+        events.append((code, ts))
+
+    def count(t, codes, since=None):
+        return sum(
+            1 for code, ts in events
+            if code in codes and ts - 100.0 <= t and (since is None or ts - 100.0 > since)
+        )
+
+    correct = engine.get_wpm_history(interval=0.5)
+    raw = engine.get_raw_wpm_history(interval=0.5)
+    net = engine.get_net_wpm_history(interval=0.5)
+    rolling = engine.get_rolling_wpm_history(interval=0.5, window=2.0)
+
+    assert len(correct) == len(raw) == len(net) == len(rolling) == 21, \
+        f"Expected 21 samples, got {len(correct)}"
+    for i in range(1, 21):
+        t = i * 0.5
+        minutes = t / 60.0
+        typed = count(t, (EVENT_CORRECT, EVENT_INCORRECT))
+        errors = count(t, (EVENT_INCORRECT,))
+        expected_correct = count(t, (EVENT_CORRECT,)) / 5.0 / minutes
+        expected_net = max(0, (typed / 5.0 - errors) / minutes)
+        window = min(2.0, t)
+        since = t - 2.0 if t > 2.0 else None
+        expected_rolling = count(t, (EVENT_CORRECT,), since) / 5.0 / (window / 60.0)
+
+        assert abs(correct[i] - expected_correct) < 1e-9, f"Correct WPM mismatch at {t}s"
+        assert abs(raw[i] - typed / 5.0 / minutes) < 1e-9, f"Raw WPM mismatch at {t}s"
+        assert abs(net[i] - expected_net) < 1e-9, f"Net WPM mismatch at {t}s"
+        assert abs(rolling[i] - expected_rolling) < 1e-9, f"Rolling WPM mismatch at {t}s"
+
+    print("\n  ✓ WPM history series match brute-force recount")
+    return True
+
+
+def test_simulated_session():
+    """Test that results of a full simulated test agree with its keystroke log."""
+    print("\n\nTesting metrics of a simulated 30s test...")
+
+    text = WordProvider.generate_text(200)
+    engine, clock = simulate_test(text, 30, TypistModel(wpm=70, error_rate=0.05, seed=5))
+    results = engine.get_test_results()
+    codes = bytes(engine.keystrokes.codes)
+
+    print(f"    Results: {results}")
+    assert results["elapsed_time"] == 30, f"Test should end at 30s, got {results['elapsed_time']}"
+    assert results["correct_chars"] == codes.count(EVENT_CORRECT), "Correct chars should match the log"
+    assert results["total_chars_typed"] == len(codes), "Every logged keystroke should be counted"
+    assert codes.count(EVENT_BACKSPACE) > 0, "The typist should have corrected some mistakes"
+
+    final_wpm = engine.get_wpm_history(interval=1.0)[-1]
+    assert abs(final_wpm - engine.calculate_wpm()) < 1e-9, \
+        f"Last WPM history point {final_wpm:.2f} should equal the final WPM"
+
+    clock.advance(10)
+    assert engine.get_test_results() == results, "Results should not change after the test ends"
+
+    print("\n  ✓ Simulated test results match its keystroke log")
+    return True
+
+
+def test_speed_ring():
+    """Test that the live speed ring matches a per-interval recount of the keystroke log."""
+    print("\n\nTesting live speed ring...")
+
+    text = WordProvider.generate_text(200)
+    engine, clock = simulate_test(text, 30, TypistModel(wpm=70, error_rate=0.05, seed=9))
+    samples = engine.get_speed_samples()
+    current = (engine.end_time - engine.start_time) // SPEED_INTERVAL_NS
+    assert current >= SPEED_BUCKETS, "A 30s test should wrap the ring"
+    assert len(samples) == SPEED_BUCKETS - 1, f"Expected {SPEED_BUCKETS - 1} samples, got {len(samples)}"
+
+    counts = {}
+    for code, timestamp in zip(bytes(engine.keystrokes.codes), engine.keystrokes.timestamps.tolist()):
+        if code == EVENT_CORRECT:
+            bucket = (timestamp - engine.start_time) // SPEED_INTERVAL_NS
+            counts[bucket] = counts.get(bucket, 0) + 1
+    minutes = SPEED_INTERVAL_NS / NS_PER_SECOND / 60.0
+    expected = [counts.get(bucket, 0) / 5.0 / minutes
+                for bucket in range(current - SPEED_BUCKETS + 1, current)]
+    assert samples == expected, "Speed samples should match the recount"
+
+    # Pauses longer than the ring clear it
+    clock = FakeClock()
+    engine = TypingEngine("abc def ghi", 60, clock=clock)
+    engine.handle_keypress("a")
+    engine.handle_keypress("b")
+    clock.advance(0.6)
+    assert engine.get_speed_samples() == [2 / 5.0 / minutes], "One interval with two correct keys"
+    clock.advance(25)
+    engine.handle_keypress("c")
+    clock.advance(0.5)
+    samples = engine.get_speed_samples()
+    assert len(samples) == SPEED_BUCKETS - 1 and samples[-1] == 1 / 5.0 / minutes, \
+        f"Newest interval should hold the key typed after the pause: {samples[-3:]}"
+    assert sum(samples[:-1]) == 0, "Keys from before the pause should have left the ring"
+
+    # A reset engine starts with an empty ring
+    engine = TypingEngine("abc def ghi", 60, clock=clock)
+    engine.handle_keypress("a")
+    engine.handle_keypress("b")
+    clock.advance(0.6)
+    engine.handle_keypress("c")
+    engine.reset()
+    engine.handle_keypress("a")
+    clock.advance(1.1)
+    assert engine.get_speed_samples() == [1 / 5.0 / minutes, 0.0], \
+        f"Counts from before reset() should be gone: {engine.get_speed_samples()}"
+
+    print("\n  ✓ Speed ring matches the keystroke log")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -163,6 +299,9 @@ def main():
         ("Metrics After Finish", test_metrics_after_finish),
         ("get_test_results() After Finish", test_get_test_results),
         ("Elapsed Time After Finish", test_elapsed_time_after_finish),
+        ("WPM History Series", test_wpm_history_series),
+        ("Simulated Session", test_simulated_session),
+        ("Live Speed Ring", test_speed_ring),
     ]
     
     results = []
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the background result writer.
+Uses a real database in a temporary directory and a gated store to control timing.
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+from database import DatabaseManager, close_all_pools
+from persistence import ResultWriter
+
+
+def make_result(wpm: float) -> dict:
+    """Build a minimal test result dictionary."""
+    return {"wpm": wpm, "accuracy": 95.0, "duration": 30, "elapsed_time": 30.0}
+
+
+class GatedStore:
+    """Store that records batch sizes and holds the first write until released."""
+
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.gate = threading.Event()
+        self.fail = fail
+
+    def add_results(self, entries):
+        self.gate.wait(5)
+        self.batches.append(len(entries))
+        if self.fail:
+            raise OSError("disk full")
+        return list(range(1, len(entries) + 1))
+
+
+def test_batches_writes():
+    """Test that results queued during a slow write go out in one batch."""
+    print("Testing batched writes...")
+    store = GatedStore()
+    writer = ResultWriter(store)
+    for wpm in range(10):
+        writer.submit(make_result(wpm))
+    assert writer.queue_depth == 10, f"Queue depth should be 10, got {writer.queue_depth}"
+
+    store.gate.set()
+    assert writer.flush(5), "Queue should drain"
+    assert sum(store.batches) == 10, f"All results should be written, got {store.batches}"
+    assert len(store.batches) <= 2, f"Queued results should share a transaction, got {store.batches}"
+    assert writer.queue_depth == 0, "Queue should be empty after flush"
+    assert writer.stats()["written"] == 10, f"Stats should count 10 writes: {writer.stats()}"
+    assert writer.close(5), "Writer thread should stop"
+
+    print(f"  ✓ 10 results written in {len(store.batches)} transaction(s)")
+    return True
+
+
+def test_errors_reported_on_poll():
+    """Test that save errors reach the UI callback only through poll()."""
+    print("\nTesting error reporting...")
+    errors = []
+    store = GatedStore(fail=True)
+    store.gate.set()
+    writer = ResultWriter(store, on_error=errors.append)
+    writer.submit(make_result(50))
+    writer.flush(5)
+
+    assert errors == [], "Errors must not be delivered on the writer thread"
+    assert writer.poll() == 1, "One notification should be pending"
+    assert len(errors) == 1 and "disk full" in str(errors[0]), f"Error should be reported, got {errors}"
+    assert writer.stats()["failed"] == 1, f"Stats should count the failure: {writer.stats()}"
+    writer.close(5)
+
+    print("  ✓ Errors are delivered from poll()")
+    return True
+
+
+def test_close_flushes_to_database():
+    """Test that close() writes everything queued to a real database."""
+    print("\nTesting flush on shutdown...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(str(Path(tmp) / "zentype.db"))
+        writer = ResultWriter(db)
+        added = []
+        writer.add_result_listener(lambda result_id, result: added.append((result_id, result["wpm"])))
+
+        for wpm in (40, 50, 60):
+            writer.submit(make_result(wpm))
+        assert writer.close(5), "Writer thread should stop after draining"
+        writer.poll()
+
+        assert db.get_statistics()["total_tests"] == 3, "All queued results should be saved"
+        assert [wpm for _, wpm in added] == [40, 50, 60], f"Listeners should see each result, got {added}"
+        assert writer.stats()["last_flush_ms"] > 0, "Flush latency should be recorded"
+        try:
+            writer.submit(make_result(70))
+            assert False, "Submitting after close should fail"
+        except RuntimeError:
+            pass
+        close_all_pools()
+
+    print("  ✓ Queued results are written before the writer stops")
+    return True
+
+
+def test_store_opened_on_first_write():
+    """Test that a lazily opened store is created by the first save, not by the writer."""
+    print("\nTesting lazy store opening...")
+    opened = []
+    store = GatedStore()
+    store.gate.set()
+
+    def open_store():
+        opened.append(threading.current_thread().name)
+        return store
+
+    writer = ResultWriter(open_store=open_store)
+    assert not writer.store_opened and opened == [], "Creating the writer should not open the store"
+    writer.submit(make_result(50))
+    writer.submit(make_result(60))
+    assert writer.flush(5), "Queue should drain"
+    assert writer.store_opened and writer.store is store, "The first write should open the store"
+    assert opened == ["ResultWriter"], f"Store should be opened once, on the writer thread: {opened}"
+    writer.close(5)
+    try:
+        ResultWriter()
+        assert False, "A writer without a store should be rejected"
+    except ValueError:
+        pass
+
+    print("  ✓ Store opened once, on first write")
+    return True
+
+
+def main():
+    """Run all persistence tests."""
+    print("=" * 60)
+    print("ZenType Result Writer Test")
+    print("=" * 60)
+
+    tests = [
+        ("Batched Writes", test_batches_writes),
+        ("Errors Reported On Poll", test_errors_reported_on_poll),
+        ("Close Flushes To Database", test_close_flushes_to_database),
+        ("Store Opened On First Write", test_store_opened_on_first_write),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Result writer is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
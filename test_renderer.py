@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the incremental tag renderer used by the typing display.
+Replays typing sessions against a fake Text widget and compares the resulting
+colors with a full re-render.
+"""
+
+import logging
+from engine import TypingEngine
+from renderer import TagRenderer
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s %(name)s] %(message)s')
+
+
+class FakeTextWidget:
+    """Minimal stand-in for tkinter.Text that tracks tags per character."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.cells = [set() for _ in range(length)]
+        self.calls = 0
+
+    def _offset(self, index: str) -> int:
+        if index == "end":
+            return self.length
+        if index == "1.0":
+            return 0
+        return int(index[len("1.0+"):-1])
+
+    def tag_add(self, tag, start, end):
+        self.calls += 1
+        for i in range(self._offset(start), self._offset(end)):
+            self.cells[i].add(tag)
+
+    def tag_remove(self, tag, start, end):
+        self.calls += 1
+        for i in range(self._offset(start), self._offset(end)):
+            self.cells[i].discard(tag)
+
+
+def expected_tags(engine: TypingEngine):
+    """Tags a full re-render would produce for the engine state."""
+    input_text = engine.input_text
+    tags = []
+    for i, target_char in enumerate(engine.target_text):
+        if i >= engine.char_index:
+            tags.append({"unwritten"})
+        else:
+            tags.append({"correct" if input_text[i] == target_char else "error"})
+    return tags
+
+
+def render(renderer: TagRenderer, engine: TypingEngine):
+    """Render the engine state the same way TypingScreen.update_display does."""
+    renderer.render(engine.char_index, engine.get_character_status)
+
+
+def test_initial_render():
+    """Test that a fresh text is tagged unwritten with a single range."""
+    print("Testing initial render...")
+    widget = FakeTextWidget(11)
+    renderer = TagRenderer(widget)
+    renderer.reset(11)
+
+    assert all(cell == {"unwritten"} for cell in widget.cells), "All cells should be unwritten"
+    print("  ✓ Initial render tags every character as unwritten")
+    return True
+
+
+def test_typing_matches_full_render():
+    """Test that incremental updates match a full re-render after every key."""
+    print("\nTesting incremental render while typing...")
+    engine = TypingEngine("hello world again", 30)
+    widget = FakeTextWidget(len(engine.target_text))
+    renderer = TagRenderer(widget)
+    renderer.reset(len(engine.target_text))
+
+    for key in ["h", "x", "l", "l", "o", " ", "w", "q", "BACKSPACE", "BACKSPACE", "o", "r"]:
+        if key == "BACKSPACE":
+            engine.handle_backspace()
+        else:
+            engine.handle_keypress(key)
+        render(renderer, engine)
+        assert widget.cells == expected_tags(engine), f"Render mismatch after '{key}'"
+
+    print("  ✓ Incremental render matches full render")
+    return True
+
+
+def test_constant_calls_per_keystroke():
+    """Test that each keystroke costs the same number of tag calls regardless of length."""
+    print("\nTesting tag calls per keystroke...")
+    for length in (50, 5000):
+        engine = TypingEngine("a" * length, 30)
+        widget = FakeTextWidget(length)
+        renderer = TagRenderer(widget)
+        renderer.reset(length)
+        for _ in range(10):
+            engine.handle_keypress("a")
+            render(renderer, engine)
+
+        widget.calls = 0
+        engine.handle_keypress("b")
+        render(renderer, engine)
+        assert widget.calls == 4, f"Expected 4 tag calls for length {length}, got {widget.calls}"
+
+    print("  ✓ Keystroke render cost is independent of text length")
+    return True
+
+
+def test_streamed_window():
+    """Test rendering while text is appended at the end and trimmed from the start."""
+    print("\nTesting render of a streamed text window...")
+    engine = TypingEngine("", 30, text_stream=iter(["ab cd"] + [" ef gh"] * 500))
+    widget = FakeTextWidget(len(engine.target_text))
+    renderer = TagRenderer(widget)
+    renderer.reset(len(engine.target_text))
+
+    keys = 0
+    while engine.char_index < 2000:
+        target = engine.target_text[engine.char_index]
+        # Mistype every 7th key and correct it
+        if keys % 7 == 3 and target != " ":
+            engine.handle_keypress("x")
+            render(renderer, engine)
+            engine.handle_backspace()
+            render(renderer, engine)
+        engine.handle_keypress(target if keys % 11 else "z")
+        keys += 1
+
+        # What TypingScreen.update_display does: append the new chunk, render, trim old text
+        added = len(engine.target_text) - renderer.text_length
+        if added:
+            widget.cells.extend(set() for _ in range(added))
+            widget.length += added
+            renderer.append(added)
+        render(renderer, engine)
+        removable = engine.current_word_start - renderer.origin - 20
+        if removable > 100:
+            del widget.cells[:removable]
+            widget.length -= removable
+            renderer.trim(removable)
+
+        expected = expected_tags(engine)[renderer.origin:]
+        assert widget.cells == expected, f"Window render mismatch at index {engine.char_index}"
+
+    assert renderer.origin > 1500 and widget.length < 1200, \
+        f"Widget should hold a window, not the whole text (origin {renderer.origin}, length {widget.length})"
+    print(f"  ✓ Window of {widget.length} characters matches a full render at offset {renderer.origin}")
+    return True
+
+
+def main():
+    """Run all renderer tests."""
+    print("=" * 60)
+    print("ZenType Incremental Renderer Test")
+    print("=" * 60)
+
+    tests = [
+        ("Initial Render", test_initial_render),
+        ("Typing Matches Full Render", test_typing_matches_full_render),
+        ("Constant Calls Per Keystroke", test_constant_calls_per_keystroke),
+        ("Streamed Window", test_streamed_window),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Incremental rendering is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the bigram index and adaptive word sampling.
+"""
+
+import random
+from collections import Counter
+from sampling import (AliasTable, AliasWordSampler, BigramIndex, WeightedWordSampler,
+                      bigram_difficulty, word_bigrams, zipf_weights)
+from words import WordProvider, MODE_ADAPTIVE, MODE_FREQUENCY
+
+
+def stats(mean_latency: float, count: int = 20, errors: int = 0) -> dict:
+    """Build a latency statistics row."""
+    return {"count": count, "mean_latency": mean_latency, "m2": 0.0, "errors": errors}
+
+
+def test_bigram_index():
+    """Test that the inverted index agrees with each word's bigrams."""
+    print("Testing bigram index...")
+    words = ["the", "then", "hen", "ox"]
+    index = BigramIndex(words)
+
+    assert word_bigrams("ox") == [" o", "ox", "x "], f"Unexpected bigrams: {word_bigrams('ox')}"
+    he = index.bigram_ids["he"]
+    assert list(index.words_with(he)) == [0, 1, 2], f"'he' should be in the, then, hen"
+    for word_id, word in enumerate(words):
+        names = sorted(bigram for bigram, bigram_id in index.bigram_ids.items()
+                       if bigram_id in index.bigrams_of(word_id))
+        assert names == sorted(set(word_bigrams(word))), f"Bigrams of {word!r} don't match"
+        for bigram_id in index.bigrams_of(word_id):
+            assert word_id in index.words_with(bigram_id), f"Inverted index misses {word!r}"
+
+    print(f"  ✓ {index.bigram_count} bigrams indexed both ways")
+    return True
+
+
+def test_weighted_sampling():
+    """Test that difficult bigrams pull their words into the text and can be reset."""
+    print("\nTesting weighted sampling...")
+    sampler = WeightedWordSampler(BigramIndex(WordProvider.WORDS))
+    rng = random.Random(1)
+
+    def share_with(bigram):
+        sample = sampler.sample(5000, rng)
+        return sum(1 for word in sample if bigram in f" {word} ") / len(sample)
+
+    uniform_share = share_with("ck")
+    touched = sampler.set_bigram_weights({"ck": 3.0, "zz": 1.0})
+    adaptive_share = share_with("ck")
+    print(f"    words with 'ck': {uniform_share:.1%} uniform -> {adaptive_share:.1%} adaptive")
+    assert touched == len(sampler.index.words_with(sampler.index.bigram_ids["ck"])), \
+        "Only words containing 'ck' should be updated ('zz' is not in the list)"
+    assert adaptive_share > uniform_share * 3, "Weak bigram words should be drawn far more often"
+
+    sampler.set_bigram_weights({})
+    assert all(abs(w - 1.0) < 1e-9 for w in sampler.word_weights), "Clearing weights should restore uniform"
+
+    print("  ✓ Difficult bigrams raise their words' share")
+    return True
+
+
+def test_adaptive_provider():
+    """Test difficulty scoring and the adaptive WordProvider mode."""
+    print("\nTesting adaptive WordProvider...")
+    difficulty = bigram_difficulty(
+        {"th": stats(0.10), "he": stats(0.10), "ck": stats(0.30), "ox": stats(0.50, count=2)},
+        {"e": {"count": 80, "errors": 20, "mean_latency": 0.1, "m2": 0.0}},
+    )
+    # 'th' is at the median speed, 'ox' has too few samples
+    assert set(difficulty) == {"ck", "he"}, f"Unexpected difficult bigrams: {difficulty}"
+    assert abs(difficulty["ck"] - 2.0) < 1e-9, f"'ck' is 3x the median, got {difficulty['ck']}"
+    assert abs(difficulty["he"] - 1.0) < 1e-9, f"'he' should score the error rate of 'e', got {difficulty['he']}"
+
+    provider = WordProvider(mode=MODE_ADAPTIVE, rng=random.Random(2))
+    provider.update_weights({"ck": stats(0.5), "th": stats(0.1), "an": stats(0.1)})
+    text = provider.generate(400)
+    assert len(text.split()) == 400, "Should generate the requested number of words"
+    assert text.count("ck") > 20, "Adaptive text should contain the slow bigram often"
+
+    print("  ✓ Adaptive mode generates text from stored statistics")
+    return True
+
+
+def test_alias_table():
+    """Test that alias draws follow the weights, including zero weights."""
+    print("\nTesting alias table...")
+    weights = [5.0, 0.0, 1.0, 3.0, 1.0]
+    table = AliasTable(weights)
+    rng = random.Random(3)
+    draws = 100_000
+    counts = Counter(table.draw(rng) for _ in range(draws))
+
+    assert counts[1] == 0, "A zero-weight slot must never be drawn"
+    for index, weight in enumerate(weights):
+        expected = draws * weight / sum(weights)
+        assert abs(counts[index] - expected) < 0.03 * draws, \
+            f"Slot {index}: expected ~{expected:.0f} draws, got {counts[index]}"
+
+    for bad in ([], [0.0, 0.0], [1.0, -1.0]):
+        try:
+            AliasTable(bad)
+            assert False, f"Weights {bad} should be rejected"
+        except ValueError:
+            pass
+
+    print(f"  ✓ {draws:,} draws match the weights")
+    return True
+
+
+def test_filtered_sampling():
+    """Test word filters and immediate-repeat avoidance without rejection loops."""
+    print("\nTesting filtered frequency sampling...")
+    words = ["the", "of", "quiz", "jazz", "extraordinary", "zip"]
+    sampler = AliasWordSampler(words, [1000.0, 500.0, 1.0, 1.0, 50.0, 1.0])
+    rng = random.Random(4)
+
+    short = sampler.sample(500, rng, max_length=4)
+    assert "extraordinary" not in short, "max_length should exclude long words"
+    rare = sampler.sample(500, rng, required_chars="qz")
+    assert set(rare) == {"quiz", "jazz", "zip"}, f"Only words with q or z expected, got {set(rare)}"
+    assert len(sampler.cached_filters()) == 2, "Each filter should build one cached table"
+    sampler.sample(10, rng, required_chars="zq")
+    assert len(sampler.cached_filters()) == 2, "Equivalent filters should share a table"
+
+    # 'the' carries ~64% of the weight, so repeats are common unless suppressed
+    text = sampler.sample(5000, rng, no_repeats=True)
+    assert all(a != b for a, b in zip(text, text[1:])), "no_repeats produced an immediate repeat"
+    counts = Counter(text)
+    assert counts["the"] > counts["of"] > counts["extraordinary"], f"Frequency order lost: {counts}"
+    assert sampler.sample(3, rng, max_length=2, no_repeats=True) == ["of"] * 3, \
+        "A single matching word has to repeat"
+
+    try:
+        sampler.sample(1, rng, max_length=1)
+        assert False, "A filter matching no words should raise ValueError"
+    except ValueError:
+        pass
+
+    # Words listed twice share one entry, so they can't follow themselves either
+    sampler = AliasWordSampler(["have", "do", "have", "go", "do"], [5.0, 1.0, 3.0, 1.0, 1.0])
+    text = sampler.sample(5000, rng, no_repeats=True)
+    assert all(a != b for a, b in zip(text, text[1:])), "A duplicated word was repeated"
+    counts = Counter(sampler.sample(20_000, rng))
+    assert abs(counts["have"] / 20_000 - 8 / 11) < 0.02, f"Duplicate weights should add up: {counts}"
+
+    provider = WordProvider(mode=MODE_FREQUENCY, rng=random.Random(5))
+    text = provider.generate(20_000, no_repeats=True).split()
+    assert all(a != b for a, b in zip(text, text[1:])), "WORDS duplicates were repeated"
+    counts = Counter(provider.generate(20_000).split())
+    assert counts["the"] > 10 * counts.get(WordProvider.WORDS[-1], 0), "Common words should dominate"
+    assert list(zipf_weights(3)) == [1.0, 0.5, 1.0 / 3], "Zipf weights should be 1/rank"
+
+    print("  ✓ Filters, table cache and no-repeat draws work")
+    return True
+
+
+def main():
+    """Run all sampling tests."""
+    print("=" * 60)
+    print("ZenType Sampling Test")
+    print("=" * 60)
+
+    tests = [
+        ("Bigram Index", test_bigram_index),
+        ("Weighted Sampling", test_weighted_sampling),
+        ("Adaptive Provider", test_adaptive_provider),
+        ("Alias Table", test_alias_table),
+        ("Filtered Sampling", test_filtered_sampling),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Sampling is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the named after() job scheduler used by the typing screen.
+Uses a fake widget with a manually advanced clock instead of a Tk event loop.
+"""
+
+from scheduler import AfterScheduler
+
+
+class FakeAfterWidget:
+    """Stand-in for a Tk widget's after()/after_cancel() with a manual clock."""
+
+    def __init__(self):
+        self.now = 0
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, delay_ms, func, *args):
+        self.next_id += 1
+        job_id = f"after#{self.next_id}"
+        self.pending[job_id] = (self.now + delay_ms, func, args)
+        return job_id
+
+    def after_cancel(self, job_id):
+        self.pending.pop(job_id, None)
+
+    def advance(self, ms):
+        """Advance the clock, running each job at its due time."""
+        target = self.now + ms
+        while True:
+            due = [(when, job_id) for job_id, (when, _, _) in self.pending.items() if when <= target]
+            if not due:
+                self.now = target
+                return
+            self.now, job_id = min(due)
+            _, func, args = self.pending.pop(job_id)
+            func(*args)
+
+
+def test_schedule_replaces_pending_job():
+    """Test that scheduling a name twice leaves a single pending job."""
+    print("Testing named job replacement...")
+    widget = FakeAfterWidget()
+    scheduler = AfterScheduler(widget)
+    calls = []
+
+    scheduler.schedule("stats", 500, lambda: calls.append("first"))
+    scheduler.schedule("stats", 500, lambda: calls.append("second"))
+    assert len(widget.pending) == 1, f"Should have 1 pending job, got {len(widget.pending)}"
+
+    widget.advance(500)
+    assert calls == ["second"], f"Only the latest job should run, got {calls}"
+    assert not scheduler.is_scheduled("stats"), "Job should be forgotten after running"
+
+    print("  ✓ Scheduling a name replaces its pending job")
+    return True
+
+
+def test_schedule_once_coalesces():
+    """Test that schedule_once keeps the first pending job."""
+    print("\nTesting coalesced scheduling...")
+    widget = FakeAfterWidget()
+    scheduler = AfterScheduler(widget)
+    calls = []
+
+    for _ in range(10):
+        scheduler.schedule_once("push", 50, lambda: calls.append("push"))
+    widget.advance(50)
+    assert calls == ["push"], f"Burst should coalesce into one call, got {calls}"
+
+    print("  ✓ Bursts coalesce into a single callback")
+    return True
+
+
+def test_cancel_all():
+    """Test that cancel_all stops every pending job, as a test reset does."""
+    print("\nTesting cancel_all...")
+    widget = FakeAfterWidget()
+    scheduler = AfterScheduler(widget)
+    calls = []
+
+    def tick():
+        calls.append("tick")
+        scheduler.schedule("tick", 500, tick)
+
+    scheduler.schedule("tick", 500, tick)
+    scheduler.schedule("end_of_test", 30000, lambda: calls.append("end"))
+    widget.advance(1000)
+    assert calls == ["tick", "tick"], f"Tick should reschedule itself, got {calls}"
+
+    scheduler.cancel_all()
+    widget.advance(60000)
+    assert calls == ["tick", "tick"], f"No job should run after cancel_all, got {calls}"
+    assert not widget.pending, "No after() jobs should remain"
+
+    print("  ✓ cancel_all stops every job")
+    return True
+
+
+def main():
+    """Run all scheduler tests."""
+    print("=" * 60)
+    print("ZenType Scheduler Test")
+    print("=" * 60)
+
+    tests = [
+        ("Schedule Replaces Pending Job", test_schedule_replaces_pending_job),
+        ("Schedule Once Coalesces", test_schedule_once_coalesces),
+        ("Cancel All", test_cancel_all),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Scheduler is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
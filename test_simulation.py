@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the headless typist model and simulation driver.
+"""
+
+from engine import TypingEngine, EVENT_BACKSPACE, STATUS_CORRECT
+from clock import FakeClock
+from simulation import BACKSPACE, TypistModel, feed_keys, run_script, simulate_test
+from words import WordProvider
+
+
+def test_deterministic_scripts():
+    """Test that a seeded model produces the same script every time."""
+    print("Testing seeded scripts...")
+    text = WordProvider.generate_text(50)
+    first = list(TypistModel(seed=3).keystrokes(text))
+    second = list(TypistModel(seed=3).keystrokes(text))
+    assert first == second, "Same seed should give the same script"
+    assert list(TypistModel(seed=4).keystrokes(text)) != first, "Different seeds should differ"
+
+    print("  ✓ Seeded scripts are reproducible")
+    return True
+
+
+def test_speed_matches_model():
+    """Test that an error-free typist scores close to the modelled WPM."""
+    print("\nTesting typing speed...")
+    text = WordProvider.generate_text(300)
+    for wpm in (40, 80, 120):
+        engine, _ = simulate_test(text, 30, TypistModel(wpm=wpm, error_rate=0.0, seed=wpm))
+        measured = engine.calculate_wpm()
+        print(f"    model {wpm} WPM -> measured {measured:.1f} WPM")
+        assert abs(measured - wpm) / wpm < 0.1, f"Measured {measured:.1f} WPM for a {wpm} WPM model"
+        assert engine.get_elapsed_time() == 30, f"Test should end at 30s, got {engine.get_elapsed_time()}"
+
+    print("  ✓ Measured WPM follows the model")
+    return True
+
+
+def test_corrections():
+    """Test that a typist who corrects every mistake finishes with no errors left."""
+    print("\nTesting error correction...")
+    text = WordProvider.generate_text(40)
+    model = TypistModel(wpm=70, error_rate=0.2, correction_rate=1.0, max_notice_delay=3, seed=11)
+    clock = FakeClock()
+    engine = TypingEngine(text, 600, clock=clock)
+    script = list(model.keystrokes(text))
+    fed = run_script(engine, clock, script)
+
+    backspaces = sum(1 for _, key in script[:fed] if key == BACKSPACE)
+    logged = sum(1 for code in engine.keystrokes.codes if code == EVENT_BACKSPACE)
+    assert backspaces > 0, "A 20% error rate should produce backspaces"
+    assert logged == backspaces, f"Every backspace should stay within its word ({logged}/{backspaces})"
+    assert engine.char_index == len(text), "Text should be typed to the end"
+    # Reaching the last character ends the test, so mistakes in the last word may stand
+    last_word_start = text.rfind(" ") + 1
+    assert all(status == STATUS_CORRECT for status in engine.char_status[:last_word_start]), \
+        "Every mistake should have been corrected"
+    assert engine.calculate_accuracy() < 100, "Corrected mistakes still count against accuracy"
+
+    # Fixed sequences are available to the ad-hoc scripts as well
+    engine = TypingEngine("hello", 30, clock=clock)
+    feed_keys(engine, clock, "hx" + BACKSPACE + "ello")
+    assert engine.input_text == "hello", f"Expected 'hello', got {engine.input_text!r}"
+
+    print(f"  ✓ {backspaces} backspaces, all mistakes corrected")
+    return True
+
+
+def main():
+    """Run all simulation tests."""
+    print("=" * 60)
+    print("ZenType Simulation Test")
+    print("=" * 60)
+
+    tests = [
+        ("Deterministic Scripts", test_deterministic_scripts),
+        ("Speed Matches Model", test_speed_matches_model),
+        ("Corrections", test_corrections),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Simulation is working correctly.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script to verify startup timing and that startup doesn't load the database.
+The import check runs in a fresh interpreter, since this process has imported everything.
+"""
+
+import ast
+import io
+import subprocess
+import sys
+from pathlib import Path
+from clock import FakeClock
+from startup import StartupTimer
+
+ROOT = Path(__file__).resolve().parent
+
+# Modules that must only be imported after startup
+DEFERRED_MODULES = ("database", "history", "analytics", "sqlite3", "numpy")
+
+
+def test_startup_timer():
+    """Test phase lines, repeated marks and the budget check."""
+    print("Testing startup timer...")
+    clock = FakeClock()
+    output = io.StringIO()
+    timer = StartupTimer(enabled=True, clock=clock, origin_ns=0, stream=output)
+
+    clock.advance(0.040)
+    timer.mark("imports")
+    clock.advance(0.100)
+    timer.mark("typing screen")
+    clock.advance(0.020)
+    timer.mark("imports")
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "startup time: self [us] | cumulative | phase", f"Header expected: {lines}"
+    assert lines[1].split("|") == ["startup time:     40000 ", "      40000 ", " imports"], lines[1]
+    assert lines[2].split("|") == ["startup time:    100000 ", "     140000 ", " typing screen"], lines[2]
+    assert len(lines) == 3, "A repeated phase should be recorded once"
+    assert timer.elapsed_ms("typing screen") == 140.0, "Elapsed time is measured from the origin"
+
+    assert timer.check_budget("typing screen") is True, "140 ms is within the default budget"
+    assert timer.check_budget("typing screen", budget_ms=100) is False, "140 ms is over a 100 ms budget"
+    assert "OVER 100 ms budget" in output.getvalue(), "Going over budget should be reported"
+    assert timer.check_budget("first frame") is None, "Unrecorded phases have no verdict"
+
+    disabled = StartupTimer(clock=clock, stream=output)
+    disabled.mark("imports")
+    assert disabled.marks == [], "A disabled timer should record nothing"
+
+    print("  ✓ Phases are timed and checked against the budget")
+    return True
+
+
+def test_deferred_imports():
+    """Test that the modules main.py imports at startup don't pull in the database."""
+    print("\nTesting deferred imports...")
+    tree = ast.parse((ROOT / "main.py").read_text(encoding="utf-8"))
+    eager = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            eager.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            eager.append(node.module)
+    assert not set(eager) & set(DEFERRED_MODULES), f"main.py imports {eager} at startup"
+
+    # customtkinter and tkinter aren't needed to check the project's own modules
+    local = [name for name in eager if (ROOT / f"{name}.py").exists()]
+    code = (f"import sys\nfor name in {local!r}: __import__(name)\n"
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    assert loaded == "", f"Startup imports loaded {loaded}"
+
+    print(f"  ✓ {', '.join(local)} load without {', '.join(DEFERRED_MODULES)}")
+    return True
+
+
+def main():
+    """Run all startup tests."""
+    print("=" * 60)
+    print("ZenType Startup Test")
+    print("=" * 60)
+
+    tests = [
+        ("Startup Timer", test_startup_timer),
+        ("Deferred Imports", test_deferred_imports),
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except AssertionError as e:
+            print(f"  ✗ Test failed: {e}")
+            results.append((name, False))
+        except Exception as e:
+            print(f"  ✗ Unexpected error: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results:")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("=" * 60)
+
+    if all_passed:
+        print("All tests passed! Startup is staying lean.")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,16 @@ Handles word list management and random text generation for typing tests.
 """
 
 import random
+from typing import Dict, Iterator, Optional, Sequence
+from sampling import AliasWordSampler, BigramIndex, WeightedWordSampler, bigram_difficulty, zipf_weights
+
+# Word selection modes
+MODE_UNIFORM = "uniform"
+MODE_FREQUENCY = "frequency"
+MODE_ADAPTIVE = "adaptive"
+
+# Words generated per chunk of a text stream
+STREAM_CHUNK_WORDS = 25
 
 
 class WordProvider:
@@ -104,6 +114,119 @@ class WordProvider:
         "property", "instead", "improve", "stuff", "claim",
     ]
 
+    def __init__(self, words: Optional[Sequence[str]] = None, mode: str = MODE_UNIFORM,
+                 rng: Optional[random.Random] = None, frequencies: Optional[Sequence[float]] = None):
+        """
+        Initialize provider for a word list.
+
+        Args:
+            words: Word list (default: WORDS)
+            mode: MODE_UNIFORM, MODE_FREQUENCY or MODE_ADAPTIVE
+            rng: Random generator (default: the random module)
+            frequencies: Weight per word for MODE_FREQUENCY (default: the corpus's
+                frequency counts, or Zipf weights by position in the list)
+        """
+        self.words = words if words is not None else WordProvider.WORDS
+        self.mode = mode
+        self.rng = rng or random
+        self.frequencies = frequencies
+        self._adaptive_sampler: Optional[WeightedWordSampler] = None
+        self._frequency_sampler: Optional[AliasWordSampler] = None
+        self._uniform_sampler: Optional[AliasWordSampler] = None
+
+    @property
+    def adaptive_sampler(self) -> WeightedWordSampler:
+        """Bigram-weighted sampler, built on first use."""
+        if self._adaptive_sampler is None:
+            self._adaptive_sampler = WeightedWordSampler(BigramIndex(self.words))
+        return self._adaptive_sampler
+
+    @property
+    def frequency_sampler(self) -> AliasWordSampler:
+        """Frequency-weighted sampler, built on first use."""
+        if self._frequency_sampler is None:
+            weights = self.frequencies
+            if weights is None:
+                weights = getattr(self.words, "frequencies", None)
+            if weights is None:
+                # WORDS and plain word lists are ordered from most to least common
+                weights = zipf_weights(len(self.words))
+            self._frequency_sampler = AliasWordSampler(self.words, weights)
+        return self._frequency_sampler
+
+    @property
+    def uniform_sampler(self) -> AliasWordSampler:
+        """Equal-weight sampler for filtered uniform text, built on first use."""
+        if self._uniform_sampler is None:
+            self._uniform_sampler = AliasWordSampler(self.words)
+        return self._uniform_sampler
+
+    def update_weights(self, bigram_stats: Dict[str, Dict], key_stats: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Refresh adaptive weights from stored latency statistics (call after each test).
+
+        Args:
+            bigram_stats: Mapping of bigram to {"count", "mean_latency", ...}
+            key_stats: Mapping of key to {"count", "errors", ...}
+        """
+        self.adaptive_sampler.set_bigram_weights(bigram_difficulty(bigram_stats, key_stats))
+
+    def generate(self, word_count: int, max_length: Optional[int] = None,
+                 required_chars: Optional[str] = None, no_repeats: bool = False,
+                 previous: Optional[str] = None) -> str:
+        """
+        Generate text in the provider's mode.
+
+        Args:
+            word_count: Number of words to generate
+            max_length: Only use words with at most this many characters
+            required_chars: Only use words containing at least one of these characters
+            no_repeats: Never repeat a word immediately
+            previous: Word typed just before this text, which with no_repeats the
+                first word won't repeat
+
+        Returns:
+            String of space-separated words
+        """
+        filtered = max_length is not None or bool(required_chars) or no_repeats
+        if self.mode == MODE_ADAPTIVE:
+            if filtered:
+                raise ValueError("Word filters are not supported in adaptive mode")
+            selected_words = self.adaptive_sampler.sample(word_count, self.rng)
+        elif self.mode == MODE_FREQUENCY:
+            selected_words = self.frequency_sampler.sample(
+                word_count, self.rng, max_length, required_chars, no_repeats, previous
+            )
+        elif filtered:
+            selected_words = self.uniform_sampler.sample(
+                word_count, self.rng, max_length, required_chars, no_repeats, previous
+            )
+        else:
+            selected_words = self.rng.choices(self.words, k=word_count)
+        return " ".join(selected_words)
+
+    def stream(self, chunk_words: int = STREAM_CHUNK_WORDS, **filters) -> Iterator[str]:
+        """
+        Generate endless text in chunks, for a TypingEngine text_stream.
+        Every chunk after the first starts with the space separating it from the previous one.
+        Each chunk continues from the last word of the one before, so no_repeats holds
+        across chunk boundaries.
+
+        Args:
+            chunk_words: Words per chunk
+            **filters: max_length, required_chars and no_repeats, as for generate()
+
+        Yields:
+            Text chunks
+        """
+        separator = ""
+        previous = None
+        while True:
+            text = self.generate(chunk_words, previous=previous, **filters)
+            yield separator + text
+            separator = " "
+            previous = text.rsplit(" ", 1)[-1]
+
     @staticmethod
     def generate_text(word_count: int) -> str:
         """